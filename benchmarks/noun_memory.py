@@ -0,0 +1,44 @@
+"""
+Memory used per Noun when loading a large countable noun list.
+
+usage: python benchmarks/noun_memory.py [number_of_nouns]
+"""
+import gc
+import os
+import sys
+import tempfile
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sentences.backend.loader import countable_nouns  # noqa: E402
+
+DEFAULT_SIZE = 1000000
+
+
+def write_noun_csv(filename, size):
+    with open(filename, 'w') as f:
+        for number in range(size):
+            f.write('noun{}\n'.format(number))
+
+
+def measure_bytes_per_noun(filename):
+    gc.collect()
+    tracemalloc.start()
+    nouns = countable_nouns(filename)
+    gc.collect()
+    used, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return used / len(nouns), nouns
+
+
+def main(size=DEFAULT_SIZE):
+    with tempfile.TemporaryDirectory() as directory:
+        filename = os.path.join(directory, 'nouns.csv')
+        write_noun_csv(filename, size)
+        bytes_per_noun, nouns = measure_bytes_per_noun(filename)
+    print('{} nouns: {:.1f} bytes per noun'.format(len(nouns), bytes_per_noun))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
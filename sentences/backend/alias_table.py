@@ -0,0 +1,74 @@
+from sentences.backend.random_streams import get_rng
+
+
+class AliasTable(object):
+    """
+    Walker's alias method, built with Vose's algorithm. Building is O(n); each draw uses one random number
+    and is O(1), the same cost as random.choice.
+    """
+    __slots__ = ('_probabilities', '_aliases', '_size')
+
+    def __init__(self, weights):
+        """:param weights: non-negative numbers, at least one of which is positive"""
+        weights = [float(weight) for weight in weights]
+        size = len(weights)
+        total = sum(weights)
+        if not size or total <= 0 or any(weight < 0 for weight in weights):
+            raise ValueError('weights must be non-negative and have a positive total')
+
+        scaled = [weight * size / total for weight in weights]
+        probabilities = [1.0] * size
+        aliases = list(range(size))
+        small = [index for index, value in enumerate(scaled) if value < 1.0]
+        large = [index for index, value in enumerate(scaled) if value >= 1.0]
+        while small and large:
+            less = small.pop()
+            more = large.pop()
+            probabilities[less] = scaled[less]
+            aliases[less] = more
+            scaled[more] -= 1.0 - scaled[less]
+            if scaled[more] < 1.0:
+                small.append(more)
+            else:
+                large.append(more)
+
+        self._probabilities = probabilities
+        self._aliases = aliases
+        self._size = size
+
+    def __len__(self):
+        return self._size
+
+    def index(self, rng=None) -> int:
+        """:param rng: see random_streams.get_rng"""
+        return self.index_from(get_rng(rng).random())
+
+    def index_from(self, uniform) -> int:
+        """:param uniform: a float in [0, 1), so draws can come from a batch of random numbers"""
+        position = uniform * self._size
+        index = int(position)
+        if position - index < self._probabilities[index]:
+            return index
+        return self._aliases[index]
+
+    def probabilities(self) -> list:
+        """The chance of drawing each index, worked out from the table, so it is the same as the normalised weights"""
+        size = self._size
+        probabilities = [probability / size for probability in self._probabilities]
+        for index, alias in enumerate(self._aliases):
+            probabilities[alias] += (1.0 - self._probabilities[index]) / size
+        return probabilities
+
+    def choice(self, sequence, rng=None):
+        """:param sequence: the same length as the weights"""
+        return sequence[self.index(rng)]
+
+
+def alias_table_or_none(weights):
+    """None if every weight is the same, so uniform random.choice can be used instead."""
+    if weights is None or isinstance(weights, AliasTable):
+        return weights
+    weights = list(weights)
+    if len(set(weights)) <= 1:
+        return None
+    return AliasTable(weights)
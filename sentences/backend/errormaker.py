@@ -1,17 +1,19 @@
-import random
-
 from sentences.backend.grammarizer import normalize_probability
-from sentences.backend.investigation_tools import requires_third_person, get_present_be_verb, find_subject
+from sentences.backend.investigation_tools import present_be_verb, find_subject
+from sentences.backend.random_streams import get_rng
+from sentences.backend.tokens import as_tokens, NOUN, VERB, PRONOUN
 
+from sentences.words.wordtools.tags import tags_to_mask
 from sentences.words.wordtools.wordtag import WordTag
 from sentences.words.wordtools.common_functions import add_s
 
-from sentences.words.noun import Noun
 from sentences.words.punctuation import Punctuation
 from sentences.words.verb import Verb
 from sentences.words.basicword import BasicWord
 
-from sentences.words.pronoun import AbstractPronoun, Pronoun, CapitalPronoun
+from sentences.words.pronoun import Pronoun, CapitalPronoun
+
+_PREPOSITION = tags_to_mask([WordTag.PREPOSITION])
 
 
 def copy_paragraph(lst_of_lst):
@@ -19,25 +21,37 @@ def copy_paragraph(lst_of_lst):
 
 
 class ErrorMaker(object):
-    def __init__(self, paragraph, p_error):
+    def __init__(self, paragraph, p_error, rng=None):
+        """
+        :param paragraph: a list of sentences or a TokenParagraph
+        :param rng: decides where errors go and which errors they are. see random_streams.get_rng
+        """
         self.p_error = normalize_probability(p_error)
-        self._paragraph = copy_paragraph(paragraph)
-        self._error_paragraph = copy_paragraph(paragraph)
-        self._answer = copy_paragraph(paragraph)
+        self._rng = get_rng(rng)
+        self._paragraph = as_tokens(paragraph)
+        self._error_paragraph = self._paragraph.copy()
+        self._answer = self._paragraph.copy()
         self._error_count = 0
 
     @property
     def paragraph(self):
-        return copy_paragraph(self._paragraph)
+        return self._paragraph.to_paragraph()
 
     @property
     def error_paragraph(self):
-        return copy_paragraph(self._error_paragraph)
+        return self._error_paragraph.to_paragraph()
 
     @property
     def answer_paragraph(self):
-        answer = copy_paragraph(self._answer)
-        return answer
+        return self._answer.to_paragraph()
+
+    @property
+    def error_tokens(self):
+        return self._error_paragraph.copy()
+
+    @property
+    def answer_tokens(self):
+        return self._answer.copy()
 
     @property
     def error_count(self):
@@ -52,68 +66,87 @@ class ErrorMaker(object):
         return methods
 
     def reset(self):
-        self._error_paragraph = self.paragraph
+        self._error_paragraph = self._paragraph.copy()
         self._error_count = 0
 
+    def _bold_answer(self, position):
+        self._answer.set_word(position, self._answer.word(position).bold())
+
     def create_noun_errors(self):
-        for s_index, sentence in enumerate(self._error_paragraph):
-            for index, word in enumerate(sentence):
-                if isinstance(word, Noun):
-                    if random.random() < self.p_error:
+        errors = self._error_paragraph
+        offsets = errors.offsets
+        for s_index in range(len(errors)):
+            start = offsets[s_index]
+            for index in range(start, offsets[s_index + 1]):
+                if errors.kinds[index] == NOUN:
+                    if self._rng.random() < self.p_error:
                         self._error_count += 1
 
-                        new_noun = make_noun_error(word)
-                        if index == 0:
+                        new_noun = make_noun_error(errors.word(index), self._rng)
+                        if index == start:
                             new_noun = new_noun.capitalize()
-                        sentence[index] = new_noun
-                        self._answer[s_index][index] = self._answer[s_index][index].bold()
+                        errors.set_word(index, new_noun)
+                        self._bold_answer(index)
 
     def create_pronoun_errors(self):
         excluded = [Pronoun.YOU, Pronoun.IT, CapitalPronoun.YOU, CapitalPronoun.IT]
-        for s_index, sentence in enumerate(self._error_paragraph):
-            for index, word in enumerate(sentence):
-                if isinstance(word, AbstractPronoun) and word not in excluded:
-                    if random.random() < self.p_error:
-                        self._error_count += 1
-                        new_pronoun = word.object()
-                        if new_pronoun == word:
-                            new_pronoun = word.subject()
-                        sentence[index] = new_pronoun
-                        self._answer[s_index][index] = self._answer[s_index][index].bold()
+        errors = self._error_paragraph
+        for index, kind in enumerate(errors.kinds):
+            if kind == PRONOUN:
+                word = errors.word(index)
+                if word not in excluded and self._rng.random() < self.p_error:
+                    self._error_count += 1
+                    new_pronoun = word.object()
+                    if new_pronoun == word:
+                        new_pronoun = word.subject()
+                    errors.set_word(index, new_pronoun)
+                    self._bold_answer(index)
 
     def create_verb_errors(self):
-        for s_index, sentence in enumerate(self._error_paragraph):
-            for index, word in enumerate(sentence):
-                if isinstance(word, Verb):
-                    if random.random() < self.p_error:
+        errors = self._error_paragraph
+        offsets = errors.offsets
+        for s_index in range(len(errors)):
+            for index in range(offsets[s_index], offsets[s_index + 1]):
+                if errors.kinds[index] == VERB:
+                    if self._rng.random() < self.p_error:
                         self._error_count += 1
 
-                        is_third_person_noun = requires_third_person(sentence)
-                        new_verb = make_verb_error(word, is_third_person_noun)
-                        sentence[index] = new_verb
-                        self._answer[s_index][index] = self._answer[s_index][index].bold()
+                        is_third_person_noun = errors.requires_third_person(s_index)
+                        new_verb = make_verb_error(errors.word(index), is_third_person_noun, self._rng)
+                        errors.set_word(index, new_verb)
+                        self._bold_answer(index)
 
     def create_is_do_errors(self):
-        for s_index, sentence in enumerate(self._error_paragraph):
-            for index, word in enumerate(sentence):
-                if isinstance(word, Verb):
-                    if random.random() < self.p_error:
-                        if not self.already_has_error(s_index, index):
+        errors = self._error_paragraph
+        offsets = errors.offsets
+        for s_index in range(len(errors)):
+            start = offsets[s_index]
+            for index in range(start, offsets[s_index + 1]):
+                if errors.kinds[index] == VERB:
+                    if self._rng.random() < self.p_error:
+                        if not self.already_has_error(s_index, index - start):
                             self._error_count += 1
 
-                        be_verb = get_present_be_verb(sentence)
-                        is_do = make_is_do_error(word, be_verb)
-                        sentence[index] = is_do
-                        self._answer[s_index][index] = self._answer[s_index][index].bold()
+                        be_verb = _present_be_verb(errors, s_index)
+                        is_do = make_is_do_error(errors.word(index), be_verb)
+                        errors.set_word(index, is_do)
+                        self._bold_answer(index)
 
     def already_has_error(self, sentence_index, word_index):
-        return self._answer[sentence_index][word_index].value.startswith('<bold>')
+        position = self._answer.offsets[sentence_index] + word_index
+        return self._answer.word(position).value.startswith('<bold>')
 
     def create_preposition_transpose_errors(self):
-        for s_index, sentence in enumerate(self._error_paragraph):
+        errors = self._error_paragraph
+        for s_index in range(len(errors)):
+            start, end = errors.span(s_index)
+            if not any(tags & _PREPOSITION for tags in errors.tags[start:end]):
+                continue
+
+            sentence = errors.sentence(s_index)
             for index, word in enumerate(sentence):
                 if word.has_tags(WordTag.PREPOSITION):
-                    if random.random() < self.p_error:
+                    if self._rng.random() < self.p_error:
                         self._error_count += 1
 
                         obj_index = index + 1
@@ -125,65 +158,78 @@ class ErrorMaker(object):
                         sentence.insert(insert_index, obj)
                         sentence.insert(insert_index, word)
 
-                        self._answer[s_index][index] = self._answer[s_index][index].bold()
-                        self._answer[s_index][obj_index] = self._answer[s_index][obj_index].bold()
+                        self._bold_answer(start + index)
+                        self._bold_answer(start + obj_index)
+            errors.set_sentence(s_index, sentence)
 
     def create_period_errors(self):
-        for s_index, sentence in enumerate(self._error_paragraph):
-            if random.random() < self.p_error:
+        errors = self._error_paragraph
+        for s_index in range(len(errors)):
+            if self._rng.random() < self.p_error:
                 self._error_count += 1
 
-                sentence[-1] = Punctuation.COMMA
-                self._answer[s_index][-1] = self._answer[s_index][-1].bold()
+                last = errors.offsets[s_index + 1] - 1
+                errors.set_word(last, Punctuation.COMMA)
+                self._bold_answer(last)
         self._decapitalize_at_commas()
 
     def _decapitalize_at_commas(self):
-        last_index = len(self._error_paragraph) - 1
-        for s_index, sentence in enumerate(self._error_paragraph):
-            if sentence[-1] == Punctuation.COMMA and s_index < last_index:
-                target_sentence_index = s_index + 1
-                target_sentence = self._error_paragraph[target_sentence_index]
-                to_de_capitalize = target_sentence[0]
+        errors = self._error_paragraph
+        offsets = errors.offsets
+        comma_id = errors.vocabulary.id(Punctuation.COMMA)
+        last_index = len(errors) - 1
+        for s_index in range(last_index):
+            if errors.ids[offsets[s_index + 1] - 1] == comma_id:
+                target = offsets[s_index + 1]
+                to_de_capitalize = errors.word(target)
                 new_word = to_de_capitalize.de_capitalize()
-                target_sentence[0] = new_word
+                errors.set_word(target, new_word)
                 if to_de_capitalize != new_word:
-                    self._answer[target_sentence_index][0] = self._answer[target_sentence_index][0].bold()
+                    self._bold_answer(target)
 
     def create_all_errors(self):
         for method in self.method_order:
             method()
 
 
-def make_noun_error(noun):
-    basic = noun.to_basic_noun()
+def _present_be_verb(tokens, sentence_index):
+    subject_position = tokens.subject_position(sentence_index)
+    return present_be_verb(None if subject_position == -1 else tokens.word(subject_position))
+
+
+def make_noun_error(noun, rng=None):
+    forms = noun.paradigm()
+    basic = forms['basic']
     if noun.has_tags(WordTag.PROPER):
-        choices = [basic.indefinite(), basic.definite()]
+        choices = [forms['indefinite'], forms['definite']]
     elif noun.has_tags(WordTag.UNCOUNTABLE):
-        choices = [basic.indefinite(), basic.plural()]
+        choices = [forms['indefinite'], forms['plural']]
     elif noun.has_tags(WordTag.INDEFINITE):
-        choices = [basic] * 3 + [basic.plural().indefinite(), basic.plural()]
+        choices = [basic] * 3 + [forms['plural_indefinite'], forms['plural']]
     elif noun.has_tags(WordTag.PLURAL):
-        choices = [basic] * 3 + [basic.indefinite(), basic.definite(), basic.plural().indefinite()]
+        choices = [basic] * 3 + [forms['indefinite'], forms['definite'], forms['plural_indefinite']]
     else:
-        choices = [basic] * 3 + [basic.indefinite(), basic.plural(), basic.plural().indefinite()]
+        choices = [basic] * 3 + [forms['indefinite'], forms['plural'], forms['plural_indefinite']]
 
-    return random.choice(choices)
+    return get_rng(rng).choice(choices)
 
 
-def make_verb_error(verb, is_third_person_noun):
-    basic = verb.to_basic_verb()
+def make_verb_error(verb, is_third_person_noun, rng=None):
+    forms = verb.paradigm()
     if verb.has_tags(WordTag.NEGATIVE):
-        basic = basic.negative()
+        basic, third_person, past = forms['negative'], forms['negative_third_person'], forms['negative_past']
+    else:
+        basic, third_person, past = forms['basic'], forms['third_person'], forms['past']
 
     if verb.has_tags(WordTag.PAST):
-        choices = [basic, basic.third_person()]
+        choices = [basic, third_person]
     elif is_third_person_noun:
-        choices = [basic] * 3 + [basic.past_tense(), _add_s_to_verb(basic.past_tense())]
+        choices = [basic] * 3 + [past, _add_s_to_verb(past)]
 
     else:
-        choices = [basic.third_person()] * 3 + [basic.past_tense()]
+        choices = [third_person] * 3 + [past]
 
-    return random.choice(choices)
+    return get_rng(rng).choice(choices)
 
 
 def _add_s_to_verb(verb: Verb):
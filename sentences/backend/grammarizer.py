@@ -1,33 +1,86 @@
-import random
-from copy import deepcopy
-from typing import List, Union
+from array import array
+from collections.abc import Mapping
+from typing import List, NamedTuple, Union
 
-from sentences.backend.investigation_tools import requires_third_person, find_subject
+from sentences.backend.random_streams import get_rng
+from sentences.backend.tokens import as_tokens, NOUN, VERB, OTHER
 from sentences.words.pronoun import AbstractPronoun
 from sentences.words.punctuation import Punctuation
 from sentences.words.noun import Noun
-from sentences.words.verb import Verb
 from sentences.words.wordtools.abstractword import AbstractWord
+from sentences.words.wordtools.tags import tags_to_mask
 from sentences.words.wordtools.wordtag import WordTag
 
 Paragraph = List[List[Union[AbstractWord, AbstractPronoun, Punctuation]]]
 
+_PROPER = tags_to_mask([WordTag.PROPER])
+
+
+class NounInfo(NamedTuple):
+    """How a noun is written in the paragraph. definite is True once the noun has been used."""
+    plural: bool
+    definite: bool
+    countable: bool
+
+
+class NounInfoView(Mapping):
+    """
+    A read-only view of a Grammarizer's nouns, {noun: NounInfo}, in the order the nouns first appear. Nothing is
+    copied, and the view shows every later change.
+    """
+    __slots__ = ('_forms', '_definite', '_vocabulary')
+
+    def __init__(self, forms, definite, vocabulary):
+        """
+        :param forms: {noun id: (plural, countable)}
+        :param definite: the set of ids of nouns that have been used
+        """
+        self._forms = forms
+        self._definite = definite
+        self._vocabulary = vocabulary
+
+    def __getitem__(self, noun):
+        noun_id = self._vocabulary.find(noun)
+        try:
+            plural, countable = self._forms[noun_id]
+        except KeyError:
+            raise KeyError(noun)
+        return NounInfo(plural, noun_id in self._definite, countable)
+
+    def __iter__(self):
+        word = self._vocabulary.word
+        return (word(noun_id) for noun_id in self._forms)
+
+    def __len__(self):
+        return len(self._forms)
+
+    def __repr__(self):
+        return '{}({!r})'.format(type(self).__name__, dict(self.items()))
+
 
 class Grammarizer(object):
     def __init__(self, paragraph: Paragraph, present_tense: bool = True,
-                 probability_plural_noun: float = 0.3, probability_negative_verb: float = 0.3):
-        self._raw = [sentence[:] for sentence in paragraph]
+                 probability_plural_noun: float = 0.3, probability_negative_verb: float = 0.3, rng=None):
+        """
+        :param paragraph: a list (or any iterable) of sentences or a TokenParagraph. Sentences are read into
+                          tokens one at a time, so they can come from RandomParagraph.iter_chain_paragraph.
+        :param rng: chooses plural nouns and negative verbs. see random_streams.get_rng
+        """
+        self._raw = as_tokens(paragraph)
+        self._codes = _word_codes(self._raw)
+        self._rng = get_rng(rng)
 
         self.present_tense = present_tense
         self._plural = normalize_probability(probability_plural_noun)
         self._negative = normalize_probability(probability_negative_verb)
 
-        self._noun_info = None
+        self._noun_forms = {}
+        self._definite = set()
         self.set_nouns()
 
     @property
-    def noun_info(self):
-        return deepcopy(self._noun_info)
+    def noun_info(self) -> NounInfoView:
+        return NounInfoView(self._noun_forms, self._definite, self._raw.vocabulary)
 
     @property
     def plural(self):
@@ -46,68 +99,93 @@ class Grammarizer(object):
         self._negative = normalize_probability(new)
 
     def reset_definite_nouns(self):
-        for value in self._noun_info.values():
-            value['definite'] = False
+        self._definite.clear()
 
     def set_nouns(self):
-        nouns = get_non_proper_nouns(self._raw)
-        pool = {}
-        for noun in nouns:
+        self.reset_definite_nouns()
+        pool = self._noun_forms
+        pool.clear()
+        word = self._raw.vocabulary.word
+        for noun_id in self._non_proper_noun_ids():
             use_plural = False
-            countable = not noun.has_tags(WordTag.UNCOUNTABLE)
-            if countable and random.random() < self._plural:
+            countable = not word(noun_id).has_tags(WordTag.UNCOUNTABLE)
+            if countable and self._rng.random() < self._plural:
                 use_plural = True
-            pool[noun] = {'plural': use_plural, 'definite': False, 'countable': countable}
-        self._noun_info = pool
+            pool[noun_id] = (use_plural, countable)
 
-    def generate_paragraph(self):
-        self.reset_definite_nouns()
-        answer = []
-        for sentence in self._raw:
-            new_sentence = []
-            for original_wd in sentence:
-                new_wd = original_wd
-
-                if is_non_proper_noun(new_wd):
-                    new_wd = self._modify_noun(new_wd)
-
-                if isinstance(new_wd, Verb):
-                    new_wd = self._assign_negatives(new_wd)
-
-                new_sentence.append(new_wd)
+    def _non_proper_noun_ids(self):
+        answer = {}
+        for word_id, code in zip(self._raw.ids, self._codes):
+            if code == NOUN:
+                answer.setdefault(word_id, None)
+        return list(answer)
 
-            answer.append(new_sentence)
+    def generate_paragraph(self):
+        return self.generate_tokens().to_paragraph()
 
-        for sentence in answer:
-            self._modify_verb_tense(sentence)
-            sentence[0] = sentence[0].capitalize()
+    def generate_tokens(self):
+        """
+        Makes the paragraph in one pass over the words. Each sentence gets its nouns, negatives and verb tense in
+        word order and then its capital letter, so the random draws are in the same order as word by word.
+        """
+        self.reset_definite_nouns()
+        raw = self._raw
+        answer = raw.copy()
+        word = raw.vocabulary.word
+        ids = raw.ids
+        codes = self._codes
+        offsets = raw.offsets
+        for sentence_index in range(len(raw)):
+            start = offsets[sentence_index]
+            end = offsets[sentence_index + 1]
+            if start == end:
+                continue
+            verb_position = raw.verbs[sentence_index]
+            for position in range(start, end):
+                code = codes[position]
+                if code == NOUN:
+                    answer.set_word(position, self._modify_noun(ids[position]))
+                elif code == VERB:
+                    new_wd = self._assign_negatives(word(ids[position]))
+                    if position == verb_position:
+                        new_wd = self._set_tense(new_wd, answer, sentence_index)
+                    answer.set_word(position, new_wd)
+            if verb_position == -1:
+                answer.set_word(start, self._set_tense(answer.word(start), answer, sentence_index))
+            answer.set_word(start, answer.word(start).capitalize())
 
         return answer
 
-    def _modify_noun(self, new_wd):
-        info = self._noun_info[new_wd]
-        if info['plural']:
+    def _modify_noun(self, noun_id):
+        new_wd = self._raw.vocabulary.word(noun_id)
+        plural, countable = self._noun_forms[noun_id]
+        if plural:
             new_wd = new_wd.plural()
-        if info['definite']:
+        if noun_id in self._definite:
             new_wd = new_wd.definite()
         else:
-            info['definite'] = True
-            if info['countable'] and not new_wd.has_tags(WordTag.PLURAL):
+            self._definite.add(noun_id)
+            if countable and not new_wd.has_tags(WordTag.PLURAL):
                 new_wd = new_wd.indefinite()
         return new_wd
 
     def _assign_negatives(self, new_wd):
-        if random.random() < self._negative:
+        if self._rng.random() < self._negative:
             new_wd = new_wd.negative()
         return new_wd
 
-    def _modify_verb_tense(self, sentence):
-        verb_index = find_subject(sentence) + 1
-        if self.present_tense:
-            if requires_third_person(sentence):
-                sentence[verb_index] = sentence[verb_index].third_person()
-        else:
-            sentence[verb_index] = sentence[verb_index].past_tense()
+    def _set_tense(self, verb, tokens, sentence_index):
+        if not self.present_tense:
+            return verb.past_tense()
+        if tokens.requires_third_person(sentence_index):
+            return verb.third_person()
+        return verb
+
+
+def _word_codes(tokens) -> array:
+    """The kind of each word, except that proper nouns are OTHER, since the grammarizer leaves them alone."""
+    return array('b', [OTHER if kind == NOUN and tags & _PROPER else kind
+                       for kind, tags in zip(tokens.kinds, tokens.tags)])
 
 
 def normalize_probability(probability: float):
@@ -115,12 +193,13 @@ def normalize_probability(probability: float):
 
 
 def get_non_proper_nouns(paragraph: Paragraph) -> list:
-    answer = []
+    """:return: each non-proper noun once, in the order it first appears"""
+    answer = {}
     for sentence in paragraph:
         for word in sentence:
-            if is_non_proper_noun(word) and word not in answer:  # Sets and random choice are untestable
-                answer.append(word)
-    return answer
+            if is_non_proper_noun(word):
+                answer.setdefault(word, None)
+    return list(answer)
 
 
 def is_non_proper_noun(word):
@@ -7,12 +7,16 @@ from sentences.words.wordtools.wordtag import WordTag
 
 def get_present_be_verb(sentence):
     subj_index = find_subject(sentence)
-    if subj_index == -1:
+    return present_be_verb(None if subj_index == -1 else sentence[subj_index])
+
+
+def present_be_verb(subject):
+    """:param subject: the subject of a sentence, or None if it has none"""
+    if subject is None:
         return BasicWord('be')
-    subj = sentence[subj_index]
-    if requires_third_person(sentence):
+    if is_third_person(subject):
         return BasicWord('is')
-    elif subj in (Pronoun.I, Pronoun.ME, CapitalPronoun.I, CapitalPronoun.ME):
+    elif subject in (Pronoun.I, Pronoun.ME, CapitalPronoun.I, CapitalPronoun.ME):
         return BasicWord('am')
     else:
         return BasicWord('are')
@@ -42,6 +46,23 @@ def is_third_person(word) -> bool:
 
 
 def is_word_in_sentence(word, raw_sentence):
+    """Nouns match by base noun and pronouns by pair. see word_key"""
+    key = word_key(word)
+    return any(word_key(element) == key for element in raw_sentence)
+
+
+def word_key(word):
+    """Words with the same key count as the same word: nouns by base noun and pronouns by pair."""
     if isinstance(word, AbstractPronoun):
-        return any(word.is_pair(element) for element in raw_sentence)
-    return word in raw_sentence
+        return word.subject()
+    if isinstance(word, Noun):
+        return word.base_noun
+    return word
+
+
+def sentence_keys(raw_sentence) -> frozenset:
+    """
+    The word_key of every word in raw_sentence, so that is_word_in_sentence for any number of words is one hash
+    lookup each: word_key(word) in keys.
+    """
+    return frozenset(word_key(element) for element in raw_sentence)
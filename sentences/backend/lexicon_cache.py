@@ -0,0 +1,116 @@
+import hashlib
+import json
+import os
+
+from sentences.backend.mapped_lexicon import (noun_fields, noun_from_fields, verb_group_fields,
+                                              verb_group_from_fields)
+from sentences.words.verbgroup import VerbGroup
+
+CACHE_FILENAME = 'lexicon.cache'
+CACHE_VERSION = 4
+
+NOUNS = 'nouns'
+VERBS = 'verbs'
+
+
+def file_signature(filename):
+    """(absolute path, mtime in ns, size in bytes, sha1 of contents) or None if the file can't be read"""
+    try:
+        stat = os.stat(filename)
+        with open(filename, 'rb') as f:
+            digest = hashlib.sha1(f.read()).hexdigest()
+    except (OSError, TypeError, ValueError):
+        return None
+    return os.path.abspath(filename), stat.st_mtime_ns, stat.st_size, digest
+
+
+def updated_signature(filename, signature):
+    """
+    Only hashes the file if its stat no longer matches signature. A file that was touched but not edited
+    gets a new signature with the same sha1.
+    """
+    if signature is not None:
+        try:
+            stat = os.stat(filename)
+        except (OSError, TypeError, ValueError):
+            return None
+        if (os.path.abspath(filename), stat.st_mtime_ns, stat.st_size) == signature[:3]:
+            return signature
+    return file_signature(filename)
+
+
+def is_same_contents(signature, other):
+    """True if both signatures are for the same path with the same sha1"""
+    if signature is None or other is None:
+        return False
+    return (signature[0], signature[3]) == (other[0], other[3])
+
+
+def lexicon_signatures(filenames: dict) -> dict:
+    """:param filenames: {key: csv filename}"""
+    return {key: file_signature(filename) for key, filename in filenames.items()}
+
+
+class LexiconCache(object):
+    """
+    A snapshot of loaded word lists, keyed by the signature of the CSV each list came from. When every
+    CSV still matches its signature, the lists are read back from one file instead of re-parsing the CSVs.
+
+    The snapshot is JSON holding each word as a row of strings, so reading a cache file that was tampered
+    with can only fail to load words; it can not run code.
+    """
+    def __init__(self, cache_file):
+        self.cache_file = cache_file
+
+    def load(self, signatures: dict):
+        """
+        :param signatures: from lexicon_signatures
+        :return: {key: (words, weights)} or None if the cache is missing, unreadable or out of date.
+        """
+        if None in signatures.values():
+            return None
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                snapshot = json.load(f)
+            if snapshot['version'] != CACHE_VERSION:
+                return None
+            files = {key: tuple(signature) for key, signature in snapshot['files'].items()}
+            if files != signatures:
+                return None
+            return {key: _decode_list(encoded) for key, encoded in snapshot['lists'].items()}
+        except (OSError, AttributeError, KeyError, IndexError, TypeError, ValueError):
+            return None
+
+    def save(self, signatures: dict, lists: dict):
+        """
+        :param signatures: the signatures of the files when the lists were loaded from them.
+        :param lists: {key: (words, weights)}
+
+        Failing to write is not an error; the lists are simply parsed again next time.
+        """
+        if None in signatures.values():
+            return
+        snapshot = {'version': CACHE_VERSION, 'files': signatures,
+                    'lists': {key: _encode_list(*words_and_weights) for key, words_and_weights in lists.items()}}
+        temp_file = self.cache_file + '.tmp'
+        try:
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(snapshot, f)
+            os.replace(temp_file, self.cache_file)
+        except OSError:
+            pass
+
+
+def _encode_list(words, weights):
+    kind = VERBS if words and isinstance(words[0], (VerbGroup, dict)) else NOUNS
+    to_fields = verb_group_fields if kind == VERBS else noun_fields
+    return {'kind': kind, 'words': [to_fields(word) for word in words], 'weights': list(weights)}
+
+
+def _decode_list(encoded):
+    from_fields = {VERBS: verb_group_from_fields, NOUNS: noun_from_fields}[encoded['kind']]
+    words = [from_fields(fields) for fields in encoded['words']]
+    weights = encoded['weights']
+    if len(weights) != len(words) or not all(isinstance(weight, (int, float)) for weight in weights):
+        raise ValueError('weights do not match words')
+    return words, weights
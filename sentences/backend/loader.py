@@ -1,24 +1,44 @@
 import csv
-
 from sentences import LoaderError
+from sentences.backend.random_streams import get_rng
 from sentences.words.noun import Noun
 from sentences.words.verb import Verb
 from sentences.words.basicword import BasicWord
+from sentences.words.verbgroup import VerbGroup
+from sentences.words.wordtools.morphology import FORMS
 
+WEIGHT_PREFIX = 'weight='
+DEFAULT_WEIGHT = 1.0
 
 
 def load_csv(filename):
+    return list(iter_csv(filename))
+
+
+def iter_csv(filename):
+    """
+    Yields the stripped, non-empty, non-comment rows of a CSV one at a time, so only one row is held in
+    memory at once.
+    """
+    for _, row in _iter_numbered_csv(filename):
+        yield row
+
+
+def _iter_numbered_csv(filename):
+    """Like iter_csv, but yields line number, row"""
     try:
         with open(filename, 'r', newline='') as f:
             csv_reader = csv.reader(f, delimiter=',', quotechar='"', doublequote=True, skipinitialspace=True)
-            raw = [row for row in csv_reader if row and not row[0].startswith('#')]
+            for row in csv_reader:
+                if not row or row[0].startswith('#'):
+                    continue
+                row = [word.strip() for word in row]
+                if any(row):
+                    yield csv_reader.line_num, row
     except (OSError, UnicodeError):
         message = ('Could not read CSV file. If you edited it in MSWord or something similar, ' +
                    'it got formatted. Use "notepad"')
         raise LoaderError(message)
-    else:
-        answer = strip_spaces(raw)
-        return remove_empty_values(answer)
 
 
 def strip_spaces(rows):
@@ -29,20 +49,107 @@ def remove_empty_values(rows):
     return [row for row in rows if not all(word == '' for word in row)]
 
 
-def countable_nouns(filename=''):
-    raw_lines = load_csv(filename)
+def reservoir_sample(iterable, sample_size, rng=None):
+    """
+    A random sample of sample_size values from iterable, found in a single pass without holding more than
+    sample_size values. If iterable is not longer than sample_size, all of its values are returned in order.
+
+    :param rng: see random_streams.get_rng
+    """
+    if sample_size < 0:
+        raise ValueError('sample size must be >= 0')
+    randrange = get_rng(rng).randrange
+    reservoir = []
+    for index, value in enumerate(iterable):
+        if index < sample_size:
+            reservoir.append(value)
+        else:
+            position = randrange(index + 1)
+            if position < sample_size:
+                reservoir[position] = value
+    return reservoir
+
+
+def _collect(words, sample, rng):
+    if sample is None:
+        return list(words)
+    return reservoir_sample(words, sample, rng)
+
+
+def split_weight(row):
+    """
+    Any row may have a 'weight=<number>' cell, which sets how often its word is chosen compared to the other
+    words in its list. The default is 1.
+
+    :return: row without the weight cell, weight
+    """
+    weight = DEFAULT_WEIGHT
+    values = []
+    for value in row:
+        if value.startswith(WEIGHT_PREFIX):
+            weight = _get_weight(value)
+        else:
+            values.append(value)
+    return values, weight
+
+
+def _get_weight(value):
+    try:
+        weight = float(value[len(WEIGHT_PREFIX):])
+    except ValueError:
+        weight = 0.0
+    if not weight > 0 or weight == float('inf'):
+        raise LoaderError('Bad weight: {!r}. A weight must be a positive number.'.format(value))
+    return weight
+
+
+def _load_words(filename, make_word, sample, weighted, rng):
+    if not weighted:
+        return _collect((make_word(values) for values, _ in _iter_word_rows(filename)), sample, rng)
+    pairs = _collect(((make_word(values), weight) for values, weight in _iter_word_rows(filename)), sample, rng)
+    return [word for word, _ in pairs], [weight for _, weight in pairs]
+
+
+def _iter_word_rows(filename):
+    """
+    Yields each row without its weight cell, and its weight.
+
+    :raises LoaderError: for a row with no word, such as one that is only a weight
+    """
+    for line, row in _iter_numbered_csv(filename):
+        values, weight = split_weight(row)
+        if not any(values):
+            msg = 'No word in {}, line {}: {!r}. Each line needs a word as well as any weight.'
+            raise LoaderError(msg.format(filename, line, ', '.join(row)))
+        yield values, weight
+
+
+def countable_nouns(filename='', sample=None, weighted=False, rng=None):
+    """
+    :param sample: if not None, at most this many nouns, chosen at random
+    :param weighted: if True, returns nouns, weights
+    :param rng: chooses the sample. see random_streams.get_rng
+    """
     columns = 2
-    return [Noun(*line[:columns]) for line in raw_lines]
+    return _load_words(filename, lambda row: Noun(*row[:columns]), sample, weighted, rng)
 
 
-def uncountable_nouns(filename=''):
-    raw_lines = load_csv(filename)
-    return [Noun.uncountable_noun(line[0]) for line in raw_lines]
+def uncountable_nouns(filename='', sample=None, weighted=False, rng=None):
+    """
+    :param sample: if not None, at most this many nouns, chosen at random
+    :param weighted: if True, returns nouns, weights
+    :param rng: chooses the sample. see random_streams.get_rng
+    """
+    return _load_words(filename, lambda row: Noun.uncountable_noun(row[0]), sample, weighted, rng)
 
 
-def proper_nouns(filename):
-    raw_lines = load_csv(filename)
-    return [Noun.proper_noun(row[0], _get_plural_bool(row)) for row in raw_lines]
+def proper_nouns(filename, sample=None, weighted=False, rng=None):
+    """
+    :param sample: if not None, at most this many nouns, chosen at random
+    :param weighted: if True, returns nouns, weights
+    :param rng: chooses the sample. see random_streams.get_rng
+    """
+    return _load_words(filename, lambda row: Noun.proper_noun(row[0], _get_plural_bool(row)), sample, weighted, rng)
 
 
 def _get_plural_bool(row):
@@ -51,10 +158,26 @@ def _get_plural_bool(row):
     return True
 
 
-def verbs(filename):
+def irregular_forms(filename):
     raw_lines = load_csv(filename)
+    answer = []
+    for row in raw_lines:
+        if len(row) < 3 or row[0] not in FORMS or not all(row[:3]):
+            msg = 'Bad line for irregular forms: {!r}. Each line must be: {}, word, irregular form'
+            raise LoaderError(msg.format(', '.join(row), '|'.join(FORMS)))
+        answer.append(tuple(row[:3]))
+    return answer
+
+
+def verbs(filename, sample=None, weighted=False, rng=None):
+    """
+    :param sample: if not None, at most this many verbs, chosen at random
+    :param weighted: if True, returns verbs, weights
+    :param rng: chooses the sample. see random_streams.get_rng
+    :return: VerbGroups
+    """
     try:
-        answer = [get_verb_dict(verb_line) for verb_line in raw_lines]
+        answer = _load_words(filename, get_verb_group, sample, weighted, rng)
     except LoaderError as e:
         raise e
     except ValueError:
@@ -62,10 +185,8 @@ def verbs(filename):
     return answer
 
 
-def get_verb_dict(str_lst):
-    str_lst = _make_list_correct_len_with_nulls(str_lst)
-
-    raw_infinitive, raw_past, preposition_str, obj_num_str = str_lst
+def get_verb_group(str_lst) -> VerbGroup:
+    raw_infinitive, raw_past, preposition_str, obj_num_str = _make_list_correct_len_with_nulls(str_lst)
 
     infinitive, particle_inf = split_verb(raw_infinitive)
     past_tense, particle_past = split_verb(raw_past)
@@ -91,7 +212,7 @@ def get_verb_dict(str_lst):
     else:
         obj_num = int(obj_num_str)
 
-    return {'verb': verb, 'preposition': preposition, 'objects': obj_num, 'particle': particle}
+    return VerbGroup(verb, preposition, obj_num, particle)
 
 
 def _make_list_correct_len_with_nulls(input_list):
@@ -0,0 +1,145 @@
+import mmap
+import struct
+from collections.abc import Sequence
+
+from sentences.words.basicword import BasicWord
+from sentences.words.noun import Noun
+from sentences.words.verb import Verb
+from sentences.words.verbgroup import VerbGroup, as_verb_group
+from sentences.words.wordtools.tags import Tags
+
+# file layout:
+#     header: MAGIC, version, kind, number of entries
+#     index: number of entries + 1 offsets into the data, as fixed width unsigned ints
+#     data: each entry is utf-8 text with fields separated by FIELD_SEPARATOR
+MAGIC = b'SLEX'
+VERSION = 1
+NOUNS = b'N'
+VERBS = b'V'
+
+_HEADER = struct.Struct('<4sBcQ')
+_OFFSET = struct.Struct('<Q')
+
+FIELD_SEPARATOR = '\x1f'
+
+
+def write_lexicon(filename, words):
+    """
+    :param words: a list of Nouns or a list of VerbGroups (or verb dicts)
+    """
+    kind = VERBS if words and isinstance(words[0], (VerbGroup, dict)) else NOUNS
+    encode = _encode_verb_group if kind == VERBS else _encode_noun
+    entries = [encode(word) for word in words]
+
+    offsets = [0]
+    for entry in entries:
+        offsets.append(offsets[-1] + len(entry))
+
+    with open(filename, 'wb') as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, kind, len(entries)))
+        for offset in offsets:
+            f.write(_OFFSET.pack(offset))
+        for entry in entries:
+            f.write(entry)
+
+
+class MappedLexicon(Sequence):
+    """
+    A read-only list of Nouns or VerbGroups backed by a memory-mapped file from write_lexicon. An entry is
+    only decoded when it is indexed, so random.choice does not need the whole list as Python objects, and
+    processes that map the same file share its pages.
+    """
+    def __init__(self, filename):
+        with open(filename, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, version, kind, length = _HEADER.unpack_from(self._map, 0)
+        except struct.error:
+            self.close()
+            raise ValueError('{!r} is not a lexicon file'.format(filename))
+        if magic != MAGIC or version != VERSION or kind not in (NOUNS, VERBS):
+            self.close()
+            raise ValueError('{!r} is not a lexicon file'.format(filename))
+
+        self._kind = kind
+        self._len = length
+        self._index_start = _HEADER.size
+        self._data_start = _HEADER.size + (length + 1) * _OFFSET.size
+        self._decode = verb_group_from_fields if kind == VERBS else noun_from_fields
+
+    @property
+    def kind(self):
+        return self._kind
+
+    def close(self):
+        self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __len__(self):
+        return self._len
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[position] for position in range(*index.indices(self._len))]
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError('lexicon index out of range')
+        offset_position = self._index_start + index * _OFFSET.size
+        start, = _OFFSET.unpack_from(self._map, offset_position)
+        end, = _OFFSET.unpack_from(self._map, offset_position + _OFFSET.size)
+        data_start = self._data_start
+        fields = self._map[data_start + start:data_start + end].decode('utf-8').split(FIELD_SEPARATOR)
+        return self._decode(fields)
+
+
+def _join(fields):
+    if any(FIELD_SEPARATOR in field for field in fields):
+        raise ValueError('Lexicon values may not contain {!r}'.format(FIELD_SEPARATOR))
+    return FIELD_SEPARATOR.join(fields).encode('utf-8')
+
+
+def noun_fields(noun):
+    """:return: the fields of a Noun as strings, for noun_from_fields"""
+    return [noun.value, noun.irregular_plural, noun.base_noun, str(noun.tags.mask)]
+
+
+def noun_from_fields(fields):
+    value, irregular_plural, base, mask = fields
+    return Noun(value, irregular_plural, base, Tags.from_mask(int(mask)))
+
+
+def verb_group_fields(verb_group):
+    """:return: the fields of a VerbGroup (or verb dict) as strings, for verb_group_from_fields"""
+    verb, preposition, objects, particle = as_verb_group(verb_group)
+    fields = [verb.value, verb.irregular_past, verb.infinitive, str(verb.tags.mask), str(objects)]
+    for word in (preposition, particle):
+        fields += ['', ''] if word is None else [word.value, str(word.tags.mask)]
+    return fields
+
+
+def verb_group_from_fields(fields):
+    value, irregular_past, infinitive, mask, objects = fields[:5]
+    verb = Verb(value, irregular_past, infinitive, Tags.from_mask(int(mask)))
+    preposition = _decode_basic_word(*fields[5:7])
+    particle = _decode_basic_word(*fields[7:9])
+    return VerbGroup(verb, preposition, int(objects), particle)
+
+
+def _encode_noun(noun):
+    return _join(noun_fields(noun))
+
+
+def _encode_verb_group(verb_group):
+    return _join(verb_group_fields(verb_group))
+
+
+def _decode_basic_word(value, mask):
+    if not mask:
+        return None
+    return BasicWord(value, Tags.from_mask(int(mask)))
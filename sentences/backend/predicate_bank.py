@@ -0,0 +1,73 @@
+from sentences.backend.investigation_tools import word_key
+from sentences.backend.predicate_template import Predicate, predicate_keys
+from sentences.backend.random_streams import get_rng
+
+
+class PredicateBank(object):
+    """
+    Distinct predicates made ahead of time in one batch, so that paragraphs take predicates from the bank instead
+    of building each one. A predicate is dropped after it has been used max_uses times, and the bank is refilled
+    with a new batch when it is empty.
+    """
+    def __init__(self, word_maker, p_pronoun=0.2, size=500, max_uses=1, rng=None):
+        """
+        :param word_maker: a RandomSentences that makes the predicates
+        :param size: the number of predicates made for each batch. Repeats are dropped, so a batch can be smaller.
+        :param max_uses: how many times each predicate can be used
+        :param rng: chooses predicates from the bank. see random_streams.get_rng
+        """
+        if size < 1 or max_uses < 1:
+            raise ValueError('size and max_uses must be at least 1')
+        self._word_maker = word_maker
+        self._p_pronoun = p_pronoun
+        self._size = size
+        self._max_uses = max_uses
+        self._rng = get_rng(rng)
+
+        self._predicates = []
+        self._keys = []
+        self._uses = []
+
+    def __len__(self):
+        return len(self._predicates)
+
+    def refill(self):
+        """Adds a new batch of predicates that are not already in the bank."""
+        in_bank = set(self._predicates)
+        for predicate in self._word_maker.predicates(self._size, self._p_pronoun):
+            words = tuple(predicate)
+            if words not in in_bank:
+                in_bank.add(words)
+                self._predicates.append(words)
+                self._keys.append(predicate_keys(predicate))
+                self._uses.append(0)
+
+    def predicate(self, excluded=()) -> Predicate:
+        """
+        A random predicate from the bank, as a new Predicate.
+
+        :param excluded: words that should not be in the predicate (pronouns by pair), such as its subject. If no
+                         predicate in the bank fits, one is made with word_maker.predicate.
+        """
+        if not self._predicates:
+            self.refill()
+
+        index = self._rng.randrange(len(self._predicates))
+        if excluded:
+            excluded_keys = {word_key(word) for word in excluded}
+            if not excluded_keys.isdisjoint(self._keys[index]):
+                fitting = [position for position, keys in enumerate(self._keys) if excluded_keys.isdisjoint(keys)]
+                if not fitting:
+                    return self._word_maker.predicate(self._p_pronoun, excluded)
+                index = self._rng.choice(fitting)
+
+        predicate = Predicate(self._predicates[index], self._keys[index])
+        self._uses[index] += 1
+        if self._uses[index] >= self._max_uses:
+            self._remove(index)
+        return predicate
+
+    def _remove(self, index):
+        for values in (self._predicates, self._keys, self._uses):
+            values[index] = values[-1]
+            values.pop()
@@ -0,0 +1,64 @@
+from sentences.backend.investigation_tools import sentence_keys, word_key
+from sentences.words.pronoun import Pronoun
+from sentences.words.wordtools.wordtag import WordTag
+
+
+class Predicate(list):
+    """
+    The words of a predicate, with the word_keys of its objects worked out when it is made, so that a subject
+    can be checked against it with one lookup. see predicate_keys
+    """
+    __slots__ = ('object_keys',)
+
+    def __init__(self, words=(), object_keys=frozenset()):
+        super().__init__(words)
+        self.object_keys = object_keys
+
+
+def predicate_keys(predicate) -> frozenset:
+    """
+    Keys to check whether a subject is in predicate: word_key(subject) in predicate_keys(predicate). Uses the
+    object_keys of a Predicate, and sentence_keys for any other list of words.
+    """
+    if isinstance(predicate, Predicate):
+        return predicate.object_keys
+    return sentence_keys(predicate)
+
+
+class PredicateTemplate(object):
+    """
+    The word order of one verb group, worked out once. The last object follows the preposition. Any other
+    objects go around the particle: pronouns before it and nouns after it. With no preposition, a single
+    pronoun object goes before a separable particle, as in "pick it up".
+    """
+    __slots__ = ('_verb', '_particle', '_preposition', '_no_objects', '_pronoun_before_particle')
+
+    def __init__(self, verb, preposition, particle):
+        self._verb = verb
+        self._particle = () if particle is None else (particle,)
+        self._preposition = () if preposition is None else (preposition,)
+        self._no_objects = (verb,) + self._particle + self._preposition
+        self._pronoun_before_particle = (preposition is None and particle is not None and
+                                         particle.has_tags(WordTag.SEPARABLE_PARTICLE))
+
+    def fill(self, objects) -> Predicate:
+        """:param objects: in the order they were chosen. The list is not changed."""
+        if not objects:
+            return Predicate(self._no_objects)
+        last = objects[-1]
+        object_keys = frozenset(word_key(obj) for obj in objects)
+        if len(objects) == 1:
+            if self._pronoun_before_particle and isinstance(last, Pronoun):
+                return Predicate((self._verb, last) + self._particle, object_keys)
+            return Predicate((self._verb,) + self._particle + self._preposition + (last,), object_keys)
+
+        others = objects[:-1]
+        pronouns = [obj for obj in others if isinstance(obj, Pronoun)]
+        nouns = [obj for obj in reversed(others) if not isinstance(obj, Pronoun)]
+        words = [self._verb] + pronouns + list(self._particle) + nouns + list(self._preposition) + [last]
+        return Predicate(words, object_keys)
+
+
+def predicate_template(verb_group) -> PredicateTemplate:
+    """:param verb_group: a VerbGroup"""
+    return PredicateTemplate(verb_group.verb, verb_group.preposition, verb_group.particle)
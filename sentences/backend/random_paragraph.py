@@ -1,82 +1,149 @@
-import random
-
-from sentences.backend.investigation_tools import is_word_in_sentence
+from sentences.backend.investigation_tools import word_key
+from sentences.backend.predicate_template import predicate_keys
 from sentences.backend.random_sentences import RandomSentences
+from sentences.backend.random_streams import get_rng
 from sentences.words.noun import Noun
 from sentences.words.pronoun import Pronoun
 
 
 class RandomParagraph(object):
-    def __init__(self, probability_pronoun, verb_list, noun_list):
+    def __init__(self, probability_pronoun, verb_list, noun_list, verb_weights=None, noun_weights=None, rng=None,
+                 predicate_bank=None):
+        """
+        :param rng: the source of every random choice. see random_streams.get_rng
+        :param predicate_bank: if not None, a PredicateBank that predicates are taken from instead of being made here
+        """
+        word_maker = RandomSentences(verb_list, noun_list, verb_weights, noun_weights, get_rng(rng))
+        self._set_up(probability_pronoun, word_maker, predicate_bank)
+
+    @classmethod
+    def from_word_maker(cls, probability_pronoun, word_maker, predicate_bank=None):
+        """
+        A RandomParagraph that uses word_maker instead of making its own RandomSentences from word lists.
+
+        :param word_maker: a RandomSentences. The paragraph draws from its rng. see RandomSentences.with_rng
+        """
+        paragraph = cls.__new__(cls)
+        paragraph._set_up(probability_pronoun, word_maker, predicate_bank)
+        return paragraph
+
+    def _set_up(self, probability_pronoun, word_maker, predicate_bank):
         self._p_pronoun = probability_pronoun
-        self._word_maker = RandomSentences(verb_list, noun_list)
+        self._rng = word_maker.rng
+        self._word_maker = word_maker
+        self._predicate_bank = predicate_bank
+
+    def _predicate(self, excluded=()):
+        if self._predicate_bank is None:
+            return self._word_maker.predicate(self._p_pronoun, excluded)
+        return self._predicate_bank.predicate(excluded)
 
     def get_subject_pool(self, size):
-        pool = []
-        safety_count = 0
-        safety_limit = 100 + size
-        while len(pool) < size:
-            new_subj = self._word_maker.subject(self._p_pronoun)
-            if not is_word_in_sentence(new_subj, pool):
-                pool.append(new_subj)
-            else:
-                safety_count += 1
-                if safety_count > safety_limit:
-                    raise ValueError('pool size is too large for available nouns loaded from file')
-        return pool
+        try:
+            return self._word_maker.distinct_subjects(size, self._p_pronoun)
+        except ValueError:
+            raise ValueError('pool size is too large for available nouns loaded from file')
 
     def create_pool_paragraph(self, pool_size, num_sentences):
-        subjects = self.get_subject_pool(pool_size)
-        paragraph = []
-        exception_count = 0
-        exceptions_until_repetition = 100 + num_sentences
-        while len(paragraph) < num_sentences:
-            predicate = self._word_maker.predicate(self._p_pronoun)
-            subj = None
+        return list(self.iter_pool_paragraph(pool_size, num_sentences))
+
+    def iter_pool_paragraph(self, pool_size, num_sentences):
+        """
+        Yields the sentences of a pool paragraph one at a time, so only the subject pool and the current sentence
+        are held in memory.
+
+        :raises ValueError: at once, if pool_size is too large
+        """
+        return self._iter_pool_sentences(self.get_subject_pool(pool_size), num_sentences)
+
+    def _iter_pool_sentences(self, subjects, num_sentences):
+        pool = SubjectPool(subjects)
+        for _ in range(num_sentences):
+            predicate = self._predicate()
             try:
-                subj = get_subj(subjects, predicate)
+                subj = pool.choose(predicate, self._rng)
             except ValueError:
-                exception_count += 1
-                if exception_count > exceptions_until_repetition:
-                    subj = random.choice(subjects)
+                subj = self._rng.choice(subjects)
+                predicate = self._predicate(excluded=[subj])
 
-            if subj is not None:
-                predicate.insert(0, subj)
-                paragraph.append(predicate)
-        return paragraph
+            predicate.insert(0, subj)
+            yield predicate
 
     def create_chain_paragraph(self, num_sentences):
-        paragraph = []
+        return list(self.iter_chain_paragraph(num_sentences))
 
+    def iter_chain_paragraph(self, num_sentences):
+        """
+        Yields the sentences of a chain paragraph one at a time, so only the current sentence is held in memory.
+        Changing a sentence after it is yielded does not change the ones after it.
+        """
         subj = self._word_maker.subject(self._p_pronoun)
-        predicate = self._word_maker.predicate(self._p_pronoun)
-
-        safety_count = 0
-        while len(paragraph) < num_sentences:
-            while is_word_in_sentence(subj, predicate) and safety_count < 100:
-                predicate = self._word_maker.predicate(self._p_pronoun)
-                safety_count += 1
-            safety_count = 0
-            predicate.insert(0, subj)
-            paragraph.append(predicate)
+        predicate = self._predicate()
 
+        for _ in range(num_sentences):
+            if predicate is None or word_key(subj) in predicate_keys(predicate):
+                predicate = self._predicate(excluded=[subj])
+            predicate.insert(0, subj)
             subj_candidate = predicate[-2]
+            yield predicate
+
             if isinstance(subj_candidate, Pronoun):
                 subj = subj_candidate.subject()
+                predicate = None
             elif isinstance(subj_candidate, Noun):
                 subj = subj_candidate
+                predicate = None
             else:
                 subj = self._word_maker.subject(self._p_pronoun)
-                predicate = self._word_maker.predicate(self._p_pronoun)
+                predicate = self._predicate()
 
-        return paragraph
 
+def get_subj(pool, predicate, rng=None):
+    """:param rng: see random_streams.get_rng"""
+    keys = predicate_keys(predicate)
+    candidates = [candidate for candidate in pool if word_key(candidate) not in keys]
+    if not candidates:
+        raise ValueError('All subjects in predicate')
+    return get_rng(rng).choice(candidates)
+
+
+class SubjectPool(object):
+    """
+    The subjects of a pool paragraph, one bit each. A predicate clears the bits of the subjects that it contains,
+    so finding the subjects that can go with a predicate takes one lookup per key of the predicate instead of a
+    scan of the predicate for every subject.
+    """
+    __slots__ = ('_subjects', '_bits', '_all_bits')
+
+    def __init__(self, subjects):
+        self._subjects = list(subjects)
+        self._bits = {}
+        for index, subject in enumerate(self._subjects):
+            key = word_key(subject)
+            self._bits[key] = self._bits.get(key, 0) | 1 << index
+        self._all_bits = (1 << len(self._subjects)) - 1
+
+    def __len__(self):
+        return len(self._subjects)
+
+    def compatible(self, predicate) -> int:
+        """:return: a bit mask of the subjects that are not in predicate"""
+        mask = self._all_bits
+        bits = self._bits
+        for key in predicate_keys(predicate):
+            mask &= ~bits.get(key, 0)
+        return mask
+
+    def choose(self, predicate, rng=None):
+        """
+        A random subject that is not in predicate. Makes the same draw as get_subj.
 
-def get_subj(pool, predicate):
-    to_use = pool[:]
-    random.shuffle(to_use)
-    while to_use:
-        candidate = to_use.pop()
-        if not is_word_in_sentence(candidate, predicate):
-            return candidate
-    raise ValueError('All subjects in predicate')
+        :param rng: see random_streams.get_rng
+        :raises ValueError: if every subject is in predicate
+        """
+        mask = self.compatible(predicate)
+        if not mask:
+            raise ValueError('All subjects in predicate')
+        for _ in range(get_rng(rng).randrange(bin(mask).count('1'))):
+            mask &= mask - 1
+        return self._subjects[(mask & -mask).bit_length() - 1]
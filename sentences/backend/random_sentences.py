@@ -1,19 +1,55 @@
-import random
+import copy
 
+from sentences.backend.alias_table import alias_table_or_none
+from sentences.backend.investigation_tools import word_key
+from sentences.backend.predicate_template import predicate_template
+from sentences.backend.random_streams import get_rng, GeneratorRandom
+from sentences.words.noun import Noun
 from sentences.words.pronoun import Pronoun
 from sentences.words.punctuation import Punctuation
-from sentences.words.wordtools.wordtag import WordTag
+from sentences.words.verbgroup import as_verb_group
 
 
 class RandomSentences(object):
-    def __init__(self, verb_list, noun_list):
+    def __init__(self, verb_list, noun_list, verb_weights=None, noun_weights=None, rng=None):
+        """
+        :param verb_list: list of VerbGroups (or verb dicts) or any other sequence of VerbGroups, such as a
+                          MappedLexicon
+        :param noun_list: list of Nouns or any other sequence of them, such as a MappedLexicon
+        :param verb_weights: None for uniform choice, or one weight per verb (or an AliasTable built from them)
+        :param noun_weights: None for uniform choice, or one weight per noun (or an AliasTable built from them)
+        :param rng: the source of every random choice. see random_streams.get_rng
+        """
+        self._rng = get_rng(rng)
         self._pronouns = list(Pronoun.__members__.values())
+        self._subject_pronouns = [pronoun for pronoun in self._pronouns if pronoun.subject() is pronoun]
         self._endings = [Punctuation.PERIOD, Punctuation.PERIOD, Punctuation.EXCLAMATION]
 
-        self._verbs = verb_list[:]
-        self._nouns = noun_list[:]
+        self._verbs = _verb_groups(verb_list)
+        self._nouns = _copy_if_list(noun_list)
         self._check_empty_lists()
 
+        self._verb_table = _get_alias_table(verb_weights, self._verbs)
+        self._noun_table = _get_alias_table(noun_weights, self._nouns)
+
+        self._templates = _compile_templates(self._verbs)
+
+        self._counts = _LexiconCounts()
+
+    @property
+    def rng(self):
+        return self._rng
+
+    def with_rng(self, rng):
+        """
+        A RandomSentences with the same words and weights that draws from rng. Nothing is copied, and the
+        predicate templates and what predicate has worked out about the words are shared, so this is cheap enough
+        to do for every paragraph.
+        """
+        word_maker = copy.copy(self)
+        word_maker._rng = get_rng(rng)
+        return word_maker
+
     def _check_empty_lists(self):
         if not self._verbs:
             raise ValueError('There are no verbs in the verb list.')
@@ -28,75 +64,301 @@ class RandomSentences(object):
         predicate.insert(0, subj)
         return predicate
 
-    def predicate(self, p_pronoun=0.2):
+    def predicate(self, p_pronoun=0.2, excluded=()):
+        """
+        :param excluded: words that the objects should not repeat, such as the subject. If the verb group needs
+                         more objects than there are other nouns, a verb group that needs fewer is chosen instead.
+                         Words are only repeated if no verb group fits.
+        """
         p_pronoun = min(max(p_pronoun, 0), 1)
 
-        verb_group = random.choice(self._verbs)
+        verb_group = _choose(self._verbs, self._verb_table, self._rng)
+        if excluded:
+            verb_group = self._fit_verb_group(verb_group, p_pronoun, excluded)
 
-        objects = self._get_objects(verb_group['objects'], p_pronoun)
+        objects = self._get_objects(verb_group.objects, p_pronoun, excluded)
 
-        predicate = assign_objects(verb_group, objects)
+        predicate = self._template(verb_group).fill(objects)
 
-        predicate.append(random.choice(self._endings))
+        predicate.append(self._rng.choice(self._endings))
         return predicate
 
-    def _get_objects(self, object_count, p_pronoun):
-        objects = []
-        object_position = 0
-        loop_count = 0
-        max_loops_until_repeats_allowed = 100
-        while object_position < object_count:
-            if object_position == 0:
-                new_obj = self.object(p_pronoun)
-            else:
-                new_obj = self.object(p_pronoun=0)
+    def _fit_verb_group(self, verb_group, p_pronoun, excluded):
+        spare = 1 if p_pronoun == 1 else 0
+        excluded_nouns = sum(isinstance(word, Noun) for word in excluded)
+        if self._has_noun_keys(verb_group.objects + excluded_nouns - spare):
+            return verb_group
+
+        counts = self._counts
+        max_objects = len(counts.noun_keys) - excluded_nouns + spare
+        if max_objects not in counts.verbs_by_max_objects:
+            counts.verbs_by_max_objects[max_objects] = self._verbs_that_fit(max_objects)
+        fitting, fitting_table = counts.verbs_by_max_objects[max_objects]
+        return _choose(fitting, fitting_table, self._rng) if fitting else verb_group
+
+    def _verbs_that_fit(self, max_objects):
+        """
+        :return: the verb groups with at most max_objects objects, and an alias table of their weights, so they
+                 are drawn as often compared to each other as in the whole list. Verb groups with no weight are
+                 left out.
+        """
+        verbs = self._verbs
+        if self._verb_table is None:
+            return [candidate for candidate in verbs if candidate.objects <= max_objects], None
+        probabilities = self._verb_table.probabilities()
+        indices = [index for index, candidate in enumerate(verbs)
+                   if candidate.objects <= max_objects and probabilities[index] > 0]
+        fitting = [verbs[index] for index in indices]
+        fitting_table = alias_table_or_none([probabilities[index] for index in indices]) if fitting else None
+        return fitting, fitting_table
+
+    def _template(self, verb_group):
+        template = self._templates.get(verb_group)
+        if template is None:
+            template = self._templates[verb_group] = predicate_template(verb_group)
+        return template
+
+    def _has_noun_keys(self, count):
+        """
+        True if the nouns have at least count different keys. Nouns are only read until count keys are found,
+        and the ones already read are not read again, so with a large lexicon this stops after a few nouns. If
+        it returns False, every noun has been read.
+        """
+        counts = self._counts
+        nouns = self._nouns
+        while len(counts.noun_keys) < count and counts.scanned < len(nouns):
+            counts.noun_keys.add(word_key(nouns[counts.scanned]))
+            counts.scanned += 1
+        return len(counts.noun_keys) >= count
+
+    def sentences(self, num_sentences, p_pronoun=0.2) -> list:
+        """
+        Makes num_sentences sentences. The random numbers for the whole batch are drawn at once with
+        uniform_floats, instead of a few random calls per word.
+        """
+        p_pronoun = min(max(p_pronoun, 0), 1)
+        draws = uniform_floats(2 * num_sentences, self._rng)
+        subjects = [self._noun_or_pronoun_from(draws[index], draws[index + 1], p_pronoun)
+                    for index in range(0, 2 * num_sentences, 2)]
+        predicates = self.predicates(num_sentences, p_pronoun)
+        for subj, predicate in zip(subjects, predicates):
+            predicate.insert(0, subj)
+        return predicates
+
+    def predicates(self, num_predicates, p_pronoun=0.2) -> list:
+        """
+        Makes num_predicates predicates. The random numbers for the whole batch are drawn at once with
+        uniform_floats: one batch for the verb groups and one for their objects and endings.
+        """
+        p_pronoun = min(max(p_pronoun, 0), 1)
+        verbs = self._verbs
+        verb_table = self._verb_table
+        if verb_table is None:
+            verb_count = len(verbs)
+            verb_groups = [verbs[int(draw * verb_count)] for draw in uniform_floats(num_predicates, self._rng)]
+        else:
+            verb_groups = [verbs[verb_table.index_from(draw)] for draw in uniform_floats(num_predicates, self._rng)]
 
-            if new_obj not in objects or loop_count > max_loops_until_repeats_allowed:
+        draws = uniform_floats(sum(2 * verb_group.objects + 1 for verb_group in verb_groups), self._rng)
+        endings = self._endings
+        ending_count = len(endings)
+        position = 0
+        predicates = []
+        for verb_group in verb_groups:
+            objects = []
+            object_keys = set()
+            for object_position in range(verb_group.objects):
+                object_p_pronoun = p_pronoun if object_position == 0 else 0
+                new_obj = self._noun_or_pronoun_from(draws[position], draws[position + 1], object_p_pronoun,
+                                                     is_object=True)
+                position += 2
+                if word_key(new_obj) in object_keys:
+                    new_obj = self._new_noun(object_keys)
                 objects.append(new_obj)
-                object_position += 1
+                object_keys.add(word_key(new_obj))
+
+            predicate = self._template(verb_group).fill(objects)
+            predicate.append(endings[int(draws[position] * ending_count)])
+            position += 1
+            predicates.append(predicate)
+        return predicates
+
+    def _noun_or_pronoun_from(self, pronoun_draw, word_draw, p_pronoun, is_object=False):
+        if pronoun_draw < p_pronoun:
+            pronoun = self._pronouns[int(word_draw * len(self._pronouns))]
+            return pronoun.object() if is_object else pronoun.subject()
+        if self._noun_table is None:
+            return self._nouns[int(word_draw * len(self._nouns))]
+        return self._nouns[self._noun_table.index_from(word_draw)]
 
-            loop_count += 1
+    def _get_objects(self, object_count, p_pronoun, excluded=()):
+        excluded_keys = {word_key(word) for word in excluded}
+        object_keys = set()
+        objects = []
+        for object_position in range(object_count):
+            object_p_pronoun = p_pronoun if object_position == 0 else 0
+            new_obj = self._new_object(object_p_pronoun, excluded_keys | object_keys, object_keys)
+            object_keys.add(word_key(new_obj))
+            objects.append(new_obj)
         return objects
 
+    def _new_object(self, p_pronoun, used_keys, object_keys=frozenset()):
+        if self._rng.random() < p_pronoun:
+            pronouns = [pronoun for pronoun in self._pronouns if pronoun.subject() not in used_keys]
+            if pronouns:
+                return self._rng.choice(pronouns).object()
+        return self._new_noun(used_keys, object_keys)
+
+    def _new_noun(self, used_keys, object_keys=frozenset()):
+        """
+        A noun whose key is not in used_keys. The first draw is an ordinary one. If that noun is used, nouns
+        are drawn without replacement until one is not, so this takes at most one draw per used key plus one.
+        If every noun is used, returns one that is not in object_keys, or failing that, a repeat.
+        """
+        noun = _choose(self._nouns, self._noun_table, self._rng)
+        if word_key(noun) not in used_keys:
+            return noun
+        fallback = None
+        sampler = UniqueIndexSampler(len(self._nouns), self._rng)
+        while sampler:
+            candidate = self._nouns[sampler.draw()]
+            key = word_key(candidate)
+            if key not in used_keys:
+                return candidate
+            if fallback is None and key not in object_keys:
+                fallback = candidate
+        return noun if fallback is None else fallback
+
+    def distinct_subjects(self, count, p_pronoun=0.2) -> list:
+        """
+        count subjects with no two sharing a noun or pronoun pair, drawn without replacement. Pronoun pairs are
+        chosen with p_pronoun until either nouns or pronouns run out. Nouns are drawn uniformly, even if the
+        nouns are weighted.
+
+        :raises ValueError: if there are not count distinct subjects
+        """
+        p_pronoun = min(max(p_pronoun, 0), 1)
+        subject_pronouns = self._subject_pronouns
+        nouns = UniqueIndexSampler(len(self._nouns) if p_pronoun < 1 else 0, self._rng)
+        pronouns = UniqueIndexSampler(len(subject_pronouns) if p_pronoun > 0 else 0, self._rng)
+        if count > len(nouns) + len(pronouns):
+            raise ValueError('There are not {} distinct subjects.'.format(count))
+
+        used_keys = set()
+        subjects = []
+        while len(subjects) < count:
+            if pronouns and (not nouns or self._rng.random() < p_pronoun):
+                new_subj = subject_pronouns[pronouns.draw()]
+            elif nouns:
+                new_subj = self._nouns[nouns.draw()]
+            else:
+                raise ValueError('There are not {} distinct subjects.'.format(count))
+            key = word_key(new_subj)
+            if key not in used_keys:
+                used_keys.add(key)
+                subjects.append(new_subj)
+        return subjects
+
     def subject(self, p_pronoun):
-        if random.random() < p_pronoun:
-            return random.choice(self._pronouns).subject()
+        if self._rng.random() < p_pronoun:
+            return self._rng.choice(self._pronouns).subject()
         else:
-            return random.choice(self._nouns)
+            return _choose(self._nouns, self._noun_table, self._rng)
 
     def object(self, p_pronoun):
-        if random.random() < p_pronoun:
-            return random.choice(self._pronouns).object()
+        if self._rng.random() < p_pronoun:
+            return self._rng.choice(self._pronouns).object()
         else:
-            return random.choice(self._nouns)
+            return _choose(self._nouns, self._noun_table, self._rng)
+
+
+class _LexiconCounts(object):
+    """
+    The noun keys that RandomSentences has read so far, and the verb groups (with their alias table) that fit each
+    object count.
+    """
+    __slots__ = ('noun_keys', 'scanned', 'verbs_by_max_objects')
+
+    def __init__(self):
+        self.noun_keys = set()
+        self.scanned = 0
+        self.verbs_by_max_objects = {}
+
+
+class UniqueIndexSampler(object):
+    """
+    Draws the indices 0 to size - 1 in random order without replacement. Each draw is O(1): it is a
+    Fisher-Yates shuffle that only stores the positions it has swapped.
+    """
+    __slots__ = ('_size', '_swapped', '_rng')
+
+    def __init__(self, size, rng=None):
+        """:param rng: see random_streams.get_rng"""
+        self._size = size
+        self._swapped = {}
+        self._rng = get_rng(rng)
+
+    def __len__(self):
+        return self._size
+
+    def draw(self) -> int:
+        if not self._size:
+            raise ValueError('All indices have been drawn.')
+        position = self._rng.randrange(self._size)
+        self._size -= 1
+        last = self._size
+        index = self._swapped.get(position, position)
+        self._swapped[position] = self._swapped.pop(last, last)
+        return index
+
+
+def _get_alias_table(weights, words):
+    table = alias_table_or_none(weights)
+    if table is not None and len(table) != len(words):
+        raise ValueError('There must be one weight for each word.')
+    return table
+
+
+def _choose(words, alias_table, rng):
+    if alias_table is None:
+        return rng.choice(words)
+    return alias_table.choice(words, rng)
+
+
+def uniform_floats(count, rng=None) -> list:
+    """
+    count random floats in [0, 1), the same ones that count calls to rng.random() would give. If rng is a
+    GeneratorRandom, they are drawn from its NumPy Generator in one call.
+    """
+    rng = get_rng(rng)
+    if isinstance(rng, GeneratorRandom):
+        return rng.generator.random(count).tolist()
+    draw = rng.random
+    return [draw() for _ in range(count)]
+
+
+def _copy_if_list(words):
+    if isinstance(words, list):
+        return words[:]
+    return words
+
+
+def _verb_groups(verb_list):
+    if isinstance(verb_list, list):
+        return [as_verb_group(verb_group) for verb_group in verb_list]
+    return verb_list
+
+
+def _compile_templates(verbs) -> dict:
+    """
+    {VerbGroup: PredicateTemplate} for a verb list, made once when the words are loaded. Other sequences, such
+    as a MappedLexicon, are not read in full: their templates are made the first time each verb group is drawn.
+    """
+    if isinstance(verbs, list):
+        return {verb_group: predicate_template(verb_group) for verb_group in verbs}
+    return {}
 
 
 def assign_objects(verb_group, objects):
-    preposition = [verb_group['preposition']]
-    separable_particle = [verb_group['particle']]
-    predicate = [verb_group['verb']]
-
-    while objects:
-        obj = objects.pop()
-        if len(preposition) < 2:
-            preposition.append(obj)
-        elif isinstance(obj, Pronoun):
-            separable_particle.insert(0, obj)
-        else:
-            separable_particle.append(obj)
-    if does_preposition_precede_separable_particle(preposition, separable_particle):
-        answer = predicate + preposition + separable_particle
-    else:
-        answer = predicate + separable_particle + preposition
-
-    return [word for word in answer if word is not None]
-
-
-def does_preposition_precede_separable_particle(preposition, separable_particle):
-    lacks_preposition = None in preposition
-    only_separable_particle = (
-        None not in separable_particle and
-        all(word.has_tags(WordTag.SEPARABLE_PARTICLE) for word in separable_particle)
-    )
-    preposition_with_pronoun = any(isinstance(word, Pronoun) for word in preposition)
-    return lacks_preposition and only_separable_particle and preposition_with_pronoun
+    """:param verb_group: a VerbGroup or verb dict"""
+    return predicate_template(as_verb_group(verb_group)).fill(objects)
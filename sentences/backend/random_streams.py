@@ -0,0 +1,55 @@
+import hashlib
+import random
+
+
+def get_rng(rng=None):
+    """
+    :param rng: None for the random module itself (so random.seed still applies), a random.Random,
+                or a NumPy Generator
+    :return: an object with the random.Random methods used by this package
+    """
+    if rng is None:
+        return random
+    if not hasattr(rng, 'randrange') and hasattr(rng, 'integers'):
+        return GeneratorRandom(rng)
+    return rng
+
+
+def sub_stream(seed, index) -> random.Random:
+    """
+    An independent random.Random for one worker or paragraph. The same seed and index always give the same
+    stream, and no stream depends on how many numbers another one has drawn.
+    """
+    digest = hashlib.sha256('{}:{}'.format(seed, index).encode('utf-8')).digest()
+    return random.Random(int.from_bytes(digest, 'big'))
+
+
+class GeneratorRandom(object):
+    """The random.Random methods used by this package, drawn from a NumPy Generator."""
+    __slots__ = ('_generator',)
+
+    def __init__(self, generator):
+        self._generator = generator
+
+    @property
+    def generator(self):
+        return self._generator
+
+    def random(self) -> float:
+        return float(self._generator.random())
+
+    def randrange(self, start, stop=None) -> int:
+        if stop is None:
+            start, stop = 0, start
+        if stop <= start:
+            raise ValueError('empty range for randrange()')
+        return int(self._generator.integers(start, stop))
+
+    def choice(self, sequence):
+        if not len(sequence):
+            raise IndexError('Cannot choose from an empty sequence')
+        return sequence[self.randrange(len(sequence))]
+
+    def getrandbits(self, k) -> int:
+        byte_count = (k + 7) // 8
+        return int.from_bytes(self._generator.bytes(byte_count), 'big') >> (8 * byte_count - k)
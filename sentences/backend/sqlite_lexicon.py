@@ -0,0 +1,270 @@
+import sqlite3
+from array import array
+from collections.abc import Sequence
+
+from sentences.backend.loader import verbs, countable_nouns, uncountable_nouns, proper_nouns
+from sentences.backend.random_streams import get_rng
+from sentences.words.basicword import BasicWord
+from sentences.words.noun import Noun
+from sentences.words.verb import Verb
+from sentences.words.verbgroup import VerbGroup, as_verb_group
+from sentences.words.wordtools.tags import Tags
+from sentences.words.wordtools.wordtag import WordTag
+
+COUNTABLE = 'countable'
+UNCOUNTABLE = 'uncountable'
+PROPER = 'proper'
+PLURAL_PROPER = 'plural_proper'
+NOUN_KINDS = (COUNTABLE, UNCOUNTABLE, PROPER, PLURAL_PROPER)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS nouns (
+    id INTEGER PRIMARY KEY,
+    kind TEXT NOT NULL,
+    value TEXT NOT NULL,
+    irregular_plural TEXT NOT NULL,
+    base TEXT NOT NULL,
+    tags INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS nouns_by_kind ON nouns (kind, id);
+
+CREATE TABLE IF NOT EXISTS verbs (
+    id INTEGER PRIMARY KEY,
+    objects INTEGER NOT NULL,
+    has_preposition INTEGER NOT NULL,
+    has_particle INTEGER NOT NULL,
+    value TEXT NOT NULL,
+    irregular_past TEXT NOT NULL,
+    infinitive TEXT NOT NULL,
+    tags INTEGER NOT NULL,
+    preposition TEXT,
+    preposition_tags INTEGER,
+    particle TEXT,
+    particle_tags INTEGER
+);
+CREATE INDEX IF NOT EXISTS verbs_by_frame ON verbs (objects, has_preposition, has_particle, id);
+"""
+
+_NOUN_COLUMNS = 'value, irregular_plural, base, tags'
+_VERB_COLUMNS = ('value, irregular_past, infinitive, tags, objects, ' +
+                 'preposition, preposition_tags, particle, particle_tags')
+
+
+def noun_kind(noun) -> str:
+    if noun.has_tags(WordTag.UNCOUNTABLE):
+        return UNCOUNTABLE
+    if noun.has_tags(WordTag.PROPER, WordTag.PLURAL):
+        return PLURAL_PROPER
+    if noun.has_tags(WordTag.PROPER):
+        return PROPER
+    return COUNTABLE
+
+
+class SQLiteLexicon(object):
+    """
+    Word lists kept in a SQLite file, indexed by noun kind and by verb frame (number of objects, preposition,
+    separable particle). Words matching a kind or frame can be counted and sampled without building the
+    whole list.
+
+    The ids matching each kind or frame are read once and kept, so a random word is one lookup by id. They are
+    read again after a write from this connection or another one.
+    """
+    def __init__(self, filename, timeout=10.0, rng=None):
+        """
+        :param filename: path to the database or ':memory:'
+        :param timeout: seconds to wait for another writer to finish
+        :param rng: for random_noun and random_verb. see random_streams.get_rng
+        """
+        self._rng = get_rng(rng)
+        self._connection = sqlite3.connect(filename, timeout=timeout)
+        self._connection.executescript(_SCHEMA)
+        self._ids = {}
+        self._data_version = self._read_data_version()
+
+    def close(self):
+        self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def import_csvs(self, verbs_csv, countable_csv, uncountable_csv, proper_csv):
+        """Replaces all words with the contents of the CSVs, in one transaction."""
+        noun_list = countable_nouns(countable_csv) + uncountable_nouns(uncountable_csv) + proper_nouns(proper_csv)
+        verb_list = verbs(verbs_csv)
+        with self._connection:
+            self._connection.execute('DELETE FROM nouns')
+            self._connection.execute('DELETE FROM verbs')
+            self._insert_nouns(noun_list)
+            self._insert_verbs(verb_list)
+        self._ids.clear()
+
+    def add_nouns(self, nouns):
+        with self._connection:
+            self._insert_nouns(nouns)
+        self._ids.clear()
+
+    def add_verbs(self, verb_groups):
+        """:param verb_groups: VerbGroups or verb dicts"""
+        with self._connection:
+            self._insert_verbs(verb_groups)
+        self._ids.clear()
+
+    def _insert_nouns(self, nouns):
+        rows = ((noun_kind(noun), noun.value, noun.irregular_plural, noun.base_noun, noun.tags.mask)
+                for noun in nouns)
+        self._connection.executemany(
+            'INSERT INTO nouns (kind, {}) VALUES (?, ?, ?, ?, ?)'.format(_NOUN_COLUMNS), rows)
+
+    def _insert_verbs(self, verb_groups):
+        self._connection.executemany(
+            'INSERT INTO verbs (has_preposition, has_particle, {}) VALUES ({})'.format(
+                _VERB_COLUMNS, ', '.join('?' * 11)),
+            (_verb_row(verb_group) for verb_group in verb_groups))
+
+    def noun_count(self, kind=None) -> int:
+        where, parameters = _noun_filter(kind)
+        return self._connection.execute('SELECT COUNT(*) FROM nouns' + where, parameters).fetchone()[0]
+
+    def verb_count(self, objects=None, preposition=None, particle=None) -> int:
+        where, parameters = _verb_filter(objects, preposition, particle)
+        return self._connection.execute('SELECT COUNT(*) FROM verbs' + where, parameters).fetchone()[0]
+
+    def nouns(self, kind=None) -> list:
+        where, parameters = _noun_filter(kind)
+        query = 'SELECT {} FROM nouns{} ORDER BY id'.format(_NOUN_COLUMNS, where)
+        return [_make_noun(row) for row in self._connection.execute(query, parameters)]
+
+    def verbs(self, objects=None, preposition=None, particle=None) -> list:
+        """:return: VerbGroups"""
+        where, parameters = _verb_filter(objects, preposition, particle)
+        query = 'SELECT {} FROM verbs{} ORDER BY id'.format(_VERB_COLUMNS, where)
+        return [_make_verb_group(row) for row in self._connection.execute(query, parameters)]
+
+    def noun_list(self, kind=None):
+        """
+        :return: a read-only list of the nouns of kind, for RandomSentences. A noun is only read when it is indexed.
+                 The list keeps the nouns that matched when it was made.
+        """
+        where, parameters = _noun_filter(kind)
+        return SQLiteWordList(self, 'nouns', _NOUN_COLUMNS, self._row_ids('nouns', where, parameters), _make_noun)
+
+    def verb_list(self, objects=None, preposition=None, particle=None):
+        """
+        :return: a read-only list of the VerbGroups matching the frame, for RandomSentences. See random_verb and
+                 noun_list.
+        """
+        where, parameters = _verb_filter(objects, preposition, particle)
+        return SQLiteWordList(self, 'verbs', _VERB_COLUMNS, self._row_ids('verbs', where, parameters),
+                              _make_verb_group)
+
+    def random_noun(self, kind=None):
+        """:return: a random noun of kind (any kind if None), or None if there are none"""
+        where, parameters = _noun_filter(kind)
+        row = self._random_row('nouns', _NOUN_COLUMNS, where, parameters)
+        return None if row is None else _make_noun(row)
+
+    def random_verb(self, objects=None, preposition=None, particle=None):
+        """
+        :param objects: number of objects, or None for any
+        :param preposition: True/False to require or exclude a preposition, or None for either
+        :param particle: True/False to require or exclude a separable particle, or None for either
+        :return: a random VerbGroup matching the frame, or None if there are none
+        """
+        where, parameters = _verb_filter(objects, preposition, particle)
+        row = self._random_row('verbs', _VERB_COLUMNS, where, parameters)
+        return None if row is None else _make_verb_group(row)
+
+    def _random_row(self, table, columns, where, parameters):
+        ids = self._row_ids(table, where, parameters)
+        if not ids:
+            return None
+        return self._row(table, columns, ids[self._rng.randrange(len(ids))])
+
+    def _row(self, table, columns, row_id):
+        query = 'SELECT {} FROM {} WHERE id = ?'.format(columns, table)
+        return self._connection.execute(query, (row_id,)).fetchone()
+
+    def _row_ids(self, table, where, parameters):
+        data_version = self._read_data_version()
+        if data_version != self._data_version:
+            self._ids.clear()
+            self._data_version = data_version
+
+        key = (table, where, tuple(parameters))
+        ids = self._ids.get(key)
+        if ids is None:
+            query = 'SELECT id FROM {}{} ORDER BY id'.format(table, where)
+            ids = self._ids[key] = array('q', (row[0] for row in self._connection.execute(query, parameters)))
+        return ids
+
+    def _read_data_version(self):
+        return self._connection.execute('PRAGMA data_version').fetchone()[0]
+
+
+class SQLiteWordList(Sequence):
+    """A read-only list of the words with the given ids. Like MappedLexicon, an entry is only made when indexed."""
+    def __init__(self, lexicon, table, columns, ids, make_word):
+        self._lexicon = lexicon
+        self._table = table
+        self._columns = columns
+        self._ids = ids
+        self._make_word = make_word
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[position] for position in range(*index.indices(len(self._ids)))]
+        row = self._lexicon._row(self._table, self._columns, self._ids[index])
+        if row is None:
+            raise IndexError('word was removed from the lexicon')
+        return self._make_word(row)
+
+
+def _noun_filter(kind):
+    if kind is None:
+        return '', []
+    if kind not in NOUN_KINDS:
+        raise ValueError('{!r} is not one of: {}'.format(kind, ', '.join(NOUN_KINDS)))
+    return ' WHERE kind = ?', [kind]
+
+
+def _verb_filter(objects, preposition, particle):
+    conditions = []
+    parameters = []
+    for column, value in (('objects', objects), ('has_preposition', preposition), ('has_particle', particle)):
+        if value is not None:
+            conditions.append('{} = ?'.format(column))
+            parameters.append(int(value))
+    if not conditions:
+        return '', []
+    return ' WHERE ' + ' AND '.join(conditions), parameters
+
+
+def _verb_row(verb_group):
+    verb, preposition, objects, particle = as_verb_group(verb_group)
+    return (
+        preposition is not None, particle is not None,
+        verb.value, verb.irregular_past, verb.infinitive, verb.tags.mask, objects,
+        None if preposition is None else preposition.value, None if preposition is None else preposition.tags.mask,
+        None if particle is None else particle.value, None if particle is None else particle.tags.mask,
+    )
+
+
+def _make_noun(row):
+    value, irregular_plural, base, mask = row
+    return Noun(value, irregular_plural, base, Tags.from_mask(mask))
+
+
+def _make_verb_group(row):
+    value, irregular_past, infinitive, mask, objects, preposition, preposition_tags, particle, particle_tags = row
+    return VerbGroup(
+        Verb(value, irregular_past, infinitive, Tags.from_mask(mask)),
+        None if preposition is None else BasicWord(preposition, Tags.from_mask(preposition_tags)),
+        objects,
+        None if particle is None else BasicWord(particle, Tags.from_mask(particle_tags)),
+    )
@@ -0,0 +1,198 @@
+from array import array
+from bisect import bisect_right
+from threading import Lock
+
+from sentences.words.noun import Noun
+from sentences.words.verb import Verb
+from sentences.words.pronoun import AbstractPronoun, Pronoun, CapitalPronoun
+from sentences.words.punctuation import Punctuation
+from sentences.words.wordtools.tags import tags_to_mask
+from sentences.words.wordtools.wordtag import WordTag
+
+OTHER = 0
+NOUN = 1
+VERB = 2
+PRONOUN = 3
+PUNCTUATION = 4
+
+_PLURAL = tags_to_mask([WordTag.PLURAL])
+_FIRST_PERSON = frozenset([Pronoun.I, Pronoun.ME, CapitalPronoun.I, CapitalPronoun.ME])
+
+
+def word_kind(word) -> int:
+    if isinstance(word, Noun):
+        return NOUN
+    if isinstance(word, Verb):
+        return VERB
+    if isinstance(word, AbstractPronoun):
+        return PRONOUN
+    if isinstance(word, Punctuation):
+        return PUNCTUATION
+    return OTHER
+
+
+class Vocabulary(object):
+    """
+    Gives every distinct word an integer id, along with its kind and tag mask. A vocabulary only grows, and it
+    keeps its words alive, so by default each paragraph gets its own and its copies share it. Adding words is
+    locked, so a vocabulary can also be shared between threads.
+    """
+    def __init__(self):
+        self._words = []
+        self._ids = {}
+        self._kinds = array('b')
+        self._tags = array('q')
+        self._lock = Lock()
+
+    def __len__(self):
+        return len(self._words)
+
+    def id(self, word) -> int:
+        try:
+            return self._ids[word]
+        except KeyError:
+            pass
+        with self._lock:
+            new_id = self._ids.get(word)
+            if new_id is None:
+                new_id = len(self._words)
+                self._words.append(word)
+                self._kinds.append(word_kind(word))
+                self._tags.append(word.tags.mask)
+                self._ids[word] = new_id
+            return new_id
+
+    def find(self, word) -> int:
+        """:return: the id of word, or -1 if it has none. Unlike id, this never adds the word."""
+        return self._ids.get(word, -1)
+
+    def word(self, word_id):
+        return self._words[word_id]
+
+    def kind(self, word_id) -> int:
+        return self._kinds[word_id]
+
+    def tag_mask(self, word_id) -> int:
+        return self._tags[word_id]
+
+
+class TokenParagraph(object):
+    """
+    A paragraph as parallel arrays with one entry per word: vocabulary id, word kind and tag mask.
+    offsets holds the position of the first word of each sentence, followed by the total number of words.
+    verbs holds the position of the first verb of each sentence, or -1, and is kept up to date by set_word.
+    Word objects are only looked up when asked for.
+    """
+    __slots__ = ('vocabulary', 'ids', 'kinds', 'tags', 'offsets', 'verbs')
+
+    def __init__(self, vocabulary, ids, kinds, tags, offsets, verbs=None):
+        """:param verbs: if None, it is found from kinds"""
+        self.vocabulary = vocabulary
+        self.ids = ids
+        self.kinds = kinds
+        self.tags = tags
+        self.offsets = offsets
+        self.verbs = _first_positions(kinds, offsets, VERB) if verbs is None else verbs
+
+    @classmethod
+    def from_paragraph(cls, paragraph, vocabulary=None) -> 'TokenParagraph':
+        """:param vocabulary: if None, a new Vocabulary"""
+        if vocabulary is None:
+            vocabulary = Vocabulary()
+        ids = array('l')
+        offsets = array('l', [0])
+        for sentence in paragraph:
+            ids.extend(vocabulary.id(word) for word in sentence)
+            offsets.append(len(ids))
+        kinds = array('b', [vocabulary.kind(word_id) for word_id in ids])
+        tags = array('q', [vocabulary.tag_mask(word_id) for word_id in ids])
+        return cls(vocabulary, ids, kinds, tags, offsets)
+
+    def to_paragraph(self) -> list:
+        words = [self.vocabulary.word(word_id) for word_id in self.ids]
+        offsets = self.offsets
+        return [words[offsets[index]:offsets[index + 1]] for index in range(len(offsets) - 1)]
+
+    def copy(self) -> 'TokenParagraph':
+        return TokenParagraph(self.vocabulary, array('l', self.ids), array('b', self.kinds),
+                              array('q', self.tags), array('l', self.offsets), array('l', self.verbs))
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __eq__(self, other):
+        if not isinstance(other, TokenParagraph):
+            return False
+        return self.to_paragraph() == other.to_paragraph()
+
+    def span(self, sentence_index):
+        return self.offsets[sentence_index], self.offsets[sentence_index + 1]
+
+    def sentence(self, sentence_index) -> list:
+        start, end = self.span(sentence_index)
+        return [self.vocabulary.word(word_id) for word_id in self.ids[start:end]]
+
+    def set_sentence(self, sentence_index, words):
+        start, end = self.span(sentence_index)
+        if len(words) != end - start:
+            raise ValueError('New sentence must have the same number of words as the old one.')
+        for position, word in enumerate(words, start):
+            self.set_word(position, word)
+
+    def word(self, position):
+        return self.vocabulary.word(self.ids[position])
+
+    def set_word(self, position, word):
+        vocabulary = self.vocabulary
+        word_id = vocabulary.id(word)
+        old_kind = self.kinds[position]
+        new_kind = vocabulary.kind(word_id)
+        self.ids[position] = word_id
+        self.kinds[position] = new_kind
+        self.tags[position] = vocabulary.tag_mask(word_id)
+        if old_kind != new_kind and (old_kind == VERB or new_kind == VERB):
+            sentence_index = bisect_right(self.offsets, position) - 1
+            self.verbs[sentence_index] = self.find_kind(VERB, sentence_index)
+
+    def find_kind(self, kind, sentence_index) -> int:
+        """position of the first word of kind in the sentence, or -1"""
+        start, end = self.span(sentence_index)
+        kinds = self.kinds
+        for position in range(start, end):
+            if kinds[position] == kind:
+                return position
+        return -1
+
+    def verb_position(self, sentence_index) -> int:
+        """position of the first verb in the sentence, or -1"""
+        return self.verbs[sentence_index]
+
+    def subject_position(self, sentence_index) -> int:
+        """position of the word before the first verb, or -1 if there is no verb or it starts the sentence"""
+        verb_position = self.verbs[sentence_index]
+        if verb_position <= self.offsets[sentence_index]:
+            return -1
+        return verb_position - 1
+
+    def requires_third_person(self, sentence_index) -> bool:
+        """investigation_tools.requires_third_person, read from the kind and tag columns"""
+        position = self.subject_position(sentence_index)
+        if position == -1 or self.tags[position] & _PLURAL:
+            return False
+        kind = self.kinds[position]
+        if kind == PRONOUN:
+            return self.word(position) not in _FIRST_PERSON
+        return kind == NOUN
+
+
+def _first_positions(kinds, offsets, kind) -> array:
+    """position of the first word of kind in each sentence, or -1"""
+    kinds = kinds.tobytes()
+    code = bytes([kind])
+    return array('l', [kinds.find(code, offsets[index], offsets[index + 1]) for index in range(len(offsets) - 1)])
+
+
+def as_tokens(paragraph, vocabulary=None) -> TokenParagraph:
+    if isinstance(paragraph, TokenParagraph):
+        return paragraph.copy()
+    return TokenParagraph.from_paragraph(paragraph, vocabulary)
@@ -1,12 +1,26 @@
 from itertools import chain
 
+from sentences.backend.tokens import PUNCTUATION
 from sentences.words.punctuation import Punctuation
 
+_BOLD_PUNCTUATION = frozenset(value.bold() for value in Punctuation)
+
 
 def convert_paragraph(paragraph):
     return connect_words(flatten_paragraph(paragraph))
 
 
+def convert_tokens(tokens):
+    word = tokens.vocabulary.word
+    answer = ''
+    for word_id, kind in zip(tokens.ids, tokens.kinds):
+        current = word(word_id)
+        if kind == PUNCTUATION or current in _BOLD_PUNCTUATION:
+            answer = answer.rstrip()
+        answer += current.value + ' '
+    return answer.rstrip()
+
+
 def flatten_paragraph(paragraph):
     return list(chain.from_iterable(paragraph))
 
@@ -24,5 +38,4 @@ def is_punctuation(word):
     if isinstance(word, Punctuation):
         return True
 
-    bolds = [value.bold() for value in Punctuation]
-    return word in bolds
+    return word in _BOLD_PUNCTUATION
@@ -45,6 +45,7 @@ class MainFrame(tk.Tk):
         except tk.TclError:
             pass
 
+        self._config_state = {}
         self.frames = self._pack_set_variable_frames()
         self.load_config()
 
@@ -137,6 +138,7 @@ class MainFrame(tk.Tk):
         except ConfigFileError as error:
             self.revert_to_original()
             raise ConfigFileError(error.args[0])
+        self._config_state = loader.state
 
     def export_config_file(self):
         filename = asksaveasfilename(initialdir=self.get_state()['home_directory'], title='select .cfg file',
@@ -149,7 +151,11 @@ class MainFrame(tk.Tk):
         save_config(self.get_state())
 
     def get_state(self):
-        answer = {}
+        """
+        The loaded config, with the values in the frames in place of the loaded ones. Options that no frame
+        shows, such as 'seed', keep their loaded values, so they reach the generator and are saved unchanged.
+        """
+        answer = self._config_state.copy()
         for frame in self.frames:
             answer.update(frame.get_values())
         return answer
@@ -161,7 +167,7 @@ class MainFrame(tk.Tk):
         font_size = state['font_size']
 
         self.paragraph_generator.update_options(state)
-        self.paragraph_generator.load_lists_from_file()
+        self.paragraph_generator.reload_changed_files()
         answer, error = self.paragraph_generator.create_answer_and_error_paragraphs()
         create_pdf(state['save_directory'], answer, error,
                    error_font_size=font_size, named_prefix=file_prefix)
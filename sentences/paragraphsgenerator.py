@@ -1,13 +1,54 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+
+from sentences import LoaderError
+
+from sentences.backend.alias_table import alias_table_or_none
 from sentences.backend.errormaker import ErrorMaker
 from sentences.backend.grammarizer import Grammarizer
+from sentences.backend.predicate_bank import PredicateBank
 from sentences.backend.random_paragraph import RandomParagraph
-from sentences.backend.wordconnector import convert_paragraph
-from sentences.backend.loader import verbs, uncountable_nouns, countable_nouns, proper_nouns
+from sentences.backend.random_sentences import RandomSentences
+from sentences.backend.random_streams import get_rng, sub_stream
+from sentences.backend.wordconnector import convert_tokens
+from sentences.backend.lexicon_cache import (LexiconCache, lexicon_signatures, updated_signature, is_same_contents,
+                                             file_signature, CACHE_FILENAME)
+from sentences.backend.loader import verbs, uncountable_nouns, countable_nouns, proper_nouns, irregular_forms
+from sentences.words.wordtools.morphology import ENGLISH
+
+WORD_FILE_LOADERS = {
+    'verbs': verbs,
+    'countable_nouns': countable_nouns,
+    'uncountable_nouns': uncountable_nouns,
+    'proper_nouns': proper_nouns,
+}
+
+
+def _timed_load(key, filename):
+    start = perf_counter()
+    words_and_weights = WORD_FILE_LOADERS[key](filename, weighted=True)
+    return words_and_weights, perf_counter() - start
+
+
+def _raise_loader_errors(errors, filenames):
+    """
+    :param errors: [(word file key, LoaderError)]
+    :param filenames: {word file key: filename}
+
+    Each error is reported with the key and file it came from.
+    """
+    lines = ['{} ({}): {}'.format(key, filenames[key], error.args[0]) for key, error in errors]
+    if len(errors) == 1:
+        raise LoaderError(lines[0]) from errors[0][1]
+    if errors:
+        raise LoaderError('Could not load {} word files:\n{}'.format(len(errors), '\n'.join(lines)))
 
 
 class ParagraphsGenerator(object):
-    def __init__(self, config_state):
+    def __init__(self, config_state, rng=None):
         """
+        :param rng: used for paragraphs when there is no seed. see random_streams.get_rng
 
         :config_state required keys:
         - 'countable_nouns'
@@ -15,6 +56,11 @@ class ParagraphsGenerator(object):
         - 'proper_nouns'
         - 'verbs'
 
+        optional keys:
+        - 'irregulars': a CSV of irregular forms. They replace ENGLISH's irregulars, which every word in the process
+          uses, so only one set of irregulars is in use at a time. see _load_irregulars
+        - 'home_directory': if set, loaded word lists are cached here
+
         - 'error_probability'
         - 'noun_errors'
         - 'pronoun_errors'
@@ -33,18 +79,145 @@ class ParagraphsGenerator(object):
         - 'subject_pool'
         - 'num_paragraphs'
         - 'paragraph_size'
+        - 'seed': if not None, each paragraph from create_answer_and_error_paragraphs gets its own random
+          stream from the seed and its position, so the same seed always makes the same paragraphs.
+        - 'predicate_bank': if set, create_answer_and_error_paragraphs makes this many predicates at a time and
+          shares them between its paragraphs.
+        - 'predicate_uses': how many times each predicate in the bank can be used. default is 1.
         """
+        self._rng = get_rng(rng)
         self._options = {}
         self._verbs_list = []
         self._nouns_list = []
+        self._verb_weights = None
+        self._noun_weights = None
+        self._word_maker = None
+        self._word_lists = {}
+        self._signatures = {}
+        self._irregulars_signature = None
+        self._load_times = {}
         self.update_options(config_state)
 
+    @property
+    def load_times(self):
+        """{word file key: seconds} for each file read from CSV by the last load or reload"""
+        return self._load_times.copy()
+
     def load_lists_from_file(self):
-        self._verbs_list = verbs(self._options['verbs'])
+        self._load_irregulars()
 
-        self._nouns_list = countable_nouns(self._options['countable_nouns'])
-        self._nouns_list += uncountable_nouns(self._options['uncountable_nouns'])
-        self._nouns_list += proper_nouns(self._options['proper_nouns'])
+        filenames = self._get_filenames()
+        signatures = lexicon_signatures(filenames)
+        cache = self._get_lexicon_cache()
+        lists = cache.load(signatures) if cache else None
+        if lists is None:
+            self._load_word_lists(list(WORD_FILE_LOADERS), filenames, signatures)
+        else:
+            self._load_times = {}
+            self._set_word_lists(lists, signatures)
+
+    def reload_changed_files(self):
+        """
+        Reloads only the word files whose contents changed since they were loaded. Files are checked with
+        stat and only hashed if the stat changed.
+
+        :return: the keys of the reloaded files
+        """
+        filenames = self._get_filenames()
+        signatures = {key: updated_signature(filenames[key], self._signatures.get(key)) for key in filenames}
+        changed = [key for key in WORD_FILE_LOADERS
+                   if key not in self._word_lists or not is_same_contents(signatures[key], self._signatures[key])]
+        if changed:
+            self._load_word_lists(changed, filenames, signatures)
+        else:
+            self._load_times = {}
+            self._signatures = signatures
+
+        if self._is_irregulars_changed():
+            self._load_irregulars()
+            changed.append('irregulars')
+        return changed
+
+    def _load_irregulars(self):
+        """
+        Replaces the irregulars in ENGLISH with the ones from the 'irregulars' file. If it is not set, ENGLISH is
+        only reset if this generator loaded irregulars before, so a generator without the option does not wipe
+        another generator's irregulars. ENGLISH is shared by every word in the process, so there is one set of
+        irregulars at a time: generators with different 'irregulars' files use whichever was loaded last.
+        """
+        filename = self._options.get('irregulars')
+        if filename:
+            ENGLISH.set_irregulars(irregular_forms(filename))
+        elif self._irregulars_signature is not None:
+            ENGLISH.set_irregulars(())
+        self._irregulars_signature = file_signature(filename) if filename else None
+
+    def _is_irregulars_changed(self):
+        filename = self._options.get('irregulars')
+        if not filename:
+            return self._irregulars_signature is not None
+        signature = updated_signature(filename, self._irregulars_signature)
+        if not is_same_contents(signature, self._irregulars_signature):
+            return True
+        self._irregulars_signature = signature
+        return False
+
+    def _get_filenames(self):
+        return {key: self._options[key] for key in WORD_FILE_LOADERS}
+
+    def _load_word_lists(self, keys, filenames, signatures):
+        """Loads the files for keys at the same time. If any fail, raises one LoaderError for all of them."""
+        with ThreadPoolExecutor(max_workers=len(keys)) as executor:
+            futures = {key: executor.submit(_timed_load, key, filenames[key]) for key in keys}
+
+        lists = self._word_lists.copy()
+        load_times = {}
+        errors = []
+        for key, future in futures.items():
+            try:
+                lists[key], load_times[key] = future.result()
+            except LoaderError as error:
+                errors.append((key, error))
+        _raise_loader_errors(errors, filenames)
+
+        self._load_times = load_times
+        self._set_word_lists(lists, signatures)
+        cache = self._get_lexicon_cache()
+        if cache:
+            cache.save(signatures, lists)
+
+    def _set_word_lists(self, lists, signatures):
+        """:param lists: {word file key: (words, weights)}"""
+        self._word_lists = lists
+        self._signatures = signatures
+
+        self._verbs_list, verb_weights = lists['verbs']
+        self._verb_weights = alias_table_or_none(verb_weights)
+
+        self._nouns_list = []
+        noun_weights = []
+        for key in ('countable_nouns', 'uncountable_nouns', 'proper_nouns'):
+            words, weights = lists[key]
+            self._nouns_list += words
+            noun_weights += weights
+        self._noun_weights = alias_table_or_none(noun_weights)
+        self._word_maker = None
+
+    def _get_word_maker(self):
+        """
+        One RandomSentences for the loaded lists. Each paragraph and predicate bank uses it with its own rng,
+        so the lists are not copied and checked again for every paragraph.
+        """
+        if self._word_maker is None:
+            self._word_maker = RandomSentences(self._verbs_list, self._nouns_list,
+                                               self._verb_weights, self._noun_weights, self._rng)
+        return self._word_maker
+
+    def _get_lexicon_cache(self):
+        home_directory = self._options.get('home_directory')
+        if not home_directory or not os.path.isdir(home_directory):
+            return None
+        return LexiconCache(os.path.join(home_directory, CACHE_FILENAME))
 
     def update_options(self, dictionary):
         reload_lists = self._is_reload_required(dictionary)
@@ -57,29 +230,45 @@ class ParagraphsGenerator(object):
         if any(word_list == [] for word_list in all_word_lists):
             return True
 
-        file_keys = [key for key in ('verbs', 'countable_nouns', 'uncountable_nouns', 'proper_nouns')
-                     if key in dictionary]
+        file_keys = [key for key in list(WORD_FILE_LOADERS) + ['irregulars'] if key in dictionary]
         if not file_keys:
             return False
-        return any(dictionary[key] != self._options[key] for key in file_keys)
+        return any(dictionary[key] != self._options.get(key) for key in file_keys)
 
-    def create_paragraph(self):
-        paragraph_generator = self._create_paragraph_generator()
+    def create_paragraph(self, rng=None):
+        return self._create_paragraph_tokens(self._get_rng(rng)).to_paragraph()
+
+    def _get_rng(self, rng):
+        return self._rng if rng is None else get_rng(rng)
+
+    def _create_paragraph_tokens(self, rng, predicate_bank=None):
+        paragraph_generator = self._create_paragraph_generator(rng, predicate_bank)
         paragraph_size = self._options['paragraph_size']
         if self._options['paragraph_type'] == 'pool':
             subj_pool = self._options['subject_pool']
-            raw_paragraph = paragraph_generator.create_pool_paragraph(subj_pool, paragraph_size)
+            raw_paragraph = paragraph_generator.iter_pool_paragraph(subj_pool, paragraph_size)
         else:
-            raw_paragraph = paragraph_generator.create_chain_paragraph(paragraph_size)
+            raw_paragraph = paragraph_generator.iter_chain_paragraph(paragraph_size)
 
         present_tense = self._get_present_tense_bool()
         kwargs = self._get_kwargs('probability_plural_noun', 'probability_negative_verb')
-        grammarizer = Grammarizer(raw_paragraph, present_tense=present_tense, **kwargs)
-        return grammarizer.generate_paragraph()
+        grammarizer = Grammarizer(raw_paragraph, present_tense=present_tense, rng=rng, **kwargs)
+        return grammarizer.generate_tokens()
 
-    def _create_paragraph_generator(self):
+    def _create_paragraph_generator(self, rng, predicate_bank=None):
         probability_pronoun = self._options['probability_pronoun']
-        return RandomParagraph(probability_pronoun, self._verbs_list, self._nouns_list)
+        return RandomParagraph.from_word_maker(probability_pronoun, self._get_word_maker().with_rng(rng),
+                                               predicate_bank)
+
+    def _create_predicate_bank(self):
+        """:return: a PredicateBank for one batch of paragraphs, or None if 'predicate_bank' is not set"""
+        size = self._options.get('predicate_bank')
+        if not size:
+            return None
+        seed = self._options.get('seed')
+        rng = self._rng if seed is None else sub_stream(seed, 'predicate_bank')
+        return PredicateBank(self._get_word_maker().with_rng(rng), self._options['probability_pronoun'], size,
+                             self._options.get('predicate_uses', 1), rng)
 
     def _get_present_tense_bool(self):
         return self._options['tense'] == 'simple_present'
@@ -87,9 +276,11 @@ class ParagraphsGenerator(object):
     def _get_kwargs(self, *keys):
         return {key: self._options[key] for key in keys}
 
-    def create_answer_and_error_texts(self):
-        paragraph = self.create_paragraph()
-        error_maker = ErrorMaker(paragraph, p_error=self._options['error_probability'])
+    def create_answer_and_error_texts(self, rng=None, predicate_bank=None):
+        """:param predicate_bank: if not None, a PredicateBank that the paragraph takes its predicates from"""
+        rng = self._get_rng(rng)
+        paragraph = self._create_paragraph_tokens(rng, predicate_bank)
+        error_maker = ErrorMaker(paragraph, p_error=self._options['error_probability'], rng=rng)
 
         options_keys = {
             error_maker.create_noun_errors: 'noun_errors',
@@ -104,15 +295,22 @@ class ParagraphsGenerator(object):
                 method()
 
         error_count = ' -- error count: {}'
-        answer = convert_paragraph(error_maker.answer_paragraph) + error_count.format(error_maker.error_count)
-        error = convert_paragraph(error_maker.error_paragraph)
+        answer = convert_tokens(error_maker.answer_tokens) + error_count.format(error_maker.error_count)
+        error = convert_tokens(error_maker.error_tokens)
         return answer, error
 
     def create_answer_and_error_paragraphs(self):
         answers = []
         errors = []
-        for _ in range(self._options['num_paragraphs']):
-            answer, error = self.create_answer_and_error_texts()
+        predicate_bank = self._create_predicate_bank()
+        for index in range(self._options['num_paragraphs']):
+            answer, error = self.create_answer_and_error_texts(self._paragraph_rng(index), predicate_bank)
             answers.append(answer)
             errors.append(error)
         return answers, errors
+
+    def _paragraph_rng(self, index):
+        seed = self._options.get('seed')
+        if seed is None:
+            return None
+        return sub_stream(seed, index)
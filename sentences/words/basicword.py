@@ -1,15 +1,19 @@
 from sentences.words.wordtools.abstractword import AbstractWord
+from sentences.words.wordtools.interning import InternedWord
 from sentences.words.wordtools.tags import Tags
 from sentences.words.wordtools.wordtag import WordTag
 from sentences.words.wordtools.common_functions import bold
 
 
-class BasicWord(AbstractWord):
+class BasicWord(AbstractWord, metaclass=InternedWord):
+    __slots__ = ('_value', '_tags', '_hash', '__weakref__')
+
     def __init__(self, value, tags=None):
         self._value = value
         if tags is None:
             tags = Tags()
         self._tags = tags
+        self._hash = hash((value, tags))
 
     @classmethod
     def preposition(cls, value):
@@ -25,7 +29,7 @@ class BasicWord(AbstractWord):
 
     @property
     def tags(self):
-        return self._tags.copy()
+        return self._tags
 
     def capitalize(self):
         new_value = self.value[0].upper() + self.value[1:]
@@ -38,13 +42,27 @@ class BasicWord(AbstractWord):
     def bold(self):
         return BasicWord(bold(self.value), self.tags)
 
+    def intern_key(self):
+        return (self.__class__, self.value, self.tags)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return self.__class__, (self.value, self.tags)
+
     def __repr__(self):
         return '{}({!r}, {!r})'.format(self.__class__.__name__, self.value, self.tags)
 
     def __hash__(self):
-        return hash('hash of {!r}'.format(self))
+        return self._hash
 
     def __eq__(self, other):
-        if not isinstance(other, BasicWord):
+        if self is other:
+            return True
+        if not isinstance(other, BasicWord) or self._hash != other._hash:
             return False
-        return (self.value, self.tags) == (other.value, other.tags)
+        return (self._value, self._tags) == (other._value, other._tags)
@@ -1,10 +1,15 @@
 from sentences.words.wordtools.abstractword import AbstractWord
-from sentences.words.wordtools.common_functions import add_s, bold
+from sentences.words.wordtools.inflections import CachedInflections
+from sentences.words.wordtools.interning import InternedWord
+from sentences.words.wordtools.common_functions import bold
+from sentences.words.wordtools.morphology import ENGLISH
 from sentences.words.wordtools.wordtag import WordTag
 from sentences.words.wordtools.tags import Tags
 
 
-class Noun(AbstractWord):
+class Noun(AbstractWord, CachedInflections, metaclass=InternedWord):
+    __slots__ = ('_value', '_irregular', '_base', '_tags', '_hash', '_forms', '__weakref__')
+
     def __init__(self, value, irregular_plural='', base='', tags=None):
         self._value = value
         self._irregular = irregular_plural
@@ -14,7 +19,9 @@ class Noun(AbstractWord):
 
         if not tags:
             tags = Tags()
-        self._tags = tags.copy()
+        self._tags = tags
+        self._hash = hash((value, irregular_plural, base, tags))
+        self._forms = None
 
     @classmethod
     def uncountable_noun(cls, value):
@@ -41,13 +48,27 @@ class Noun(AbstractWord):
 
     @property
     def tags(self):
-        return self._tags.copy()
+        return self._tags
 
     def __eq__(self, other):
-        if not isinstance(other, Noun):
+        if self is other:
+            return True
+        if not isinstance(other, Noun) or self._hash != other._hash:
             return False
-        return ((self.value, self.irregular_plural, self.base_noun, self.tags) ==
-                (other.value, other.irregular_plural, other.base_noun, other.tags))
+        return ((self._value, self._irregular, self._base, self._tags) ==
+                (other._value, other._irregular, other._base, other._tags))
+
+    def intern_key(self):
+        return (self.__class__, self.value, self.irregular_plural, self.base_noun, self.tags)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return self.__class__, (self.value, self.irregular_plural, self.base_noun, self.tags)
 
     def __repr__(self):
         return '{}({!r}, {!r}, {!r}, {!r})'.format(
@@ -55,9 +76,12 @@ class Noun(AbstractWord):
         )
 
     def __hash__(self):
-        return hash('hash of {!r}'.format(self))
+        return self._hash
 
     def capitalize(self):
+        return self._inflection('capitalize', Noun._make_capitalized)
+
+    def _make_capitalized(self):
         new_value = self.value[0].upper() + self.value[1:]
         return Noun(new_value, self.irregular_plural, self.base_noun, self.tags)
 
@@ -72,6 +96,9 @@ class Noun(AbstractWord):
         return Noun(bold(self.value), self.irregular_plural, self.base_noun, self.tags)
 
     def definite(self):
+        return self._inflection('definite', Noun._make_definite)
+
+    def _make_definite(self):
         if self.has_tags(WordTag.DEFINITE):
             return self
         new_value = 'the ' + self.value
@@ -79,6 +106,9 @@ class Noun(AbstractWord):
         return Noun(new_value, self.irregular_plural, self.base_noun, new_tags)
 
     def indefinite(self):
+        return self._inflection('indefinite', Noun._make_indefinite)
+
+    def _make_indefinite(self):
         if self.has_tags(WordTag.INDEFINITE):
             return self
         article = 'a '
@@ -87,6 +117,9 @@ class Noun(AbstractWord):
         return Noun(article + self.value, self.irregular_plural, self.base_noun, Tags([WordTag.INDEFINITE]))
 
     def plural(self):
+        return self._inflection('plural', Noun._make_plural)
+
+    def _make_plural(self):
         if self.has_tags(WordTag.PLURAL):
             return self
 
@@ -94,20 +127,46 @@ class Noun(AbstractWord):
         if not self.irregular_plural:
             return Noun(get_plural_value(self.value), self.irregular_plural, self.base_noun, new_tags)
 
-        new_value = get_article(self.value) + self.irregular_plural
+        new_value = _replace_word(self.value, lambda word: self.irregular_plural)
         return Noun(new_value, self.irregular_plural, self.base_noun, new_tags)
 
     def to_basic_noun(self):
+        return self._inflection('basic', Noun._make_basic)
+
+    def _make_basic(self):
         return Noun(self.base_noun, self.irregular_plural)
 
+    def paradigm(self):
+        """
+        The forms of this word's basic noun, keyed by:
+        'basic', 'plural', 'definite', 'indefinite', 'plural_definite', 'plural_indefinite'.
+        Every form is built once per word and then looked up.
+        """
+        basic = self.to_basic_noun()
+        plural = basic.plural()
+        return {
+            'basic': basic,
+            'plural': plural,
+            'definite': basic.definite(),
+            'indefinite': basic.indefinite(),
+            'plural_definite': plural.definite(),
+            'plural_indefinite': plural.indefinite(),
+        }
+
 
 def get_plural_value(value):
-    if value.endswith('ife'):
-        return value[:-3] + 'ives'
-    elif any(value.endswith('{}f'.format(ending)) for ending in ('al', 'el', 'ar', 'ea', 'ol')):
-        return value[:-1] + 'ves'
-    else:
-        return add_s(value)
+    """Irregulars are looked up without an article or a capital letter, which are then put back."""
+    return _replace_word(value, lambda word: ENGLISH.inflect('plural', word))
+
+
+def _replace_word(value, make_word):
+    """:return: value with its word, after any article, replaced by make_word(word) and its capital kept"""
+    article = get_article(value)
+    word = value[len(article):]
+    if not word[:1].isupper():
+        return article + make_word(word)
+    new_word = make_word(word[0].lower() + word[1:])
+    return article + new_word[:1].upper() + new_word[1:]
 
 
 def get_article(value):
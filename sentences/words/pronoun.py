@@ -1,8 +1,15 @@
 from enum import Enum
+from functools import lru_cache
 
 from sentences.words.basicword import BasicWord
+from sentences.words.wordtools.tags import Tags
 from sentences.words.wordtools.wordtag import WordTag
 
+_PLURAL_NAMES = frozenset(['YOU', 'WE', 'US', 'THEY', 'THEM'])
+_PLURAL_TAGS = Tags([WordTag.PLURAL])
+_NO_TAGS = Tags()
+_PAIR_NAMES = (('I', 'ME'), ('HE', 'HIM'), ('SHE', 'HER'), ('WE', 'US'), ('THEY', 'THEM'))
+
 
 class AbstractPronoun(Enum):
     def capitalize(self):
@@ -15,34 +22,24 @@ class AbstractPronoun(Enum):
         return BasicWord(self.value).bold()
 
     def object(self):
-        changes = {self.I: self.ME,
-                   self.HE: self.HIM,
-                   self.SHE: self.HER,
-                   self.WE: self.US,
-                   self.THEY: self.THEM}
-        if self in changes:
-            return changes[self]
-        return self
+        return _pair_maps(type(self))[0].get(self, self)
 
     def subject(self):
-        changes = {self.ME: self.I,
-                   self.HIM: self.HE,
-                   self.HER: self.SHE,
-                   self.US: self.WE,
-                   self.THEM: self.THEY}
-        if self in changes:
-            return changes[self]
-        return self
+        return _pair_maps(type(self))[1].get(self, self)
 
     def is_pair(self, other):
         if not isinstance(other, AbstractPronoun):
             return False
         return self.subject() == other.subject()
 
+    @property
+    def tags(self):
+        if self.name in _PLURAL_NAMES:
+            return _PLURAL_TAGS
+        return _NO_TAGS
+
     def has_tags(self, *tags):
-        if tags == (WordTag.PLURAL,) and self in (self.YOU, self.WE, self.US, self.THEY, self.THEM):
-            return True
-        return False
+        return self.tags.has_all(*tags)
 
 
 class Pronoun(AbstractPronoun):
@@ -97,3 +94,15 @@ class CapitalPronoun(AbstractPronoun):
 
     def de_capitalize(self):
         return getattr(Pronoun, self.name)
+
+
+@lru_cache(maxsize=None)
+def _pair_maps(pronoun_class):
+    """({subject: object}, {object: subject}) for the members of pronoun_class"""
+    objects = {}
+    subjects = {}
+    for subject_name, object_name in _PAIR_NAMES:
+        subject, obj = getattr(pronoun_class, subject_name), getattr(pronoun_class, object_name)
+        objects[subject] = obj
+        subjects[obj] = subject
+    return objects, subjects
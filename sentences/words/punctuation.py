@@ -1,6 +1,9 @@
 from enum import Enum
 
 from sentences.words.basicword import BasicWord
+from sentences.words.wordtools.tags import Tags
+
+_NO_TAGS = Tags()
 
 
 class Punctuation(Enum):
@@ -12,9 +15,13 @@ class Punctuation(Enum):
     def bold(self):
         return BasicWord(self.value).bold()
 
+    @property
+    def tags(self):
+        return _NO_TAGS
+
     @staticmethod
     def has_tags(*tags):
-        return False
+        return _NO_TAGS.has_all(*tags)
 
     def capitalize(self):
         return self
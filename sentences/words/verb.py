@@ -1,10 +1,15 @@
 from sentences.words.wordtools.abstractword import AbstractWord
+from sentences.words.wordtools.inflections import CachedInflections
+from sentences.words.wordtools.interning import InternedWord
 from sentences.words.wordtools.tags import Tags
 from sentences.words.wordtools.wordtag import WordTag
-from sentences.words.wordtools.common_functions import add_s, add_ed, bold
+from sentences.words.wordtools.common_functions import bold
+from sentences.words.wordtools.morphology import ENGLISH
 
 
-class Verb(AbstractWord):
+class Verb(AbstractWord, CachedInflections, metaclass=InternedWord):
+    __slots__ = ('_value', '_irregular_past', '_inf', '_tags', '_hash', '_forms', '__weakref__')
+
     def __init__(self, value, irregular_past='', infinitive='', tags=None):
         self._value = value
         self._irregular_past = irregular_past
@@ -14,7 +19,9 @@ class Verb(AbstractWord):
 
         if tags is None:
             tags = Tags()
-        self._tags = tags.copy()
+        self._tags = tags
+        self._hash = hash((value, irregular_past, infinitive, tags))
+        self._forms = None
 
     @property
     def value(self):
@@ -30,13 +37,27 @@ class Verb(AbstractWord):
 
     @property
     def tags(self):
-        return self._tags.copy()
+        return self._tags
 
     def __eq__(self, other):
-        if not isinstance(other, Verb):
+        if self is other:
+            return True
+        if not isinstance(other, Verb) or self._hash != other._hash:
             return False
-        return ((self.value, self.irregular_past, self.infinitive, self.tags) ==
-                (other.value, other.irregular_past, other.infinitive, other.tags))
+        return ((self._value, self._irregular_past, self._inf, self._tags) ==
+                (other._value, other._irregular_past, other._inf, other._tags))
+
+    def intern_key(self):
+        return (self.__class__, self.value, self.irregular_past, self.infinitive, self.tags)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return self.__class__, (self.value, self.irregular_past, self.infinitive, self.tags)
 
     def __repr__(self):
         return '{}({!r}, {!r}, {!r}, {!r})'.format(
@@ -44,9 +65,12 @@ class Verb(AbstractWord):
         )
 
     def __hash__(self):
-        return hash('hash of {!r}'.format(self))
+        return self._hash
 
     def capitalize(self):
+        return self._inflection('capitalize', Verb._make_capitalized)
+
+    def _make_capitalized(self):
         new_value = self.value[0].upper() + self.value[1:]
         return Verb(new_value, self.irregular_past, self.infinitive, self.tags)
 
@@ -58,6 +82,9 @@ class Verb(AbstractWord):
         return Verb(bold(self.value), self.irregular_past, self.infinitive, self.tags)
 
     def past_tense(self):
+        return self._inflection('past', Verb._make_past_tense)
+
+    def _make_past_tense(self):
         if self.has_tags(WordTag.PAST):
             return self
 
@@ -67,10 +94,13 @@ class Verb(AbstractWord):
 
         past_tense_value = self.irregular_past
         if not past_tense_value:
-            past_tense_value = add_ed(self.infinitive)
+            past_tense_value = ENGLISH.inflect('past', self.infinitive)
         return Verb(past_tense_value, self.irregular_past, self.infinitive, new_tags)
 
     def third_person(self):
+        return self._inflection('third_person', Verb._make_third_person)
+
+    def _make_third_person(self):
         if self.has_tags(WordTag.THIRD_PERSON):
             return self
 
@@ -78,12 +108,13 @@ class Verb(AbstractWord):
         if self.has_tags(WordTag.NEGATIVE):
             return Verb("doesn't " + self.infinitive, self.irregular_past, self.infinitive, new_tags)
 
-        with_s = add_s(self.infinitive)
-        if with_s == 'haves':
-            with_s = 'has'
+        with_s = ENGLISH.inflect('third_person', self.infinitive)
         return Verb(with_s, self.irregular_past, self.infinitive, new_tags)
 
     def negative(self):
+        return self._inflection('negative', Verb._make_negative)
+
+    def _make_negative(self):
         if self.has_tags(WordTag.NEGATIVE):
             return self
         new_tags = self.tags.add(WordTag.NEGATIVE)
@@ -95,4 +126,24 @@ class Verb(AbstractWord):
         return Verb(negative + self.infinitive, self.irregular_past, self.infinitive, new_tags)
 
     def to_basic_verb(self):
+        return self._inflection('basic', Verb._make_basic)
+
+    def _make_basic(self):
         return Verb(self.infinitive, self.irregular_past)
+
+    def paradigm(self):
+        """
+        The forms of this word's basic verb, keyed by:
+        'basic', 'third_person', 'past', 'negative', 'negative_third_person', 'negative_past'.
+        Every form is built once per word and then looked up.
+        """
+        basic = self.to_basic_verb()
+        negative = basic.negative()
+        return {
+            'basic': basic,
+            'third_person': basic.third_person(),
+            'past': basic.past_tense(),
+            'negative': negative,
+            'negative_third_person': negative.third_person(),
+            'negative_past': negative.past_tense(),
+        }
@@ -0,0 +1,24 @@
+from typing import NamedTuple, Optional
+
+from sentences.words.basicword import BasicWord
+from sentences.words.verb import Verb
+
+
+class VerbGroup(NamedTuple):
+    """A verb with the preposition, number of objects and separable particle that it takes."""
+    verb: Verb
+    preposition: Optional[BasicWord] = None
+    objects: int = 1
+    particle: Optional[BasicWord] = None
+
+
+def as_verb_group(verb_group) -> VerbGroup:
+    """
+    :param verb_group: a VerbGroup, a dict with the keys 'verb', 'preposition', 'objects' and 'particle', or a
+                       Verb, which takes one object and no preposition or particle
+    """
+    if isinstance(verb_group, Verb):
+        return VerbGroup(verb_group)
+    if isinstance(verb_group, dict):
+        return VerbGroup(verb_group['verb'], verb_group['preposition'], verb_group['objects'], verb_group['particle'])
+    return verb_group
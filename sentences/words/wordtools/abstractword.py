@@ -5,6 +5,7 @@ from sentences.words.wordtools.wordtag import WordTag
 
 
 class AbstractWord(ABC):
+    __slots__ = ()
 
     @property
     @abstractmethod
@@ -29,5 +30,4 @@ class AbstractWord(ABC):
         pass
 
     def has_tags(self, *tags: WordTag) -> bool:
-        owned_tags = self.tags
-        return all(owned_tags.has(tag) for tag in tags)
+        return self.tags.has_all(*tags)
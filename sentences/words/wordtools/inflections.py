@@ -0,0 +1,22 @@
+from sentences.words.wordtools.morphology import ENGLISH
+
+_GENERATION = None
+
+
+class CachedInflections(object):
+    """
+    Mixin for interned words. Each inflection of a word form is built once and stored in the word's
+    _forms table, so later calls are a dictionary lookup. The table is dropped when ENGLISH's irregulars
+    change. Subclasses must provide a _forms slot that starts as None.
+    """
+    __slots__ = ()
+
+    def _inflection(self, name, make):
+        forms = self._forms
+        if forms is None or forms[_GENERATION] != ENGLISH.generation:
+            forms = self._forms = {_GENERATION: ENGLISH.generation}
+        try:
+            return forms[name]
+        except KeyError:
+            new_form = forms[name] = make(self)
+            return new_form
@@ -0,0 +1,22 @@
+from abc import ABCMeta
+from threading import Lock
+from weakref import WeakValueDictionary
+
+_interned = WeakValueDictionary()
+_lock = Lock()
+
+
+class InternedWord(ABCMeta):
+    """
+    Metaclass for immutable words. Instances are interned on their intern_key(), so every call that
+    produces an equal word returns the one live instance of that word. Entries are weak references and
+    disappear once no paragraph refers to the word any more. Words may be made from several threads at once.
+    """
+    def __call__(cls, *args, **kwargs):
+        new = super(InternedWord, cls).__call__(*args, **kwargs)
+        with _lock:
+            return _interned.setdefault(new.intern_key(), new)
+
+
+def interned_count() -> int:
+    return len(_interned)
@@ -0,0 +1,169 @@
+from collections import namedtuple
+
+VOWELS = 'aeiou'
+
+# pattern is matched against the last characters of a word. Pattern characters are literal, except:
+#     - 'V': a vowel
+#     - 'K': neither a vowel, a space nor the start of the word
+#     - 'C': not a vowel (the start of the word counts)
+#     - 'D': not a vowel, 'w' or 'y' and not the start of the word
+# The inflected value is: word[:-strip] + [word[-1] if double_last] + ending
+SuffixRule = namedtuple('SuffixRule', ['name', 'pattern', 'strip', 'ending', 'double_last'])
+
+S_RULES = (
+    SuffixRule('es', 's', 0, 'es', False),
+    SuffixRule('es', 'z', 0, 'es', False),
+    SuffixRule('es', 'ch', 0, 'es', False),
+    SuffixRule('es', 'sh', 0, 'es', False),
+    SuffixRule('es', 'x', 0, 'es', False),
+    SuffixRule('es', 'o', 0, 'es', False),
+    SuffixRule('ies', 'Ky', 1, 'ies', False),
+    SuffixRule('s', '', 0, 's', False),
+)
+
+ED_RULES = (
+    SuffixRule('ied', 'Ky', 1, 'ied', False),
+    SuffixRule('d', 'e', 0, 'd', False),
+    SuffixRule('double', 'CVD', 0, 'ed', True),
+    SuffixRule('ed', '', 0, 'ed', False),
+)
+
+PLURAL_RULES = (
+    SuffixRule('ives', 'ife', 3, 'ives', False),
+    SuffixRule('ves', 'alf', 1, 'ves', False),
+    SuffixRule('ves', 'elf', 1, 'ves', False),
+    SuffixRule('ves', 'arf', 1, 'ves', False),
+    SuffixRule('ves', 'eaf', 1, 'ves', False),
+    SuffixRule('ves', 'olf', 1, 'ves', False),
+) + S_RULES
+
+FORMS = ('plural', 'third_person', 'past')
+
+DEFAULT_IRREGULARS = (
+    ('third_person', 'have', 'has'),
+)
+
+_START = '\x00'
+_SUFFIX_LEN = 3
+
+
+class Morphology(object):
+    """
+    Inflects words by suffix. The ordered rules for each form are compiled into a table keyed by the last
+    three characters of a word (or the whole word, if shorter), so classifying a word is one dictionary
+    lookup once its suffix has been seen.
+
+    Irregular forms are checked before the rules. Words cache their inflections, so generation goes up
+    whenever the irregulars change, and words drop cached inflections from an older generation.
+    """
+    def __init__(self, irregulars=DEFAULT_IRREGULARS):
+        self._rules = {'plural': PLURAL_RULES, 'third_person': S_RULES, 'past': ED_RULES}
+        self._tables = {form: {} for form in FORMS}
+        self._defaults = _irregulars_table(irregulars)
+        self._irregulars = _irregulars_table(irregulars)
+        self.generation = 0
+
+    def add_irregulars(self, irregulars):
+        """
+        :param irregulars: iterable of (form, word, irregular_value). form is in FORMS.
+        """
+        self._set_table(_irregulars_table(irregulars, self._irregulars))
+
+    def set_irregulars(self, irregulars):
+        """
+        Replaces every irregular except the ones this Morphology was made with.
+
+        :param irregulars: see add_irregulars
+        """
+        self._set_table(_irregulars_table(irregulars, self._defaults))
+
+    def _set_table(self, table):
+        if table != self._irregulars:
+            self._irregulars = table
+            self.generation += 1
+
+    def irregulars(self, form) -> dict:
+        return self._irregulars[form].copy()
+
+    def rule(self, form, value) -> SuffixRule:
+        table = self._tables[form]
+        suffix = value[-_SUFFIX_LEN:]
+        try:
+            return table[suffix]
+        except KeyError:
+            new_rule = table[suffix] = _first_match(self._rules[form], suffix)
+            return new_rule
+
+    def apply_rules(self, form, value) -> str:
+        return _apply(self.rule(form, value), value)
+
+    def inflect(self, form, value) -> str:
+        irregular_value = self._irregulars[form].get(value)
+        if irregular_value is not None:
+            return irregular_value
+        return _apply(self.rule(form, value), value)
+
+    def inflect_many(self, form, values) -> list:
+        """The same as inflect for each of values, with the lookups for form done once for the whole list."""
+        irregulars = self._irregulars[form]
+        table = self._tables[form]
+        rules = self._rules[form]
+        answer = []
+        for value in values:
+            irregular_value = irregulars.get(value)
+            if irregular_value is not None:
+                answer.append(irregular_value)
+                continue
+            suffix = value[-_SUFFIX_LEN:]
+            rule = table.get(suffix)
+            if rule is None:
+                rule = table[suffix] = _first_match(rules, suffix)
+            answer.append(_apply(rule, value))
+        return answer
+
+
+def _irregulars_table(irregulars, start=None) -> dict:
+    """:return: {form: {word: irregular_value}}, with irregulars added to a copy of start"""
+    table = {form: {} if start is None else start[form].copy() for form in FORMS}
+    for form, word, irregular_value in irregulars:
+        if form not in table:
+            raise ValueError('{!r} is not one of: {}'.format(form, ', '.join(FORMS)))
+        table[form][word] = irregular_value
+    return table
+
+
+def _apply(rule, value):
+    stem = value[:len(value) - rule.strip]
+    if rule.double_last:
+        stem += value[-1]
+    return stem + rule.ending
+
+
+def _first_match(rules, suffix):
+    padded = (_START * _SUFFIX_LEN + suffix)[-_SUFFIX_LEN:]
+    for rule in rules:
+        if _matches(rule.pattern, padded):
+            return rule
+    raise ValueError('No rule for {!r}'.format(suffix))
+
+
+def _matches(pattern, padded_suffix):
+    if not pattern:
+        return True
+    tail = padded_suffix[-len(pattern):]
+    return all(_matches_char(element, char) for element, char in zip(pattern, tail))
+
+
+def _matches_char(element, char):
+    if element == 'V':
+        return char in VOWELS
+    if element == 'K':
+        return char not in VOWELS + ' ' + _START
+    if element == 'C':
+        return char not in VOWELS
+    if element == 'D':
+        return char not in VOWELS + 'wy' + _START
+    return element == char
+
+
+ENGLISH = Morphology()
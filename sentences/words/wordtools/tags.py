@@ -1,33 +1,82 @@
+from enum import IntFlag
+
+from sentences.words.wordtools.wordtag import WordTag
+
+TagFlag = IntFlag('TagFlag', [(tag.name, 1 << tag.value) for tag in WordTag])
+
+_BITS = {tag: int(TagFlag[tag.name]) for tag in WordTag}
+_ORDERED_TAGS = sorted(WordTag.__members__.values())
+
 
 class Tags(object):
+    """
+    An immutable set of WordTag, stored as an integer bitmask (see TagFlag).
+
+    add and remove return new Tags and never change the original, so Tags may be
+    shared freely between words without copying.
+    """
+    __slots__ = ('_mask',)
+
+    _interned = {}
+
     def __init__(self, tag_list=None):
-        self._tags = set()
-        if tag_list:
-            self._tags = set(tag_list)
+        self._mask = tags_to_mask(tag_list) if tag_list else 0
+
+    @classmethod
+    def from_mask(cls, mask: int) -> 'Tags':
+        try:
+            return cls._interned[mask]
+        except KeyError:
+            new = cls.__new__(cls)
+            new._mask = mask
+            return cls._interned.setdefault(mask, new)
+
+    @property
+    def mask(self) -> int:
+        return self._mask
+
+    @property
+    def flag(self) -> TagFlag:
+        return TagFlag(self._mask)
 
     def to_list(self):
-        return sorted(self._tags)
+        return [tag for tag in _ORDERED_TAGS if self._mask & _BITS[tag]]
 
     def add(self, new_tag):
-        new_val = self.to_list()
-        new_val.append(new_tag)
-        return Tags(new_val)
+        return Tags.from_mask(self._mask | _BITS[new_tag])
 
     def remove(self, candidate_tag):
-        new_val = set(self.to_list())
-        new_val.discard(candidate_tag)
-        return Tags(list(new_val))
+        return Tags.from_mask(self._mask & ~_BITS[candidate_tag])
 
     def has(self, candidate_tag):
-        return candidate_tag in self._tags
+        return bool(self._mask & _BITS.get(candidate_tag, 0))
+
+    def has_all(self, *candidate_tags):
+        required = tags_to_mask(candidate_tags)
+        return self._mask & required == required
 
     def copy(self):
-        return Tags(self.to_list())
+        new = Tags.__new__(Tags)
+        new._mask = self._mask
+        return new
 
     def __eq__(self, other):
         if not isinstance(other, Tags):
             return False
-        return self.to_list() == other.to_list()
+        return self._mask == other._mask
+
+    def __hash__(self):
+        return hash(self._mask)
+
+    def __reduce__(self):
+        return Tags.from_mask, (self._mask,)
 
     def __repr__(self):
-        return 'Tags({})'.format(self.to_list())
\ No newline at end of file
+        return 'Tags({})'.format(self.to_list())
+
+
+def tags_to_mask(tags) -> int:
+    mask = 0
+    for tag in tags:
+        mask |= _BITS[tag]
+    return mask
@@ -0,0 +1,58 @@
+import random
+import unittest
+
+from sentences.backend.alias_table import AliasTable, alias_table_or_none
+
+
+class TestAliasTable(unittest.TestCase):
+    def test_bad_weights(self):
+        self.assertRaises(ValueError, AliasTable, [])
+        self.assertRaises(ValueError, AliasTable, [0, 0])
+        self.assertRaises(ValueError, AliasTable, [1, -1, 3])
+
+    def test_len(self):
+        self.assertEqual(len(AliasTable([1, 2, 3])), 3)
+
+    def test_zero_weight_is_never_chosen(self):
+        random.seed(3)
+        table = AliasTable([0, 1, 0, 2])
+        self.assertEqual({table.index() for _ in range(1000)}, {1, 3})
+
+    def test_choice(self):
+        random.seed(3)
+        table = AliasTable([0, 1])
+        self.assertEqual(table.choice(['a', 'b']), 'b')
+
+    def test_distribution(self):
+        random.seed(8)
+        weights = [1, 2, 3, 4]
+        table = AliasTable(weights)
+        draws = 20000
+        counts = [0] * len(weights)
+        for _ in range(draws):
+            counts[table.index()] += 1
+        for count, weight in zip(counts, weights):
+            self.assertAlmostEqual(count / draws, weight / 10., delta=0.015)
+
+    def test_probabilities(self):
+        for weights in ([1, 2, 3, 4], [0, 1, 0, 2], [5], [0.001, 999, 0.001]):
+            total = sum(weights)
+            for probability, weight in zip(AliasTable(weights).probabilities(), weights):
+                self.assertAlmostEqual(probability, weight / total)
+
+    def test_one_random_call_per_draw(self):
+        table = AliasTable([1, 5, 2])
+        random.seed(11)
+        table.index()
+        after_draw = random.random()
+        random.seed(11)
+        random.random()
+        self.assertEqual(random.random(), after_draw)
+
+    def test_alias_table_or_none(self):
+        self.assertIsNone(alias_table_or_none(None))
+        self.assertIsNone(alias_table_or_none([1.0, 1.0, 1.0]))
+        self.assertIsNone(alias_table_or_none([]))
+        table = AliasTable([1, 2])
+        self.assertIs(alias_table_or_none(table), table)
+        self.assertIsInstance(alias_table_or_none([1.0, 2.0]), AliasTable)
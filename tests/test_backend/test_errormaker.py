@@ -4,6 +4,7 @@ from typing import List, Any
 
 from sentences.backend.errormaker import (copy_paragraph, make_verb_error, make_noun_error,
                                           make_is_do_error, find_subject_special_case, ErrorMaker)
+from sentences.backend.tokens import TokenParagraph
 from sentences.words.noun import Noun
 from sentences.words.punctuation import Punctuation
 from sentences.words.pronoun import Pronoun, CapitalPronoun
@@ -301,6 +302,28 @@ class TestErrorMaker(unittest.TestCase):
         ]
         self.assertEqual(error_maker.method_order, expected)
 
+    def test_error_maker_accepts_tokens(self):
+        dog = Noun('dog')
+        grab = Verb('grab')
+        paragraph = [
+            [dog.indefinite(), grab.third_person(), dog.plural(), Punctuation.EXCLAMATION],
+            [Pronoun.HE, grab, dog.definite(), Punctuation.PERIOD]
+        ]
+        random.seed(10)
+        from_list = ErrorMaker(paragraph, p_error=0.5)
+        from_list.create_all_errors()
+
+        random.seed(10)
+        from_tokens = ErrorMaker(TokenParagraph.from_paragraph(paragraph), p_error=0.5)
+        from_tokens.create_all_errors()
+
+        self.assertEqual(from_tokens.paragraph, paragraph)
+        self.assertEqual(from_tokens.error_paragraph, from_list.error_paragraph)
+        self.assertEqual(from_tokens.answer_paragraph, from_list.answer_paragraph)
+        self.assertEqual(from_tokens.error_tokens.to_paragraph(), from_list.error_paragraph)
+        self.assertEqual(from_tokens.answer_tokens.to_paragraph(), from_list.answer_paragraph)
+        self.assertEqual(from_tokens.error_count, from_list.error_count)
+
     def test_error_maker_create_errors_no_errors(self):
         dog = Noun('dog')
         cat = Noun('cat')
@@ -2,8 +2,11 @@ import random
 import string
 import unittest
 
-from sentences.backend.grammarizer import normalize_probability, get_non_proper_nouns, Grammarizer
+from sentences.backend.grammarizer import normalize_probability, get_non_proper_nouns, Grammarizer, NounInfo
+from sentences.backend.tokens import TokenParagraph
+from sentences.backend.wordconnector import convert_paragraph
 
+from sentences.words.basicword import BasicWord
 from sentences.words.pronoun import Pronoun
 from sentences.words.punctuation import Punctuation
 from sentences.words.noun import Noun
@@ -78,17 +81,17 @@ class TestGrammarizer(unittest.TestCase):
             [Noun.proper_noun('Bob'), Verb('drive'), Noun.proper_noun('Benzes', plural=True)]
         ]
         grammarizer = Grammarizer(paragraph)
-        self.assertEqual(grammarizer._raw, paragraph)
-        self.assertIsNot(grammarizer._raw, paragraph)
-        self.assertIsNot(grammarizer._raw[0], paragraph[0])
+        self.assertEqual(grammarizer._raw.to_paragraph(), paragraph)
+        paragraph[0][0] = Noun('oops')
+        self.assertNotEqual(grammarizer._raw.to_paragraph(), paragraph)
 
         self.assertEqual(grammarizer.plural, 0.3)
         self.assertEqual(grammarizer.negative, 0.3)
         self.assertEqual(grammarizer.present_tense, True)
         noun_info = {
-            Noun.uncountable_noun('tea'): {'plural': False, 'definite': False, 'countable': False},
-            Noun('watch'): {'plural': False, 'definite': False, 'countable': True},
-            Noun.uncountable_noun('money'): {'plural': False, 'definite': False, 'countable': False},
+            Noun.uncountable_noun('tea'): NounInfo(False, False, False),
+            Noun('watch'): NounInfo(False, False, True),
+            Noun.uncountable_noun('money'): NounInfo(False, False, False),
         }
         self.assertEqual(noun_info, grammarizer.noun_info)
 
@@ -122,17 +125,23 @@ class TestGrammarizer(unittest.TestCase):
         self.assertEqual(grammarizer.plural, 0.1)
         self.assertEqual(grammarizer.negative, 0.2)
 
-    def test_grammarizer_noun_info_property_is_copy(self):
+    def test_grammarizer_noun_info_property_is_read_only_view(self):
         paragraph = [
             [Noun('money'), Verb('grab'), Noun('tea'), EXCLAMATION],
             [Pronoun.IT, Verb('have', 'had'), Noun('watch'), PERIOD]
         ]
         grammarizer = Grammarizer(paragraph)
-        info_1 = grammarizer.noun_info
-        info_2 = grammarizer.noun_info
-        self.assertEqual(info_1, info_2)
-        self.assertIsNot(info_1, info_2)
-        self.assertIsNot(info_1[Noun('money')], info_2[Noun('money')])
+        info = grammarizer.noun_info
+        self.assertEqual(list(info), [Noun('money'), Noun('tea'), Noun('watch')])
+        with self.assertRaises(TypeError):
+            info[Noun('money')] = NounInfo(True, True, True)
+        self.assertRaises(AttributeError, setattr, info[Noun('money')], 'definite', True)
+        self.assertRaises(KeyError, info.__getitem__, Noun('cheese'))
+        self.assertNotIn(Noun('watch').plural(), info)
+
+        self.assertFalse(info[Noun('money')].definite)
+        grammarizer.generate_paragraph()
+        self.assertTrue(info[Noun('money')].definite)
 
     def test_grammarizer_reset_definite_nouns(self):
         paragraph = [
@@ -142,10 +151,10 @@ class TestGrammarizer(unittest.TestCase):
         grammarizer = Grammarizer(paragraph)
         grammarizer.generate_paragraph()
         for noun_dict in grammarizer.noun_info.values():
-            self.assertTrue(noun_dict['definite'])
+            self.assertTrue(noun_dict.definite)
         grammarizer.reset_definite_nouns()
         for noun_dict in grammarizer.noun_info.values():
-            self.assertFalse(noun_dict['definite'])
+            self.assertFalse(noun_dict.definite)
 
     def test_grammarizer_set_nouns(self):
         paragraph = [
@@ -158,25 +167,25 @@ class TestGrammarizer(unittest.TestCase):
 
         grammarizer.set_nouns()
         noun_info = {
-            Noun('watch'): {'plural': True, 'definite': False, 'countable': True},
-            Noun('witch'): {'plural': False, 'definite': False, 'countable': True},
-            Noun.uncountable_noun('money'): {'plural': False, 'definite': False, 'countable': False},
+            Noun('watch'): NounInfo(True, False, True),
+            Noun('witch'): NounInfo(False, False, True),
+            Noun.uncountable_noun('money'): NounInfo(False, False, False),
         }
         self.assertEqual(grammarizer.noun_info, noun_info)
 
         grammarizer.set_nouns()
         noun_info = {
-            Noun('watch'): {'plural': True, 'definite': False, 'countable': True},
-            Noun('witch'): {'plural': False, 'definite': False, 'countable': True},
-            Noun.uncountable_noun('money'): {'plural': False, 'definite': False, 'countable': False},
+            Noun('watch'): NounInfo(True, False, True),
+            Noun('witch'): NounInfo(False, False, True),
+            Noun.uncountable_noun('money'): NounInfo(False, False, False),
         }
         self.assertEqual(grammarizer.noun_info, noun_info)
 
         grammarizer.set_nouns()
         noun_info = {
-            Noun('watch'): {'plural': False, 'definite': False, 'countable': True},
-            Noun('witch'): {'plural': False, 'definite': False, 'countable': True},
-            Noun.uncountable_noun('money'): {'plural': False, 'definite': False, 'countable': False},
+            Noun('watch'): NounInfo(False, False, True),
+            Noun('witch'): NounInfo(False, False, True),
+            Noun.uncountable_noun('money'): NounInfo(False, False, False),
         }
         self.assertEqual(grammarizer.noun_info, noun_info)
 
@@ -188,10 +197,10 @@ class TestGrammarizer(unittest.TestCase):
         grammarizer = Grammarizer(paragraph, probability_plural_noun=1.0)
         grammarizer.set_nouns()
         noun_info = {
-            Noun.uncountable_noun('tea'): {'plural': False, 'definite': False, 'countable': False},
-            Noun('watch'): {'plural': True, 'definite': False, 'countable': True},
-            Noun('witch'): {'plural': True, 'definite': False, 'countable': True},
-            Noun.uncountable_noun('money'): {'plural': False, 'definite': False, 'countable': False},
+            Noun.uncountable_noun('tea'): NounInfo(False, False, False),
+            Noun('watch'): NounInfo(True, False, True),
+            Noun('witch'): NounInfo(True, False, True),
+            Noun.uncountable_noun('money'): NounInfo(False, False, False),
         }
 
         self.assertEqual(grammarizer.noun_info, noun_info)
@@ -426,3 +435,61 @@ class TestGrammarizer(unittest.TestCase):
                                       probability_plural_noun=probility_plural)
             answer = grammarizer.generate_paragraph()
             self.assertEqual(answer, expected)
+
+    def test_generate_paragraph_skips_empty_sentences(self):
+        paragraph = [[], [Noun('dog'), Verb('grab'), Noun('cat'), PERIOD], []]
+        grammarizer = Grammarizer(paragraph, False, 0.0, 0.0)
+        self.assertEqual(grammarizer.generate_paragraph(),
+                         [[], [Noun('dog').indefinite().capitalize(), Verb('grab').past_tense(),
+                               Noun('cat').indefinite(), PERIOD], []])
+
+    def test_generate_paragraph_verb_with_no_subject_is_not_third_person(self):
+        paragraph = [[Verb('go'), Noun('home'), PERIOD]]
+        grammarizer = Grammarizer(paragraph, True, 0.0, 0.0)
+        self.assertEqual(grammarizer.generate_paragraph(),
+                         [[Verb('go').capitalize(), Noun('home').indefinite(), PERIOD]])
+
+    def test_generate_tokens_golden_paragraphs(self):
+        # captured from generate_paragraph before it and generate_tokens shared one pass over the words
+        raw_paragraph = [
+            [Noun('dog'), Verb('grab'), Noun('cat'), PERIOD],
+            [Pronoun.HE, Verb('like', 'liked'), Noun('dog'), EXCLAMATION],
+            [Noun('cat'), Verb('eat', 'ate'), Noun.uncountable_noun('water'), PERIOD],
+            [Noun.proper_noun('Joe'), Verb('give', 'gave'), Pronoun.HIM, BasicWord.preposition('to'),
+             Noun('child', 'children'), PERIOD],
+            [Noun.proper_noun('the Joneses', plural=True), Verb('pick'), Pronoun.IT, BasicWord.particle('up'), PERIOD],
+            [Pronoun.I, Verb('want'), Noun('box'), EXCLAMATION],
+            [Noun.uncountable_noun('water'), Verb('jump'), BasicWord.preposition('over'), Noun('cat'), PERIOD],
+        ]
+        expected = {
+            (0, True): "A dog grabs a cat. He doesn't like the dog! The cat eats water. "
+                       "Joe doesn't give him to children. The Joneses don't pick it up. I want boxes! "
+                       "The water jumps over the cat.",
+            (0, False): "A dog grabbed a cat. He didn't like the dog! The cat ate water. "
+                        "Joe didn't give him to children. The Joneses didn't pick it up. I wanted boxes! "
+                        "The water jumped over the cat.",
+            (1, True): "Dogs don't grab a cat. He doesn't like the dogs! The cat eats water. "
+                       "Joe gives him to a child. The Joneses don't pick it up. I don't want boxes! "
+                       "The water jumps over the cat.",
+            (1, False): "Dogs didn't grab a cat. He didn't like the dogs! The cat ate water. "
+                        "Joe gave him to a child. The Joneses didn't pick it up. I didn't want boxes! "
+                        "The water jumped over the cat.",
+            (2, True): "A dog grabs a cat. He likes the dog! The cat eats water. "
+                       "Joe doesn't give him to children. The Joneses pick it up. I want boxes! "
+                       "The water jumps over the cat.",
+            (2, False): "A dog grabbed a cat. He liked the dog! The cat ate water. "
+                        "Joe didn't give him to children. The Joneses picked it up. I wanted boxes! "
+                        "The water jumped over the cat.",
+            (3, True): "Dogs grab a cat. He doesn't like the dogs! The cat doesn't eat water. "
+                       "Joe gives him to children. The Joneses don't pick it up. I don't want a box! "
+                       "The water jumps over the cat.",
+            (3, False): "Dogs grabbed a cat. He didn't like the dogs! The cat didn't eat water. "
+                        "Joe gave him to children. The Joneses didn't pick it up. I didn't want a box! "
+                        "The water jumped over the cat.",
+        }
+        for (seed, present_tense), text in expected.items():
+            for paragraph in (raw_paragraph, TokenParagraph.from_paragraph(raw_paragraph)):
+                grammarizer = Grammarizer(paragraph, present_tense, 0.5, 0.5, rng=random.Random(seed))
+                self.assertEqual(convert_paragraph(grammarizer.generate_tokens().to_paragraph()), text)
+            grammarizer = Grammarizer(raw_paragraph, present_tense, 0.5, 0.5, rng=random.Random(seed))
+            self.assertEqual(convert_paragraph(grammarizer.generate_paragraph()), text)
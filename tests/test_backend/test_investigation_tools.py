@@ -2,7 +2,8 @@ import unittest
 from typing import List, Any
 
 from sentences.backend.investigation_tools import (requires_third_person, is_third_person, find_subject,
-                                                   is_word_in_sentence, get_present_be_verb)
+                                                   is_word_in_sentence, get_present_be_verb, word_key,
+                                                   sentence_keys, present_be_verb)
 from sentences.words.noun import Noun
 from sentences.words.pronoun import Pronoun, CapitalPronoun
 from sentences.words.punctuation import Punctuation
@@ -103,10 +104,37 @@ class TestInvestigationTools(unittest.TestCase):
         self.assertFalse(is_word_in_sentence(BasicWord('dick'), sentence))
         self.assertFalse(is_word_in_sentence(Verb('harry'), sentence))
 
+    def test_sentence_keys_agree_with_is_word_in_sentence(self):
+        sentence = [BasicWord('tom'), Verb('dick'), Noun('harry'), him, CapitalPronoun.I, period]
+        keys = sentence_keys(sentence)
+        words = [BasicWord('tom'), Verb('dick'), Noun('harry'), Noun('tom'), BasicWord('dick'), Verb('harry'),
+                 he, him, i, me, CapitalPronoun.ME, it, period, exclamation]
+        for word in words:
+            self.assertEqual(word_key(word) in keys, is_word_in_sentence(word, sentence), word)
+
+    def test_word_key(self):
+        self.assertEqual(word_key(him), he)
+        self.assertEqual(word_key(CapitalPronoun.THEM), CapitalPronoun.THEY)
+        self.assertEqual(word_key(Noun('dog')), 'dog')
+        self.assertEqual(word_key(Noun('dog').plural().definite()), 'dog')
+        self.assertEqual(word_key(Verb('dog')), Verb('dog'))
+
+    def test_is_word_in_sentence_noun_by_base_noun(self):
+        sentence = [Noun('dog'), Verb('see'), Noun.uncountable_noun('water'), period]
+        self.assertTrue(is_word_in_sentence(Noun('water'), sentence))
+        self.assertTrue(is_word_in_sentence(Noun('dog').definite(), sentence))
+        self.assertFalse(is_word_in_sentence(BasicWord('dog'), sentence))
+
     def test_get_present_be_verb_no_subj(self):
         sentence = [Verb('Give'), Pronoun.ME, Noun('break').indefinite(), period]
         self.assertEqual(get_present_be_verb(sentence), BasicWord('be'))
 
+    def test_present_be_verb(self):
+        self.assertEqual(present_be_verb(None), BasicWord('be'))
+        self.assertEqual(present_be_verb(CapitalPronoun.I), BasicWord('am'))
+        self.assertEqual(present_be_verb(Noun('dog')), BasicWord('is'))
+        self.assertEqual(present_be_verb(Noun('dog').plural()), BasicWord('are'))
+
     def test_get_present_be_verb_are(self):
         predicate = [Verb('play'), period]
         subjs = [you, them, they, we, us, BasicWord('You'), BasicWord('They'), BasicWord('We'),
@@ -0,0 +1,137 @@
+import json
+import os
+import pickle
+import unittest
+
+from sentences.backend.lexicon_cache import (LexiconCache, file_signature, lexicon_signatures, updated_signature,
+                                             is_same_contents)
+from sentences.words.basicword import BasicWord
+from sentences.words.noun import Noun
+from sentences.words.verb import Verb
+from sentences.words.verbgroup import VerbGroup
+from tests import TESTS_FILES
+
+CACHE_FILE = os.path.join(TESTS_FILES, 'delete_me.cache')
+WORD_FILE = os.path.join(TESTS_FILES, 'delete_me_words.csv')
+
+
+class TestLexiconCache(unittest.TestCase):
+    def setUp(self):
+        with open(WORD_FILE, 'w') as f:
+            f.write('dog\ncat\n')
+        self.lists = {
+            'nouns': ([Noun('dog'), Noun.proper_noun('Joe'), Noun.uncountable_noun('water')], [1, 2.5, 1]),
+            'verbs': ([VerbGroup(Verb('go', 'went'), BasicWord.preposition('to'), 1, None),
+                       VerbGroup(Verb('pick'), None, 1, BasicWord.particle('up'))], [1, 3])
+        }
+        self.filenames = {'nouns': WORD_FILE, 'verbs': WORD_FILE}
+
+    def tearDown(self):
+        for filename in (CACHE_FILE, WORD_FILE):
+            if os.path.exists(filename):
+                os.remove(filename)
+
+    def test_file_signature(self):
+        path, _, size, digest = file_signature(WORD_FILE)
+        self.assertEqual(path, os.path.abspath(WORD_FILE))
+        self.assertEqual(size, os.path.getsize(WORD_FILE))
+        self.assertEqual(len(digest), 40)
+
+    def test_file_signature_missing_file(self):
+        self.assertIsNone(file_signature(os.path.join(TESTS_FILES, 'not_there.csv')))
+
+    def test_updated_signature_same_stat_does_not_rehash(self):
+        signature = file_signature(WORD_FILE)
+        fake = signature[:3] + ('not a hash',)
+        self.assertIs(updated_signature(WORD_FILE, fake), fake)
+
+    def test_updated_signature_changed_file(self):
+        signature = file_signature(WORD_FILE)
+        with open(WORD_FILE, 'w') as f:
+            f.write('dog\ncat\nrat\n')
+        new_signature = updated_signature(WORD_FILE, signature)
+        self.assertEqual(new_signature, file_signature(WORD_FILE))
+        self.assertFalse(is_same_contents(signature, new_signature))
+
+    def test_updated_signature_touched_file(self):
+        signature = file_signature(WORD_FILE)
+        os.utime(WORD_FILE, ns=(0, signature[1] + 10 ** 9))
+        new_signature = updated_signature(WORD_FILE, signature)
+        self.assertNotEqual(new_signature, signature)
+        self.assertTrue(is_same_contents(signature, new_signature))
+
+    def test_updated_signature_missing_file(self):
+        signature = file_signature(WORD_FILE)
+        os.remove(WORD_FILE)
+        self.assertIsNone(updated_signature(WORD_FILE, signature))
+        self.assertIsNone(updated_signature(WORD_FILE, None))
+
+    def test_is_same_contents_none(self):
+        self.assertFalse(is_same_contents(None, file_signature(WORD_FILE)))
+        self.assertFalse(is_same_contents(None, None))
+
+    def test_load_no_cache_file(self):
+        cache = LexiconCache(CACHE_FILE)
+        self.assertIsNone(cache.load(lexicon_signatures(self.filenames)))
+
+    def test_save_and_load(self):
+        cache = LexiconCache(CACHE_FILE)
+        signatures = lexicon_signatures(self.filenames)
+        cache.save(signatures, self.lists)
+        loaded = cache.load(lexicon_signatures(self.filenames))
+        self.assertEqual(loaded, self.lists)
+        self.assertIs(loaded['nouns'][0][0], self.lists['nouns'][0][0])
+
+    def test_load_changed_file_is_a_miss(self):
+        cache = LexiconCache(CACHE_FILE)
+        cache.save(lexicon_signatures(self.filenames), self.lists)
+        with open(WORD_FILE, 'w') as f:
+            f.write('dog\nrat\n')
+        self.assertIsNone(cache.load(lexicon_signatures(self.filenames)))
+
+    def test_load_different_keys_is_a_miss(self):
+        cache = LexiconCache(CACHE_FILE)
+        cache.save(lexicon_signatures(self.filenames), self.lists)
+        self.assertIsNone(cache.load(lexicon_signatures({'nouns': WORD_FILE})))
+
+    def test_load_missing_word_file_is_a_miss(self):
+        cache = LexiconCache(CACHE_FILE)
+        signatures = lexicon_signatures({'nouns': os.path.join(TESTS_FILES, 'not_there.csv')})
+        cache.save(signatures, self.lists)
+        self.assertFalse(os.path.exists(CACHE_FILE))
+        self.assertIsNone(cache.load(signatures))
+
+    def test_load_corrupt_cache_is_a_miss(self):
+        with open(CACHE_FILE, 'wb') as f:
+            f.write(b'not a pickle')
+        cache = LexiconCache(CACHE_FILE)
+        self.assertIsNone(cache.load(lexicon_signatures(self.filenames)))
+
+    def test_load_pickle_is_a_miss_and_is_not_unpickled(self):
+        class Payload(object):
+            def __reduce__(self):
+                return os.remove, (WORD_FILE,)
+
+        with open(CACHE_FILE, 'wb') as f:
+            pickle.dump({'version': 3, 'files': lexicon_signatures(self.filenames), 'lists': Payload()}, f)
+        cache = LexiconCache(CACHE_FILE)
+        self.assertIsNone(cache.load(lexicon_signatures(self.filenames)))
+        self.assertTrue(os.path.exists(WORD_FILE))
+
+    def test_save_writes_plain_rows(self):
+        cache = LexiconCache(CACHE_FILE)
+        cache.save(lexicon_signatures(self.filenames), self.lists)
+        with open(CACHE_FILE, encoding='utf-8') as f:
+            snapshot = json.load(f)
+        self.assertEqual(snapshot['lists']['nouns']['words'][0], ['dog', '', 'dog', str(Noun('dog').tags.mask)])
+        self.assertEqual(snapshot['lists']['verbs']['weights'], [1, 3])
+
+    def test_load_bad_rows_is_a_miss(self):
+        cache = LexiconCache(CACHE_FILE)
+        cache.save(lexicon_signatures(self.filenames), self.lists)
+        with open(CACHE_FILE, encoding='utf-8') as f:
+            snapshot = json.load(f)
+        snapshot['lists']['nouns']['words'][0] = ['dog']
+        with open(CACHE_FILE, 'w', encoding='utf-8') as f:
+            json.dump(snapshot, f)
+        self.assertIsNone(cache.load(lexicon_signatures(self.filenames)))
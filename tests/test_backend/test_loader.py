@@ -1,13 +1,16 @@
 import unittest
 
 import os
+from random import seed, Random
+from types import GeneratorType
 
-from sentences.backend.loader import (load_csv, strip_spaces,
+from sentences.backend.loader import (load_csv, iter_csv, strip_spaces, irregular_forms, reservoir_sample, split_weight,
                                       countable_nouns, uncountable_nouns, verbs, proper_nouns,
-                                      get_verb_dict, LoaderError)
+                                      get_verb_group, LoaderError)
 
 from sentences.words.noun import Noun
 from sentences.words.verb import Verb
+from sentences.words.verbgroup import VerbGroup
 from sentences.words.basicword import BasicWord
 from sentences.words.wordtools.wordtag import WordTag
 from sentences import DATA_PATH, VERBS_CSV, COUNTABLE_NOUNS_CSV
@@ -37,6 +40,114 @@ class TestLoader(unittest.TestCase):
         self.assertRaises(LoaderError, load_csv, os.path.join(DATA_PATH, 'go_time.ico'))
         self.assertRaises(LoaderError, load_csv, 'does_not_exist')
 
+    def test_iter_csv_is_lazy(self):
+        filename = os.path.join(TESTS_FILES, 'blank_lines.csv')
+        rows = iter_csv(filename)
+        self.assertIsInstance(rows, GeneratorType)
+        self.assertEqual(next(rows), ['a', 'b'])
+        self.assertEqual(list(rows), [['c', 'd'], ['e', 'f']])
+
+    def test_iter_csv_LoaderError(self):
+        self.assertRaises(LoaderError, list, iter_csv('does_not_exist'))
+
+    def test_reservoir_sample_short_iterable_returns_all_in_order(self):
+        self.assertEqual(reservoir_sample(iter(range(5)), 5), [0, 1, 2, 3, 4])
+        self.assertEqual(reservoir_sample(iter(range(3)), 5), [0, 1, 2])
+        self.assertEqual(reservoir_sample(iter(range(3)), 0), [])
+
+    def test_reservoir_sample_long_iterable(self):
+        seed(10)
+        sample = reservoir_sample(iter(range(1000)), 10)
+        self.assertEqual(len(sample), 10)
+        self.assertEqual(len(set(sample)), 10)
+        self.assertTrue(all(0 <= value < 1000 for value in sample))
+        self.assertNotEqual(sample, list(range(10)))
+
+    def test_reservoir_sample_is_uniform(self):
+        seed(5)
+        counts = [0] * 10
+        for _ in range(2000):
+            for value in reservoir_sample(range(10), 3):
+                counts[value] += 1
+        for count in counts:
+            self.assertAlmostEqual(count / 6000., 0.1, delta=0.02)
+
+    def test_reservoir_sample_negative_size(self):
+        self.assertRaises(ValueError, reservoir_sample, range(3), -1)
+
+    def test_loaders_sample(self):
+        seed(3)
+        filename = os.path.join(DATA_PATH, COUNTABLE_NOUNS_CSV)
+        all_nouns = countable_nouns(filename)
+        sample = countable_nouns(filename, sample=5)
+        self.assertEqual(len(sample), 5)
+        self.assertTrue(all(noun in all_nouns for noun in sample))
+
+        verb_list = verbs(os.path.join(DATA_PATH, VERBS_CSV), sample=3)
+        self.assertEqual(len(verb_list), 3)
+        self.assertEqual(uncountable_nouns(filename, sample=1000), uncountable_nouns(filename))
+
+    def test_loaders_sample_uses_rng(self):
+        filename = os.path.join(DATA_PATH, COUNTABLE_NOUNS_CSV)
+        verbs_file = os.path.join(DATA_PATH, VERBS_CSV)
+        self.assertEqual(countable_nouns(filename, sample=5, rng=Random(3)),
+                         countable_nouns(filename, sample=5, rng=Random(3)))
+        self.assertEqual(proper_nouns(filename, sample=5, rng=Random(3)),
+                         proper_nouns(filename, sample=5, rng=Random(3)))
+        self.assertEqual(uncountable_nouns(filename, sample=5, weighted=True, rng=Random(3)),
+                         uncountable_nouns(filename, sample=5, weighted=True, rng=Random(3)))
+        self.assertEqual(verbs(verbs_file, sample=3, rng=Random(3)), verbs(verbs_file, sample=3, rng=Random(3)))
+        self.assertNotEqual(countable_nouns(filename, sample=5, rng=Random(3)),
+                            countable_nouns(filename, sample=5, rng=Random(4)))
+
+    def test_split_weight(self):
+        self.assertEqual(split_weight(['dog']), (['dog'], 1.0))
+        self.assertEqual(split_weight(['child', 'children', 'weight=2.5']), (['child', 'children'], 2.5))
+        self.assertEqual(split_weight(['weight=3', 'give', 'gave']), (['give', 'gave'], 3.0))
+        for bad_weight in ('weight=', 'weight=0', 'weight=-1', 'weight=lots', 'weight=inf', 'weight=nan'):
+            self.assertRaises(LoaderError, split_weight, ['dog', bad_weight])
+
+    def test_loaders_weighted(self):
+        weighted = os.path.join(TESTS_FILES, 'weighted.csv')
+        with open(weighted, 'w') as f:
+            f.write('dog, weight=3\nchild, children\nbring, brought, to, 2, weight=0.5')
+
+        self.assertEqual(countable_nouns(weighted, weighted=True),
+                         ([Noun('dog'), Noun('child', 'children'), Noun('bring', 'brought')], [3.0, 1.0, 0.5]))
+        self.assertEqual(uncountable_nouns(weighted)[0], Noun.uncountable_noun('dog'))
+        self.assertEqual(proper_nouns(weighted, weighted=True)[1], [3.0, 1.0, 0.5])
+
+        verb_list, weights = verbs(weighted, weighted=True)
+        self.assertEqual(verb_list[2], VerbGroup(Verb('bring', 'brought', ''), BasicWord.preposition('to'), 2, None))
+        self.assertEqual(weights, [3.0, 1.0, 0.5])
+        os.remove(weighted)
+
+    def test_loaders_row_with_only_a_weight(self):
+        weighted = os.path.join(TESTS_FILES, 'weighted.csv')
+        with open(weighted, 'w') as f:
+            f.write('dog\n# comment\nweight=3\ncat')
+        try:
+            for loader in (countable_nouns, uncountable_nouns, proper_nouns, verbs):
+                for weighted_option in (False, True):
+                    with self.assertRaises(LoaderError) as cm:
+                        loader(weighted, weighted=weighted_option)
+                    message = cm.exception.args[0]
+                    self.assertIn(weighted, message)
+                    self.assertIn('line 3', message)
+                    self.assertIn('weight=3', message)
+        finally:
+            os.remove(weighted)
+
+    def test_loaders_weighted_sample(self):
+        weighted = os.path.join(TESTS_FILES, 'weighted.csv')
+        with open(weighted, 'w') as f:
+            f.write('\n'.join('noun{}, weight={}'.format(num, num + 1) for num in range(20)))
+        seed(2)
+        nouns, weights = countable_nouns(weighted, sample=5, weighted=True)
+        self.assertEqual(len(nouns), 5)
+        self.assertEqual(weights, [float(noun.value[4:]) + 1 for noun in nouns])
+        os.remove(weighted)
+
     def test_load_csv_nouns(self):
         filename = os.path.join(DATA_PATH, COUNTABLE_NOUNS_CSV)
 
@@ -91,62 +202,66 @@ class TestLoader(unittest.TestCase):
         ]
         self.assertEqual(proper_nouns(proper), expected)
 
-    def test_get_verb_dict_empty_strings(self):
-        expected = {'verb': Verb('play'), 'preposition': None, 'objects': 1, 'particle': None}
-        self.assertEqual(get_verb_dict(['play', '', '', '', '']), expected)
-        self.assertEqual(get_verb_dict(['play', '', '', ]), expected)
-        self.assertEqual(get_verb_dict(['play']), expected)
+    def test_get_verb_group_empty_strings(self):
+        expected = VerbGroup(Verb('play'), None, 1, None)
+        self.assertEqual(get_verb_group(['play', '', '', '', '']), expected)
+        self.assertEqual(get_verb_group(['play', '', '', ]), expected)
+        self.assertEqual(get_verb_group(['play']), expected)
 
-    def test_get_verb_dict_empty_and_null_strings(self):
-        expected = {'verb': Verb('play'), 'preposition': None, 'objects': 1, 'particle': None}
-        self.assertEqual(get_verb_dict(['play', '', 'null', '', '']), expected)
-        self.assertEqual(get_verb_dict(['play', 'null', '', ]), expected)
+    def test_get_verb_group_empty_and_null_strings(self):
+        expected = VerbGroup(Verb('play'), None, 1, None)
+        self.assertEqual(get_verb_group(['play', '', 'null', '', '']), expected)
+        self.assertEqual(get_verb_group(['play', 'null', '', ]), expected)
 
-    def test_get_verb_dict_no_object_num(self):
-        answer = get_verb_dict(['fly', 'flew', 'null'])
+    def test_get_verb_group_no_object_num(self):
+        answer = get_verb_group(['fly', 'flew', 'null'])
         self.assertEqual(
             answer,
-            {'verb': Verb('fly', 'flew', ''), 'preposition': None, 'objects': 1, 'particle': None})
+            VerbGroup(Verb('fly', 'flew', ''), None, 1, None))
 
-    def test_get_verb_dict_null_values(self):
-        answer = get_verb_dict(['fly', 'null', 'null'])
+    def test_get_verb_group_null_values(self):
+        answer = get_verb_group(['fly', 'null', 'null'])
         self.assertEqual(
             answer,
-            {'verb': Verb('fly'), 'preposition': None, 'objects': 1, 'particle': None})
+            VerbGroup(Verb('fly'), None, 1, None))
 
-    def test_get_verb_dict_no_null_values(self):
-        answer = get_verb_dict(['fly', 'flew', 'with', '2'])
+    def test_get_verb_group_shares_prepositions_and_particles(self):
+        first = get_verb_group(['pick up', 'picked up', 'with', '2'])
+        second = get_verb_group(['put up', 'put up', 'with', '2'])
+        self.assertIs(first.preposition, second.preposition)
+        self.assertIs(first.particle, second.particle)
+        self.assertIs(first.particle, BasicWord.particle('up'))
+
+    def test_get_verb_group_no_null_values(self):
+        answer = get_verb_group(['fly', 'flew', 'with', '2'])
         self.assertEqual(
             answer,
-            {'verb': Verb('fly', 'flew', ''), 'preposition': BasicWord.preposition('with'),
-             'objects': 2, 'particle': None})
+            VerbGroup(Verb('fly', 'flew', ''), BasicWord.preposition('with'), 2, None))
 
-    def test_get_verb_dict_too_many_values(self):
-        answer = get_verb_dict(['fly', 'flew', 'with', '2', 'nsa', 'adfhgoerwi'])
+    def test_get_verb_group_too_many_values(self):
+        answer = get_verb_group(['fly', 'flew', 'with', '2', 'nsa', 'adfhgoerwi'])
         self.assertEqual(
             answer,
-            {'verb': Verb('fly', 'flew', ''), 'preposition': BasicWord.preposition('with'),
-             'objects': 2, 'particle': None})
+            VerbGroup(Verb('fly', 'flew', ''), BasicWord.preposition('with'), 2, None))
 
-    def test_get_verb_dict_preposition_has_correct_tag(self):
-        answer = get_verb_dict(['fly', 'flew', 'with', '2'])
-        self.assertTrue(answer['preposition'].has_tags(WordTag.PREPOSITION))
+    def test_get_verb_group_preposition_has_correct_tag(self):
+        answer = get_verb_group(['fly', 'flew', 'with', '2'])
+        self.assertTrue(answer.preposition.has_tags(WordTag.PREPOSITION))
 
-    def test_get_verb_dict_phrasal_verb(self):
-        answer = get_verb_dict(['take away', 'took away', 'from'])
+    def test_get_verb_group_phrasal_verb(self):
+        answer = get_verb_group(['take away', 'took away', 'from'])
         self.assertEqual(
             answer,
-            {'verb': Verb('take', 'took', ''), 'preposition': BasicWord.preposition('from'),
-             'particle': BasicWord.particle('away'), 'objects': 1})
+            VerbGroup(Verb('take', 'took', ''), BasicWord.preposition('from'), 1, BasicWord.particle('away')))
 
-    def test_get_verb_dict_phrasal_verb_single_value(self):
-        answer = get_verb_dict(['pick up'])
+    def test_get_verb_group_phrasal_verb_single_value(self):
+        answer = get_verb_group(['pick up'])
         self.assertEqual(
             answer,
-            {'verb': Verb('pick'), 'preposition': None, 'particle': BasicWord.particle('up'), 'objects': 1})
+            VerbGroup(Verb('pick'), None, 1, BasicWord.particle('up')))
 
-    def test_get_verb_dict_phrasal_verb_different_particles_raises_loader_error(self):
-        self.assertRaises(LoaderError, get_verb_dict, ['throw up', 'threw out'])
+    def test_get_verb_group_phrasal_verb_different_particles_raises_loader_error(self):
+        self.assertRaises(LoaderError, get_verb_group, ['throw up', 'threw out'])
 
     def test_verbs_empty_csv(self):
         self.assertEqual(verbs(os.path.join(TESTS_FILES, 'empty.csv')), [])
@@ -154,8 +269,7 @@ class TestLoader(unittest.TestCase):
     def test_verbs_with_insert_preposition(self):
         filename = os.path.join(TESTS_FILES, 'bring_to.csv')
         answer = verbs(filename)
-        bring_to = {'verb': Verb('bring', 'brought', ''), 'preposition': BasicWord.preposition('to'),
-                    'objects': 2, 'particle': None}
+        bring_to = VerbGroup(Verb('bring', 'brought', ''), BasicWord.preposition('to'), 2, None)
         self.assertEqual(answer, [bring_to])
 
     def test_verbs_bad_verb_file(self):
@@ -174,3 +288,16 @@ class TestLoader(unittest.TestCase):
             verbs(bad_verbs)
         self.assertEqual(cm.exception.args[0], 'Phrasal verb, "take", has mismatched particles: "out" and "away".')
         os.remove(bad_verbs)
+
+    def test_irregular_forms(self):
+        filename = os.path.join(TESTS_FILES, 'irregulars.csv')
+        expected = [('plural', 'person', 'people'), ('past', 'go', 'went'), ('third_person', 'be', 'is')]
+        self.assertEqual(irregular_forms(filename), expected)
+
+    def test_irregular_forms_bad_lines(self):
+        bad_irregulars = os.path.join(TESTS_FILES, 'bad_irregulars.csv')
+        for line in ('future, go, will go', 'past, go', 'past, , went'):
+            with open(bad_irregulars, 'w') as f:
+                f.write(line)
+            self.assertRaises(LoaderError, irregular_forms, bad_irregulars)
+        os.remove(bad_irregulars)
@@ -0,0 +1,74 @@
+import os
+import random
+import unittest
+
+from sentences import DATA_PATH, COUNTABLE_NOUNS_CSV, UNCOUNTABLE_NOUNS_CSV, PROPER_NOUNS_CSV, VERBS_CSV
+from sentences.backend.loader import countable_nouns, uncountable_nouns, proper_nouns, verbs
+from sentences.backend.mapped_lexicon import MappedLexicon, write_lexicon, NOUNS, VERBS
+from sentences.backend.random_sentences import RandomSentences
+from sentences.words.noun import Noun
+from tests import TESTS_FILES
+
+NOUN_LEXICON = os.path.join(TESTS_FILES, 'delete_me_nouns.lex')
+VERB_LEXICON = os.path.join(TESTS_FILES, 'delete_me_verbs.lex')
+
+
+class TestMappedLexicon(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.nouns = (countable_nouns(os.path.join(DATA_PATH, COUNTABLE_NOUNS_CSV)) +
+                     uncountable_nouns(os.path.join(DATA_PATH, UNCOUNTABLE_NOUNS_CSV)) +
+                     proper_nouns(os.path.join(DATA_PATH, PROPER_NOUNS_CSV)))
+        cls.verbs = verbs(os.path.join(DATA_PATH, VERBS_CSV))
+        write_lexicon(NOUN_LEXICON, cls.nouns)
+        write_lexicon(VERB_LEXICON, cls.verbs)
+
+    @classmethod
+    def tearDownClass(cls):
+        for filename in (NOUN_LEXICON, VERB_LEXICON):
+            if os.path.exists(filename):
+                os.remove(filename)
+
+    def test_nouns_round_trip(self):
+        with MappedLexicon(NOUN_LEXICON) as lexicon:
+            self.assertEqual(lexicon.kind, NOUNS)
+            self.assertEqual(len(lexicon), len(self.nouns))
+            self.assertEqual(list(lexicon), self.nouns)
+
+    def test_verbs_round_trip(self):
+        with MappedLexicon(VERB_LEXICON) as lexicon:
+            self.assertEqual(lexicon.kind, VERBS)
+            self.assertEqual(list(lexicon), self.verbs)
+
+    def test_decoded_words_are_interned(self):
+        with MappedLexicon(NOUN_LEXICON) as lexicon:
+            self.assertIs(lexicon[0], self.nouns[0])
+            self.assertIs(lexicon[-1], self.nouns[-1])
+
+    def test_getitem(self):
+        with MappedLexicon(NOUN_LEXICON) as lexicon:
+            self.assertEqual(lexicon[-2], self.nouns[-2])
+            self.assertEqual(lexicon[1:4], self.nouns[1:4])
+            self.assertIn(self.nouns[5], lexicon)
+            self.assertRaises(IndexError, lexicon.__getitem__, len(self.nouns))
+            self.assertRaises(IndexError, lexicon.__getitem__, -len(self.nouns) - 1)
+
+    def test_unicode_and_irregular_values(self):
+        nouns = [Noun('café'), Noun('person', 'people'), Noun.proper_noun('The Joneses', plural=True)]
+        write_lexicon(NOUN_LEXICON + '2', nouns)
+        try:
+            with MappedLexicon(NOUN_LEXICON + '2') as lexicon:
+                self.assertEqual(list(lexicon), nouns)
+        finally:
+            os.remove(NOUN_LEXICON + '2')
+
+    def test_bad_file(self):
+        self.assertRaises(ValueError, MappedLexicon, os.path.join(DATA_PATH, VERBS_CSV))
+
+    def test_random_sentences_same_output_as_lists(self):
+        with MappedLexicon(NOUN_LEXICON) as noun_lexicon, MappedLexicon(VERB_LEXICON) as verb_lexicon:
+            random.seed(7)
+            from_lists = [RandomSentences(self.verbs, self.nouns).sentence() for _ in range(20)]
+            random.seed(7)
+            from_lexicons = [RandomSentences(verb_lexicon, noun_lexicon).sentence() for _ in range(20)]
+        self.assertEqual(from_lists, from_lexicons)
@@ -0,0 +1,96 @@
+import unittest
+from random import Random
+
+from sentences.backend.investigation_tools import is_word_in_sentence, word_key
+from sentences.backend.predicate_bank import PredicateBank
+from sentences.backend.predicate_template import Predicate
+from sentences.backend.random_paragraph import RandomParagraph
+from sentences.backend.random_sentences import RandomSentences
+from sentences.words.basicword import BasicWord
+from sentences.words.noun import Noun
+from sentences.words.pronoun import Pronoun
+from sentences.words.verb import Verb
+from sentences.words.verbgroup import VerbGroup
+
+I, ME, YOU, HE, HIM, SHE, HER, IT, WE, US, THEY, THEM = Pronoun.__members__.values()
+
+
+class TestPredicateBank(unittest.TestCase):
+    def setUp(self):
+        self.nouns = [Noun('dog'), Noun('cat'), Noun('pig'), Noun('frog'), Noun('water'), Noun('rice')]
+        self.verbs = [
+            VerbGroup(Verb('eat')),
+            VerbGroup(Verb('give'), None, 2),
+            VerbGroup(Verb('jump'), BasicWord.preposition('over'), 1),
+        ]
+
+    def make_bank(self, size=50, max_uses=1, seed=1, p_pronoun=0.2):
+        word_maker = RandomSentences(self.verbs, self.nouns, rng=Random(seed))
+        return PredicateBank(word_maker, p_pronoun, size, max_uses, rng=Random(seed))
+
+    def test_size_and_max_uses_must_be_positive(self):
+        word_maker = RandomSentences(self.verbs, self.nouns)
+        self.assertRaises(ValueError, PredicateBank, word_maker, 0.2, 0)
+        self.assertRaises(ValueError, PredicateBank, word_maker, 0.2, 10, 0)
+
+    def test_refill_has_no_repeats(self):
+        bank = self.make_bank(size=200)
+        self.assertEqual(len(bank), 0)
+        bank.refill()
+        self.assertTrue(0 < len(bank) <= 200)
+        predicates = [tuple(bank.predicate()) for _ in range(len(bank))]
+        self.assertEqual(len(set(predicates)), len(predicates))
+        self.assertEqual(len(bank), 0)
+
+    def test_predicate_is_new_list(self):
+        bank = self.make_bank(max_uses=2)
+        predicate = bank.predicate()
+        predicate.insert(0, Noun('dog'))
+        self.assertNotIn(tuple(predicate), bank._predicates)
+
+    def test_predicate_has_object_keys(self):
+        bank = self.make_bank(p_pronoun=0.5)
+        for _ in range(20):
+            predicate = bank.predicate()
+            self.assertIsInstance(predicate, Predicate)
+            objects = [word for word in predicate if isinstance(word, (Noun, Pronoun))]
+            self.assertEqual(predicate.object_keys, {word_key(word) for word in objects})
+
+    def test_max_uses(self):
+        bank = self.make_bank(size=1, max_uses=3)
+        first = [bank.predicate() for _ in range(3)]
+        self.assertEqual(first, [first[0]] * 3)
+        self.assertEqual(len(bank), 0)
+
+    def test_refills_when_empty(self):
+        bank = self.make_bank(size=10)
+        for _ in range(100):
+            self.assertIn(bank.predicate()[0], [Verb('eat'), Verb('give'), Verb('jump')])
+
+    def test_predicate_excluded(self):
+        bank = self.make_bank(p_pronoun=0.5)
+        for _ in range(200):
+            self.assertFalse(is_word_in_sentence(Noun('dog'), bank.predicate(excluded=[Noun('dog')])))
+            self.assertFalse(is_word_in_sentence(HE, bank.predicate(excluded=[HE])))
+
+    def test_predicate_excluded_makes_new_predicate_if_none_fit(self):
+        bank = self.make_bank(size=1, p_pronoun=0.0)
+        bank.refill()
+        banked_object = bank._predicates[0][-2]
+        predicate = bank.predicate(excluded=[banked_object])
+        self.assertFalse(is_word_in_sentence(banked_object, predicate))
+        self.assertEqual(len(bank), 1)
+
+    def test_same_rng_same_predicates(self):
+        first = self.make_bank(size=20, seed=4)
+        second = self.make_bank(size=20, seed=4)
+        self.assertEqual([first.predicate() for _ in range(60)], [second.predicate() for _ in range(60)])
+
+    def test_random_paragraph_takes_predicates_from_bank(self):
+        bank = self.make_bank(size=1, max_uses=100)
+        bank.refill()
+        banked = bank._predicates[0]
+        paragraph = RandomParagraph(0.2, self.verbs, self.nouns, rng=Random(2), predicate_bank=bank)
+        for sentence in paragraph.create_pool_paragraph(2, 10):
+            if not is_word_in_sentence(sentence[0], banked):
+                self.assertEqual(tuple(sentence[1:]), banked)
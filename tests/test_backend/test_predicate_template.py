@@ -0,0 +1,51 @@
+import unittest
+
+from sentences.backend.predicate_template import PredicateTemplate, Predicate, predicate_keys, predicate_template
+from sentences.words.basicword import BasicWord
+from sentences.words.noun import Noun
+from sentences.words.pronoun import Pronoun
+from sentences.words.verb import Verb
+from sentences.words.verbgroup import VerbGroup
+
+I, ME, YOU, HE, HIM, SHE, HER, IT, WE, US, THEY, THEM = Pronoun.__members__.values()
+
+
+class TestPredicateTemplate(unittest.TestCase):
+    def test_predicate_template(self):
+        verb_group = VerbGroup(Verb('pick'), None, 1, BasicWord.particle('up'))
+        self.assertEqual(predicate_template(verb_group).fill([IT]), [Verb('pick'), IT, BasicWord.particle('up')])
+
+    def test_fill_sets_object_keys(self):
+        template = PredicateTemplate(Verb('bring'), BasicWord.preposition('to'), None)
+        predicate = template.fill([HIM, Noun('dog').plural()])
+        self.assertIsInstance(predicate, Predicate)
+        self.assertEqual(predicate.object_keys, {HE, 'dog'})
+        self.assertEqual(template.fill([]).object_keys, frozenset())
+
+    def test_predicate_keys(self):
+        words = [Verb('bring'), HIM, BasicWord.preposition('to'), Noun('dog')]
+        self.assertEqual(predicate_keys(Predicate(words, frozenset([HE, 'dog']))), {HE, 'dog'})
+        self.assertIn('dog', predicate_keys(words))
+        self.assertIn(HE, predicate_keys(words))
+
+    def test_fill_does_not_change_objects(self):
+        template = PredicateTemplate(Verb('bring'), BasicWord.preposition('to'), None)
+        objects = [HIM, IT]
+        template.fill(objects)
+        self.assertEqual(objects, [HIM, IT])
+
+    def test_fill_particle_not_separable(self):
+        template = PredicateTemplate(Verb('pick'), None, BasicWord('up'))
+        self.assertEqual(template.fill([IT]), [Verb('pick'), BasicWord('up'), IT])
+
+    def test_fill_three_objects(self):
+        template = PredicateTemplate(Verb('throw'), BasicWord.preposition('for'), BasicWord.particle('away'))
+        self.assertEqual(
+            template.fill([Noun('cat'), HIM, Noun('dog'), THEM, Noun('pig')]),
+            [Verb('throw'), HIM, THEM, BasicWord.particle('away'), Noun('dog'), Noun('cat'),
+             BasicWord.preposition('for'), Noun('pig')]
+        )
+
+    def test_fill_two_objects_no_particle_no_preposition(self):
+        template = PredicateTemplate(Verb('show'), None, None)
+        self.assertEqual(template.fill([HIM, IT]), [Verb('show'), HIM, IT])
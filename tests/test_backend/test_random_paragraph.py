@@ -1,7 +1,8 @@
 import random
 import unittest
 
-from sentences.backend.random_paragraph import RandomParagraph, get_subj
+from sentences.backend.random_paragraph import RandomParagraph, SubjectPool, get_subj
+from sentences.backend.random_sentences import RandomSentences
 from sentences.words.pronoun import Pronoun
 from sentences.words.punctuation import Punctuation
 from sentences.words.noun import Noun
@@ -25,6 +26,21 @@ class TestRandomParagraph(unittest.TestCase):
         ]
         self.rp = RandomParagraph(0.2, self.verbs, self.countable + self.uncountable)
 
+    def test_chain_paragraph_subject_not_in_predicate_by_base_noun(self):
+        nouns = [Noun('water'), Noun.uncountable_noun('water'), Noun('dog')]
+        verbs = [{'verb': Verb('see'), 'preposition': None, 'objects': 1, 'particle': None}]
+        paragraph = RandomParagraph(0.0, verbs, nouns, rng=random.Random(6))
+        for sentence in paragraph.create_chain_paragraph(50):
+            self.assertNotEqual(sentence[0].base_noun, sentence[2].base_noun)
+
+    def test_from_word_maker_matches_word_lists(self):
+        nouns = self.countable + self.uncountable
+        word_maker = RandomSentences(self.verbs, nouns).with_rng(random.Random(4))
+        from_word_maker = RandomParagraph.from_word_maker(0.2, word_maker)
+        from_lists = RandomParagraph(0.2, self.verbs, nouns, rng=random.Random(4))
+        self.assertEqual(from_word_maker.create_chain_paragraph(10), from_lists.create_chain_paragraph(10))
+        self.assertEqual(from_word_maker.create_pool_paragraph(3, 10), from_lists.create_pool_paragraph(3, 10))
+
     def test_get_subj_does_not_pick_subj_in_predicate(self):
         predicate = [BasicWord('hi')]
         pool = [BasicWord('hi'), BasicWord('ho')]
@@ -43,26 +59,26 @@ class TestRandomParagraph(unittest.TestCase):
                 BasicWord('baby')]
 
         random.seed(10)
+        self.assertEqual(get_subj(pool, predicate), BasicWord('chimpanzee'))
         self.assertEqual(get_subj(pool, predicate), BasicWord('baby'))
         self.assertEqual(get_subj(pool, predicate), BasicWord('baby'))
-        self.assertEqual(get_subj(pool, predicate), BasicWord('loser'))
-        self.assertEqual(get_subj(pool, predicate), BasicWord('loser'))
-        self.assertEqual(get_subj(pool, predicate), BasicWord('chimpanzee'))
         self.assertEqual(get_subj(pool, predicate), BasicWord('chimpanzee'))
         self.assertEqual(get_subj(pool, predicate), BasicWord('monkey'))
+        self.assertEqual(get_subj(pool, predicate), BasicWord('baby'))
+        self.assertEqual(get_subj(pool, predicate), BasicWord('baby'))
 
     def test_get_subject_pool_never_repeats(self):
         random.seed(10)
 
         answer = self.rp.get_subject_pool(15)
         self.assertEqual(answer,
-                         [Noun('milk'), Noun('dog'), Noun('sand'), Noun('pig'), IT, Noun('frog'),
-                          Noun('rice'), YOU, Noun('water'), I, Noun('cat'), WE, THEY, SHE, HE])
+                         [Noun('milk'), Noun('dog'), Noun('frog'), Noun('cat'), SHE, Noun('water'),
+                          Noun('pig'), Noun('sand'), Noun('rice'), IT, HE, THEY, YOU, WE, I])
 
         answer = self.rp.get_subject_pool(15)
         self.assertEqual(answer,
-                         [Noun('cat'), Noun('water'), Noun('sand'), Noun('milk'), Noun('frog'),
-                          Noun('rice'), THEY, SHE, Noun('dog'), WE, Noun('pig'), I, IT, YOU, HE])
+                         [Noun('water'), Noun('cat'), Noun('milk'), Noun('sand'), Noun('dog'),
+                          Noun('frog'), Noun('rice'), Noun('pig'), HE, WE, IT, SHE, YOU, THEY, I])
 
     def test_get_subject_pool_raises_value_error(self):
         self.assertRaises(ValueError, self.rp.get_subject_pool, 16)
@@ -80,7 +96,7 @@ class TestRandomParagraph(unittest.TestCase):
         random.seed(20)
         paragraph = self.rp.create_pool_paragraph(pool_size=3, num_sentences=20)
 
-        subjects = [Noun('pig'), Noun('cat'), SHE]
+        subjects = [Noun('dog'), Noun('rice'), Noun('pig')]
         for sentence in paragraph:
             subject = sentence[0]
             predicate = sentence[1:]
@@ -95,8 +111,8 @@ class TestRandomParagraph(unittest.TestCase):
 
         answer = repeats.create_pool_paragraph(2, 2)
         expected = [
-            [Noun('water'), Verb('give'), Noun('cat'), Noun('water'), PERIOD],
-            [Noun('cat'), Verb('give'), Noun('cat'), Noun('water'), PERIOD]
+            [Noun('cat'), Verb('give'), Noun('water'), Noun('cat'), PERIOD],
+            [Noun('cat'), Verb('give'), Noun('water'), Noun('cat'), PERIOD]
         ]
         self.assertEqual(answer, expected)
 
@@ -111,11 +127,11 @@ class TestRandomParagraph(unittest.TestCase):
         random.seed(3)
         paragraph = self.rp.create_pool_paragraph(2, 5)
         expected = [
-            [Noun('pig'), Verb('eat'), Noun('sand'), PERIOD],
-            [Noun('pig'), Verb('give'), Noun('cat'), BasicWord.preposition('to'), Noun('dog'), PERIOD],
-            [Noun('sand'), Verb('jump'), BasicWord.preposition('over'), Noun('milk'), EXCLAMATION],
-            [Noun('sand'), Verb('eat'), HIM, PERIOD],
-            [Noun('sand'), Verb('jump'), BasicWord.preposition('over'), Noun('milk'), EXCLAMATION]
+            [Noun('pig'), Verb('give'), Noun('cat'), BasicWord.preposition('to'), Noun('sand'), PERIOD],
+            [Noun('pig'), Verb('give'), Noun('sand'), Noun('milk'), EXCLAMATION],
+            [Noun('pig'), Verb('give'), Noun('milk'), Noun('cat'), PERIOD],
+            [Noun('pig'), Verb('jump'), BasicWord.preposition('over'), Noun('water'), PERIOD],
+            [Noun('water'), Verb('give'), Noun('sand'), BasicWord.preposition('to'), Noun('pig'), PERIOD]
         ]
         self.assertEqual(paragraph, expected)
 
@@ -131,9 +147,9 @@ class TestRandomParagraph(unittest.TestCase):
         repeats = RandomParagraph(0.0, verb_list, [Noun('joe'), Noun('bob')])
         paragraph = repeats.create_chain_paragraph(3)
         expected = [
-            [Noun('joe'), Verb('give'), Noun('joe'), Noun('bob'), PERIOD],
-            [Noun('bob'), Verb('give'), Noun('bob'), Noun('joe'), EXCLAMATION],
             [Noun('joe'), Verb('give'), Noun('bob'), Noun('joe'), PERIOD],
+            [Noun('joe'), Verb('give'), Noun('bob'), Noun('joe'), PERIOD],
+            [Noun('joe'), Verb('give'), Noun('bob'), Noun('joe'), EXCLAMATION],
         ]
         self.assertEqual(expected, paragraph)
 
@@ -177,3 +193,54 @@ class TestRandomParagraph(unittest.TestCase):
             [Noun('dog'), Verb('jump'), BasicWord.preposition('over'), Noun('sand'), PERIOD],
         ]
         self.assertEqual(answer, expected)
+
+    def test_iter_chain_paragraph_same_as_create_chain_paragraph(self):
+        random.seed(4567)
+        expected = self.rp.create_chain_paragraph(20)
+        random.seed(4567)
+        answer = self.rp.iter_chain_paragraph(20)
+        self.assertNotIsInstance(answer, list)
+        self.assertEqual(list(answer), expected)
+
+    def test_iter_chain_paragraph_changing_yielded_sentence(self):
+        random.seed(4567)
+        expected = self.rp.create_chain_paragraph(20)
+        random.seed(4567)
+        answer = []
+        for sentence in self.rp.iter_chain_paragraph(20):
+            answer.append(sentence[:])
+            sentence.clear()
+        self.assertEqual(answer, expected)
+
+    def test_iter_pool_paragraph_same_as_create_pool_paragraph(self):
+        random.seed(4567)
+        expected = self.rp.create_pool_paragraph(3, 20)
+        random.seed(4567)
+        self.assertEqual(list(self.rp.iter_pool_paragraph(3, 20)), expected)
+
+    def test_iter_pool_paragraph_raises_value_error_before_iterating(self):
+        self.assertRaises(ValueError, self.rp.iter_pool_paragraph, 100, 2)
+
+    def test_iter_paragraph_long(self):
+        sentences = self.rp.iter_chain_paragraph(50000)
+        self.assertEqual(sum(1 for _ in sentences), 50000)
+
+    def test_subject_pool_compatible(self):
+        pool = SubjectPool([Noun('dog'), HE, Noun('cat'), THEY])
+        self.assertEqual(len(pool), 4)
+        self.assertEqual(pool.compatible([Verb('eat'), PERIOD]), 0b1111)
+        self.assertEqual(pool.compatible([Verb('give'), HIM, Noun('cat'), PERIOD]), 0b1001)
+        self.assertEqual(pool.compatible([Verb('give'), Noun('dog'), HIM, Noun('cat'), THEM]), 0)
+
+    def test_subject_pool_choose_same_as_get_subj(self):
+        subjects = [Noun('dog'), HE, Noun('cat'), THEY, Noun('pig')]
+        pool = SubjectPool(subjects)
+        for predicate in ([Verb('eat'), PERIOD], [Verb('give'), HIM, Noun('cat'), PERIOD], [Verb('like'), THEM]):
+            random.seed(8)
+            expected = [get_subj(subjects, predicate) for _ in range(30)]
+            random.seed(8)
+            self.assertEqual([pool.choose(predicate) for _ in range(30)], expected)
+
+    def test_subject_pool_choose_raises_value_error(self):
+        pool = SubjectPool([Noun('dog'), HE])
+        self.assertRaises(ValueError, pool.choose, [Verb('give'), HIM, Noun('dog'), PERIOD])
@@ -1,12 +1,15 @@
 import random
 import unittest
+from collections.abc import Sequence
 
-from sentences.backend.random_sentences import RandomSentences, assign_objects
+from sentences.backend.investigation_tools import word_key
+from sentences.backend.random_sentences import RandomSentences, UniqueIndexSampler, assign_objects, uniform_floats
 from sentences.words.pronoun import Pronoun
 from sentences.words.punctuation import Punctuation
 from sentences.words.noun import Noun
 from sentences.words.verb import Verb
 from sentences.words.basicword import BasicWord
+from sentences.words.verbgroup import as_verb_group
 
 PERIOD = Punctuation.PERIOD
 EXCLAMATION = Punctuation.EXCLAMATION
@@ -14,6 +17,22 @@ EXCLAMATION = Punctuation.EXCLAMATION
 I, ME, YOU, HE, HIM, SHE, HER, IT, WE, US, THEY, THEM = Pronoun.__members__.values()
 
 
+class CountingNouns(Sequence):
+    """Nouns that count how many times they are indexed."""
+    def __init__(self, size):
+        self.reads = 0
+        self._size = size
+
+    def __len__(self):
+        return self._size
+
+    def __getitem__(self, index):
+        if not 0 <= index < self._size:
+            raise IndexError(index)
+        self.reads += 1
+        return Noun('noun{}'.format(index))
+
+
 class TestRawWordsRandomisation(unittest.TestCase):
     def setUp(self):
         self.countable = [Noun('dog'), Noun('cat'), Noun('pig'), Noun('frog')]
@@ -138,7 +157,7 @@ class TestRawWordsRandomisation(unittest.TestCase):
         self.assertEqual(answer, [Verb('give'), Noun('pig'), Noun('sand'), PERIOD])
 
         answer = self.generator.predicate()
-        expected = [Verb('give'), Noun('frog'), BasicWord.preposition('to'), Noun('pig'), PERIOD]
+        expected = [Verb('give'), Noun('frog'), BasicWord.preposition('to'), Noun('milk'), PERIOD]
         self.assertEqual(answer, expected)
 
     def test_sentence(self):
@@ -364,3 +383,229 @@ class TestRawWordsRandomisation(unittest.TestCase):
         expected = [Noun('rice'), Verb('throw'), BasicWord.particle('away'), Noun('water'),
                     BasicWord.preposition('for'), Noun('frog'), PERIOD]
         self.assertEqual(answer, expected)
+
+
+class TestWeightedRandomSentences(unittest.TestCase):
+    def setUp(self):
+        self.nouns = [Noun('dog'), Noun('cat'), Noun('pig')]
+        self.verbs = [
+            {'verb': Verb('eat'), 'preposition': None, 'objects': 1, 'particle': None},
+            {'verb': Verb('jump'), 'preposition': BasicWord.preposition('over'), 'objects': 1, 'particle': None},
+        ]
+
+    def test_weights_must_match_words(self):
+        self.assertRaises(ValueError, RandomSentences, self.verbs, self.nouns, [1, 2, 3], None)
+        self.assertRaises(ValueError, RandomSentences, self.verbs, self.nouns, None, [1, 2])
+
+    def test_equal_weights_same_as_unweighted(self):
+        random.seed(20)
+        unweighted = [RandomSentences(self.verbs, self.nouns).sentence() for _ in range(10)]
+        random.seed(20)
+        weighted = [RandomSentences(self.verbs, self.nouns, [2, 2], [1, 1, 1]).sentence() for _ in range(10)]
+        self.assertEqual(unweighted, weighted)
+
+    def test_weighted_choice(self):
+        random.seed(20)
+        generator = RandomSentences(self.verbs, self.nouns, [0, 1], [0, 0, 1])
+        for _ in range(20):
+            sentence = generator.sentence(p_pronoun=0)
+            self.assertEqual(sentence[:4], [Noun('pig'), Verb('jump'), BasicWord.preposition('over'), Noun('pig')])
+
+
+class TestBatchRandomSentences(unittest.TestCase):
+    def setUp(self):
+        self.nouns = [Noun('dog'), Noun('cat'), Noun('pig'), Noun('water')]
+        self.verbs = [
+            {'verb': Verb('eat'), 'preposition': None, 'objects': 1, 'particle': None},
+            {'verb': Verb('give'), 'preposition': BasicWord.preposition('to'), 'objects': 2, 'particle': None},
+            {'verb': Verb('pick'), 'preposition': None, 'objects': 1, 'particle': BasicWord.particle('up')},
+        ]
+        self.generator = RandomSentences(self.verbs, self.nouns)
+
+    def test_uniform_floats(self):
+        random.seed(1)
+        floats = uniform_floats(100)
+        self.assertEqual(len(floats), 100)
+        self.assertTrue(all(0 <= value < 1 for value in floats))
+        random.seed(1)
+        self.assertEqual(uniform_floats(100), floats)
+
+    def test_sentences_count_and_structure(self):
+        random.seed(5)
+        sentences = self.generator.sentences(200, p_pronoun=0.3)
+        self.assertEqual(len(sentences), 200)
+        verbs = [verb_group['verb'] for verb_group in self.verbs]
+        for sentence in sentences:
+            self.assertIn(sentence[-1], (PERIOD, EXCLAMATION))
+            self.assertIn(sentence[1], verbs)
+            if sentence[1] == Verb('give'):
+                self.assertEqual(len(sentence), 6)
+                self.assertNotEqual(sentence[2], sentence[4])
+                self.assertEqual(sentence[3], BasicWord.preposition('to'))
+
+    def test_sentences_p_pronoun(self):
+        random.seed(5)
+        for sentence in self.generator.sentences(50, p_pronoun=0):
+            self.assertIsInstance(sentence[0], Noun)
+        for sentence in self.generator.sentences(50, p_pronoun=1):
+            self.assertIsInstance(sentence[0], Pronoun)
+            self.assertIn(sentence[0], (I, YOU, HE, SHE, IT, WE, THEY))
+
+    def test_predicates_uses_all_words(self):
+        random.seed(5)
+        predicates = self.generator.predicates(300, p_pronoun=0)
+        self.assertEqual({predicate[0] for predicate in predicates}, {Verb('eat'), Verb('give'), Verb('pick')})
+        self.assertEqual({predicate[1] for predicate in predicates if predicate[0] == Verb('eat')}, set(self.nouns))
+
+    def test_predicates_object_pronouns(self):
+        random.seed(5)
+        for predicate in self.generator.predicates(50, p_pronoun=1):
+            if predicate[0] == Verb('eat'):
+                self.assertIn(predicate[1], (ME, YOU, HIM, HER, IT, US, THEM))
+
+    def test_predicates_weighted(self):
+        random.seed(5)
+        generator = RandomSentences(self.verbs, self.nouns, [0, 0, 1], [0, 0, 0, 1])
+        for predicate in generator.predicates(20, p_pronoun=0):
+            self.assertEqual(predicate[:3], [Verb('pick'), BasicWord.particle('up'), Noun('water')])
+
+    def test_predicates_objects_do_not_repeat_a_noun_key(self):
+        random.seed(5)
+        nouns = [Noun('water'), Noun.uncountable_noun('water'), Noun('dog')]
+        verbs = [{'verb': Verb('give'), 'preposition': BasicWord.preposition('to'), 'objects': 2, 'particle': None}]
+        generator = RandomSentences(verbs, nouns)
+        for predicate in generator.predicates(100, p_pronoun=0):
+            self.assertNotEqual(word_key(predicate[1]), word_key(predicate[3]))
+
+    def test_zero_sentences(self):
+        self.assertEqual(self.generator.sentences(0), [])
+        self.assertEqual(self.generator.predicates(0), [])
+
+
+class TestSamplingWithoutReplacement(unittest.TestCase):
+    def setUp(self):
+        self.nouns = [Noun('dog'), Noun('cat'), Noun('pig')]
+        self.verbs = [{'verb': Verb('give'), 'preposition': None, 'objects': 2, 'particle': None}]
+        self.generator = RandomSentences(self.verbs, self.nouns)
+
+    def test_unique_index_sampler(self):
+        random.seed(3)
+        sampler = UniqueIndexSampler(50)
+        drawn = [sampler.draw() for _ in range(50)]
+        self.assertEqual(sorted(drawn), list(range(50)))
+        self.assertNotEqual(drawn, list(range(50)))
+        self.assertEqual(len(sampler), 0)
+        self.assertRaises(ValueError, sampler.draw)
+
+    def test_word_key(self):
+        self.assertEqual(word_key(HIM), HE)
+        self.assertEqual(word_key(HE), HE)
+        self.assertEqual(word_key(Noun('dog').plural().definite()), 'dog')
+        self.assertEqual(word_key(Noun.uncountable_noun('dog')), word_key(Noun('dog')))
+
+    def test_distinct_subjects(self):
+        random.seed(3)
+        subjects = self.generator.distinct_subjects(10, p_pronoun=0.5)
+        self.assertEqual(len({word_key(subj) for subj in subjects}), 10)
+        for subj in subjects:
+            if isinstance(subj, Pronoun):
+                self.assertEqual(subj.subject(), subj)
+
+    def test_distinct_subjects_p_pronoun_extremes(self):
+        random.seed(3)
+        self.assertEqual(sorted(noun.value for noun in self.generator.distinct_subjects(3, 0)), ['cat', 'dog', 'pig'])
+        self.assertEqual(set(self.generator.distinct_subjects(7, 1)), {I, YOU, HE, SHE, IT, WE, THEY})
+
+    def test_distinct_subjects_infeasible_raises_without_drawing(self):
+        random.seed(3)
+        state = random.getstate()
+        self.assertRaises(ValueError, self.generator.distinct_subjects, 4, 0)
+        self.assertRaises(ValueError, self.generator.distinct_subjects, 11, 0.5)
+        self.assertEqual(random.getstate(), state)
+
+    def test_distinct_subjects_repeated_nouns_in_list(self):
+        generator = RandomSentences(self.verbs, [Noun('dog'), Noun('dog'), Noun('cat')])
+        self.assertRaises(ValueError, generator.distinct_subjects, 3, 0)
+        self.assertEqual(len(generator.distinct_subjects(2, 0)), 2)
+
+    def test_predicate_excluded(self):
+        random.seed(3)
+        for _ in range(50):
+            predicate = self.generator.predicate(0, excluded=[Noun('dog')])
+            self.assertEqual(predicate[1:3], [Noun('cat'), Noun('pig')] if predicate[1] == Noun('cat')
+                             else [Noun('pig'), Noun('cat')])
+
+    def test_predicate_excluded_pronoun_pair(self):
+        random.seed(3)
+        generator = RandomSentences([{'verb': Verb('see'), 'preposition': None, 'objects': 1, 'particle': None}],
+                                    self.nouns)
+        for _ in range(50):
+            self.assertNotIn(generator.predicate(1, excluded=[HE])[1], (HIM, HE))
+
+    def test_predicate_excluded_picks_verb_that_fits(self):
+        random.seed(3)
+        verbs = self.verbs + [{'verb': Verb('eat'), 'preposition': None, 'objects': 1, 'particle': None}]
+        generator = RandomSentences(verbs, [Noun('dog'), Noun('cat')])
+        for _ in range(20):
+            self.assertEqual(generator.predicate(0, excluded=[Noun('dog')])[:2], [Verb('eat'), Noun('cat')])
+
+    def test_predicate_excluded_fitting_verbs_keep_their_weights(self):
+        random.seed(3)
+        verbs = self.verbs + [{'verb': Verb(value), 'preposition': None, 'objects': 1, 'particle': None}
+                              for value in ('eat', 'see', 'use')]
+        generator = RandomSentences(verbs, [Noun('dog'), Noun('cat')], [100, 1, 3, 0])
+        draws = 4000
+        counts = {Verb('eat'): 0, Verb('see'): 0}
+        for _ in range(draws):
+            counts[generator.predicate(0, excluded=[Noun('dog')])[0]] += 1
+        self.assertAlmostEqual(counts[Verb('see')] / draws, 0.75, delta=0.03)
+
+    def test_predicate_excluded_repeats_subject_when_nothing_fits(self):
+        random.seed(3)
+        generator = RandomSentences(self.verbs, [Noun('dog'), Noun('cat')])
+        predicate = generator.predicate(0, excluded=[Noun('dog')])
+        self.assertEqual(sorted(noun.value for noun in predicate[1:3]), ['cat', 'dog'])
+
+    def test_predicate_excluded_reads_few_nouns_from_large_lexicon(self):
+        nouns = CountingNouns(100000)
+        generator = RandomSentences(self.verbs, nouns, rng=random.Random(3))
+        for index in range(50):
+            paragraph_maker = generator.with_rng(random.Random(index))
+            paragraph_maker.predicate(0, excluded=[Noun('noun0'), Noun('noun1')])
+        self.assertLess(nouns.reads, 200)
+
+    def test_with_rng(self):
+        generator = RandomSentences(self.verbs, self.nouns, rng=random.Random(1))
+        rng = random.Random(5)
+        copy = generator.with_rng(rng)
+        self.assertIsNot(copy, generator)
+        self.assertIs(copy.rng, rng)
+        expected = RandomSentences(self.verbs, self.nouns, rng=random.Random(5))
+        self.assertEqual([copy.sentence() for _ in range(10)], [expected.sentence() for _ in range(10)])
+        self.assertEqual(generator.sentence(), RandomSentences(self.verbs, self.nouns, rng=random.Random(1)).sentence())
+
+    def test_templates_made_once_when_loaded(self):
+        generator = RandomSentences(self.verbs, self.nouns, rng=random.Random(1))
+        templates = generator._templates
+        self.assertEqual(set(templates), {as_verb_group(verb) for verb in self.verbs})
+        copy = generator.with_rng(random.Random(2))
+        for _ in range(20):
+            copy.predicate()
+        self.assertIs(copy._templates, templates)
+        self.assertEqual(len(templates), len({as_verb_group(verb) for verb in self.verbs}))
+
+    def test_templates_for_other_sequences_made_when_drawn(self):
+        verb_groups = tuple(as_verb_group(verb) for verb in self.verbs)
+        generator = RandomSentences(verb_groups, self.nouns, rng=random.Random(1))
+        self.assertEqual(generator._templates, {})
+        predicate = generator.predicate()
+        self.assertEqual(len(generator._templates), 1)
+        self.assertIn(predicate[0], [verb_group.verb for verb_group in generator._templates])
+
+    def test_with_rng_shares_fitting_verbs(self):
+        verbs = self.verbs + [{'verb': Verb('eat'), 'preposition': None, 'objects': 1, 'particle': None}]
+        nouns = [Noun('dog'), Noun('cat')]
+        generator = RandomSentences(verbs, nouns)
+        for seed in range(10):
+            predicate = generator.with_rng(random.Random(seed)).predicate(0, excluded=[Noun('dog')])
+            self.assertEqual(predicate[:2], [Verb('eat'), Noun('cat')])
@@ -0,0 +1,137 @@
+import random
+import unittest
+
+from sentences.backend.alias_table import AliasTable
+from sentences.backend.errormaker import ErrorMaker
+from sentences.backend.grammarizer import Grammarizer
+from sentences.backend.random_paragraph import RandomParagraph
+from sentences.backend.random_sentences import RandomSentences, UniqueIndexSampler, uniform_floats
+from sentences.backend.random_streams import get_rng, sub_stream, GeneratorRandom
+from sentences.words.noun import Noun
+from sentences.words.verb import Verb
+from sentences.words.basicword import BasicWord
+
+
+class FakeGenerator(object):
+    """The NumPy Generator methods that GeneratorRandom uses, backed by random.Random."""
+    def __init__(self, seed):
+        self._random = random.Random(seed)
+
+    def random(self, size=None):
+        if size is None:
+            return self._random.random()
+        return FakeArray(self._random.random() for _ in range(size))
+
+    def integers(self, low, high):
+        return self._random.randrange(low, high)
+
+    def bytes(self, length):
+        return bytes(self._random.randrange(256) for _ in range(length))
+
+
+class FakeArray(list):
+    def tolist(self):
+        return list(self)
+
+
+class TestRandomStreams(unittest.TestCase):
+    def setUp(self):
+        self.nouns = [Noun('dog'), Noun('cat'), Noun('pig'), Noun.uncountable_noun('water'), Noun.proper_noun('Joe')]
+        self.verbs = [
+            {'verb': Verb('eat'), 'preposition': None, 'objects': 1, 'particle': None},
+            {'verb': Verb('give'), 'preposition': BasicWord.preposition('to'), 'objects': 2, 'particle': None},
+            {'verb': Verb('jump'), 'preposition': None, 'objects': 0, 'particle': None},
+        ]
+
+    def make_paragraph(self, rng):
+        raw = RandomParagraph(0.2, self.verbs, self.nouns, rng=rng).create_chain_paragraph(10)
+        grammatical = Grammarizer(raw, rng=rng).generate_tokens()
+        error_maker = ErrorMaker(grammatical, 0.5, rng=rng)
+        error_maker.create_all_errors()
+        return error_maker.answer_paragraph, error_maker.error_paragraph
+
+    def test_get_rng(self):
+        self.assertIs(get_rng(), random)
+        rng = random.Random(1)
+        self.assertIs(get_rng(rng), rng)
+        generator = FakeGenerator(1)
+        self.assertIsInstance(get_rng(generator), GeneratorRandom)
+        self.assertIs(get_rng(generator).generator, generator)
+
+    def test_sub_stream_is_repeatable(self):
+        self.assertEqual(_draws(sub_stream(10, 3), 5), _draws(sub_stream(10, 3), 5))
+        self.assertEqual(_draws(sub_stream('abc', 0), 5), _draws(sub_stream('abc', 0), 5))
+
+    def test_sub_streams_are_independent(self):
+        self.assertNotEqual(_draws(sub_stream(10, 0), 5), _draws(sub_stream(10, 1), 5))
+        self.assertNotEqual(_draws(sub_stream(10, 0), 5), _draws(sub_stream(11, 0), 5))
+
+    def test_pipeline_same_rng_seed_same_output(self):
+        self.assertEqual(self.make_paragraph(random.Random(7)), self.make_paragraph(random.Random(7)))
+
+    def test_pipeline_does_not_use_global_random(self):
+        random.seed(3)
+        expected = random.random()
+        random.seed(3)
+        self.make_paragraph(random.Random(7))
+        self.assertEqual(random.random(), expected)
+
+    def test_pipeline_rng_is_not_affected_by_global_random(self):
+        random.seed(1)
+        first = self.make_paragraph(random.Random(7))
+        random.seed(2)
+        self.assertEqual(self.make_paragraph(random.Random(7)), first)
+
+    def test_pipeline_default_uses_global_random(self):
+        random.seed(5)
+        first = self.make_paragraph(None)
+        random.seed(5)
+        self.assertEqual(self.make_paragraph(None), first)
+
+    def test_pipeline_with_generator(self):
+        first = self.make_paragraph(FakeGenerator(4))
+        self.assertEqual(self.make_paragraph(FakeGenerator(4)), first)
+        self.assertEqual(len(first[0]), 10)
+
+    def test_uniform_floats_same_stream_as_rng_random(self):
+        rng = random.Random(3)
+        self.assertEqual(uniform_floats(20, random.Random(3)), [rng.random() for _ in range(20)])
+
+        generator_floats = uniform_floats(20, GeneratorRandom(FakeGenerator(3)))
+        generator_rng = GeneratorRandom(FakeGenerator(3))
+        self.assertEqual(generator_floats, [generator_rng.random() for _ in range(20)])
+        self.assertEqual(uniform_floats(20, FakeGenerator(3)), generator_floats)
+
+    def test_uniform_floats_continues_generator_stream(self):
+        generator_rng = GeneratorRandom(FakeGenerator(5))
+        expected_rng = GeneratorRandom(FakeGenerator(5))
+        expected = [expected_rng.random() for _ in range(10)]
+        self.assertEqual(uniform_floats(4, generator_rng) + [generator_rng.random() for _ in range(6)], expected)
+
+    def test_random_sentences_batch_with_rng(self):
+        sentences = RandomSentences(self.verbs, self.nouns, rng=random.Random(2)).sentences(20)
+        self.assertEqual(RandomSentences(self.verbs, self.nouns, rng=random.Random(2)).sentences(20), sentences)
+
+    def test_helpers_with_rng(self):
+        self.assertEqual(uniform_floats(5, random.Random(1)), uniform_floats(5, random.Random(1)))
+        self.assertEqual(uniform_floats(0, random.Random(1)), [])
+        table = AliasTable([1, 2, 3])
+        rng_1, rng_2 = random.Random(1), random.Random(1)
+        self.assertEqual([table.index(rng_1) for _ in range(10)], [table.index(rng_2) for _ in range(10)])
+
+        sampler = UniqueIndexSampler(10, random.Random(1))
+        self.assertEqual(sorted(sampler.draw() for _ in range(10)), list(range(10)))
+
+    def test_generator_random_methods(self):
+        rng = GeneratorRandom(FakeGenerator(1))
+        self.assertTrue(0 <= rng.random() < 1)
+        self.assertTrue(all(3 <= rng.randrange(3, 6) < 6 for _ in range(20)))
+        self.assertTrue(all(0 <= rng.randrange(4) < 4 for _ in range(20)))
+        self.assertIn(rng.choice('abc'), 'abc')
+        self.assertTrue(all(0 <= rng.getrandbits(10) < 2 ** 10 for _ in range(20)))
+        self.assertRaises(ValueError, rng.randrange, 0)
+        self.assertRaises(IndexError, rng.choice, [])
+
+
+def _draws(rng, count):
+    return [rng.random() for _ in range(count)]
@@ -0,0 +1,142 @@
+import os
+import random
+import unittest
+
+from sentences import DATA_PATH, COUNTABLE_NOUNS_CSV, UNCOUNTABLE_NOUNS_CSV, PROPER_NOUNS_CSV, VERBS_CSV
+from sentences.backend.loader import countable_nouns, uncountable_nouns, proper_nouns, verbs
+from sentences.backend.random_sentences import RandomSentences
+from sentences.backend.sqlite_lexicon import (SQLiteLexicon, noun_kind,
+                                              COUNTABLE, UNCOUNTABLE, PROPER, PLURAL_PROPER)
+from sentences.words.basicword import BasicWord
+from sentences.words.noun import Noun
+from sentences.words.verb import Verb
+from sentences.words.verbgroup import VerbGroup, as_verb_group
+from tests import TESTS_FILES
+
+CSVS = [os.path.join(DATA_PATH, name) for name in
+        (VERBS_CSV, COUNTABLE_NOUNS_CSV, UNCOUNTABLE_NOUNS_CSV, PROPER_NOUNS_CSV)]
+
+
+class TestSQLiteLexicon(unittest.TestCase):
+    def setUp(self):
+        self.lexicon = SQLiteLexicon(':memory:')
+        self.lexicon.import_csvs(*CSVS)
+        self.verbs = verbs(CSVS[0])
+
+    def tearDown(self):
+        self.lexicon.close()
+
+    def test_noun_kind(self):
+        self.assertEqual(noun_kind(Noun('dog')), COUNTABLE)
+        self.assertEqual(noun_kind(Noun.uncountable_noun('water')), UNCOUNTABLE)
+        self.assertEqual(noun_kind(Noun.proper_noun('Joe')), PROPER)
+        self.assertEqual(noun_kind(Noun.proper_noun('the Joneses', plural=True)), PLURAL_PROPER)
+
+    def test_import_csvs(self):
+        expected_nouns = countable_nouns(CSVS[1]) + uncountable_nouns(CSVS[2]) + proper_nouns(CSVS[3])
+        self.assertEqual(self.lexicon.nouns(), expected_nouns)
+        self.assertEqual(self.lexicon.verbs(), self.verbs)
+
+    def test_import_csvs_replaces_words(self):
+        self.lexicon.add_nouns([Noun('wackawacka')])
+        self.lexicon.import_csvs(*CSVS)
+        self.assertNotIn(Noun('wackawacka'), self.lexicon.nouns())
+
+    def test_nouns_by_kind(self):
+        self.assertEqual(self.lexicon.nouns(UNCOUNTABLE), uncountable_nouns(CSVS[2]))
+        self.assertEqual(self.lexicon.noun_count(COUNTABLE), len(countable_nouns(CSVS[1])))
+        self.assertEqual(self.lexicon.noun_count(), len(self.lexicon.nouns()))
+        self.assertRaises(ValueError, self.lexicon.nouns, 'plural')
+
+    def test_verbs_by_frame(self):
+        two_objects_preposition = [verb_group for verb_group in self.verbs
+                                   if verb_group.objects == 2 and verb_group.preposition is not None]
+        self.assertTrue(two_objects_preposition)
+        self.assertEqual(self.lexicon.verbs(objects=2, preposition=True), two_objects_preposition)
+        self.assertEqual(self.lexicon.verb_count(objects=2, preposition=True), len(two_objects_preposition))
+
+        with_particle = [verb_group for verb_group in self.verbs if verb_group.particle is not None]
+        self.assertEqual(self.lexicon.verbs(particle=True), with_particle)
+        self.assertEqual(self.lexicon.verb_count(particle=False), len(self.verbs) - len(with_particle))
+
+    def test_add_verbs(self):
+        verb_group = VerbGroup(Verb('take', 'took'), BasicWord.preposition('from'), 3, BasicWord.particle('away'))
+        self.lexicon.add_verbs([verb_group])
+        self.assertEqual(self.lexicon.verbs(objects=3), [verb_group])
+
+    def test_add_verbs_accepts_verb_dicts(self):
+        verb_dict = {'verb': Verb('take', 'took'), 'preposition': BasicWord.preposition('from'),
+                     'objects': 3, 'particle': BasicWord.particle('away')}
+        self.lexicon.add_verbs([verb_dict])
+        self.assertEqual(self.lexicon.verbs(objects=3), [as_verb_group(verb_dict)])
+
+    def test_random_noun(self):
+        random.seed(4)
+        uncountable = uncountable_nouns(CSVS[2])
+        for _ in range(20):
+            self.assertIn(self.lexicon.random_noun(UNCOUNTABLE), uncountable)
+        self.assertIsNone(self.lexicon.random_noun(PLURAL_PROPER))
+
+    def test_random_verb(self):
+        random.seed(4)
+        for _ in range(20):
+            verb_group = self.lexicon.random_verb(objects=1, preposition=False)
+            self.assertIn(verb_group, self.verbs)
+            self.assertEqual(verb_group.objects, 1)
+            self.assertIsNone(verb_group.preposition)
+        self.assertIsNone(self.lexicon.random_verb(objects=5))
+
+    def test_random_noun_picks_by_position_in_kind(self):
+        uncountable = uncountable_nouns(CSVS[2])
+        lexicon = SQLiteLexicon(':memory:', rng=random.Random(7))
+        lexicon.import_csvs(*CSVS)
+        expected_rng = random.Random(7)
+        for _ in range(20):
+            self.assertEqual(lexicon.random_noun(UNCOUNTABLE), uncountable[expected_rng.randrange(len(uncountable))])
+        lexicon.close()
+
+    def test_random_noun_sees_added_words(self):
+        self.assertIsNone(self.lexicon.random_noun(PLURAL_PROPER))
+        joneses = Noun.proper_noun('the Joneses', plural=True)
+        self.lexicon.add_nouns([joneses])
+        self.assertEqual(self.lexicon.random_noun(PLURAL_PROPER), joneses)
+
+    def test_random_verb_sees_words_added_by_another_connection(self):
+        filename = os.path.join(TESTS_FILES, 'delete_me.sqlite')
+        try:
+            with SQLiteLexicon(filename) as reader, SQLiteLexicon(filename) as writer:
+                self.assertIsNone(reader.random_verb(objects=3))
+                verb_group = VerbGroup(Verb('take', 'took'), BasicWord.preposition('from'), 3)
+                writer.add_verbs([verb_group])
+                self.assertEqual(reader.random_verb(objects=3), verb_group)
+        finally:
+            if os.path.exists(filename):
+                os.remove(filename)
+
+    def test_word_lists(self):
+        noun_list = self.lexicon.noun_list(UNCOUNTABLE)
+        self.assertEqual(list(noun_list), uncountable_nouns(CSVS[2]))
+        self.assertEqual(noun_list[-1], uncountable_nouns(CSVS[2])[-1])
+        self.assertEqual(noun_list[:3], uncountable_nouns(CSVS[2])[:3])
+        self.assertRaises(IndexError, noun_list.__getitem__, len(noun_list))
+
+        verb_list = self.lexicon.verb_list(objects=1, preposition=False)
+        self.assertEqual(list(verb_list), self.lexicon.verbs(objects=1, preposition=False))
+
+    def test_word_lists_work_with_random_sentences(self):
+        generator = RandomSentences(self.lexicon.verb_list(), self.lexicon.noun_list(COUNTABLE), rng=random.Random(3))
+        countable = countable_nouns(CSVS[1])
+        for _ in range(20):
+            self.assertIn(generator.subject(0.0), countable)
+            self.assertIn(generator.predicate()[0], [verb_group.verb for verb_group in self.verbs])
+
+    def test_file_database_persists(self):
+        filename = os.path.join(TESTS_FILES, 'delete_me.sqlite')
+        try:
+            with SQLiteLexicon(filename) as lexicon:
+                lexicon.add_nouns([Noun('dog')])
+            with SQLiteLexicon(filename) as lexicon:
+                self.assertEqual(lexicon.nouns(), [Noun('dog')])
+        finally:
+            if os.path.exists(filename):
+                os.remove(filename)
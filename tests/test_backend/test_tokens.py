@@ -0,0 +1,144 @@
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from sentences.backend.tokens import (TokenParagraph, Vocabulary, as_tokens, word_kind,
+                                      OTHER, NOUN, VERB, PRONOUN, PUNCTUATION)
+from sentences.words.basicword import BasicWord
+from sentences.words.noun import Noun
+from sentences.words.pronoun import Pronoun, CapitalPronoun
+from sentences.words.punctuation import Punctuation
+from sentences.words.verb import Verb
+from sentences.words.wordtools.tags import Tags
+from sentences.words.wordtools.wordtag import WordTag
+
+
+class TestTokens(unittest.TestCase):
+    def setUp(self):
+        self.paragraph = [
+            [Noun('dog'), Verb('play'), BasicWord.preposition('with'), Pronoun.HIM, Punctuation.PERIOD],
+            [Pronoun.HE, Verb('like'), Noun('dog'), Punctuation.EXCLAMATION],
+        ]
+
+    def test_word_kind(self):
+        self.assertEqual(word_kind(Noun('dog')), NOUN)
+        self.assertEqual(word_kind(Verb('play')), VERB)
+        self.assertEqual(word_kind(CapitalPronoun.HE), PRONOUN)
+        self.assertEqual(word_kind(Punctuation.COMMA), PUNCTUATION)
+        self.assertEqual(word_kind(BasicWord('x')), OTHER)
+
+    def test_vocabulary_ids_are_shared(self):
+        vocabulary = Vocabulary()
+        dog_id = vocabulary.id(Noun('dog'))
+        self.assertEqual(vocabulary.id(Noun('cat')), dog_id + 1)
+        self.assertEqual(vocabulary.id(Noun('dog')), dog_id)
+        self.assertEqual(len(vocabulary), 2)
+        self.assertEqual(vocabulary.word(dog_id), Noun('dog'))
+        self.assertEqual(vocabulary.kind(dog_id), NOUN)
+
+    def test_vocabulary_ids_are_consistent_across_threads(self):
+        vocabulary = Vocabulary()
+        words = [Noun('threaded vocabulary {}'.format(num)) for num in range(2000)]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda _: [vocabulary.id(word) for word in words], range(8)))
+        self.assertEqual(len(vocabulary), len(words))
+        for ids in results:
+            self.assertEqual([vocabulary.word(word_id) for word_id in ids], words)
+
+    def test_each_paragraph_gets_its_own_vocabulary(self):
+        tokens = TokenParagraph.from_paragraph(self.paragraph)
+        other = as_tokens(self.paragraph)
+        self.assertIsNot(tokens.vocabulary, other.vocabulary)
+        self.assertEqual(len(tokens.vocabulary), 8)
+        self.assertIs(tokens.copy().vocabulary, tokens.vocabulary)
+
+    def test_vocabulary_find(self):
+        vocabulary = Vocabulary()
+        dog_id = vocabulary.id(Noun('dog'))
+        self.assertEqual(vocabulary.find(Noun('dog')), dog_id)
+        self.assertEqual(vocabulary.find(Noun('cat')), -1)
+        self.assertEqual(len(vocabulary), 1)
+
+    def test_vocabulary_tag_mask(self):
+        vocabulary = Vocabulary()
+        word_id = vocabulary.id(Noun.proper_noun('Joneses', plural=True))
+        self.assertEqual(vocabulary.tag_mask(word_id), Tags([WordTag.PROPER, WordTag.PLURAL]).mask)
+        self.assertEqual(vocabulary.tag_mask(vocabulary.id(Pronoun.THEY)), Tags([WordTag.PLURAL]).mask)
+        self.assertEqual(vocabulary.tag_mask(vocabulary.id(Punctuation.COMMA)), 0)
+
+    def test_from_paragraph_and_to_paragraph(self):
+        tokens = TokenParagraph.from_paragraph(self.paragraph, Vocabulary())
+        self.assertEqual(tokens.to_paragraph(), self.paragraph)
+        self.assertEqual(len(tokens), 2)
+        self.assertEqual(list(tokens.offsets), [0, 5, 9])
+        self.assertEqual(list(tokens.kinds), [NOUN, VERB, OTHER, PRONOUN, PUNCTUATION,
+                                              PRONOUN, VERB, NOUN, PUNCTUATION])
+        self.assertEqual(tokens.ids[0], tokens.ids[7])
+
+    def test_empty_paragraph(self):
+        tokens = TokenParagraph.from_paragraph([], Vocabulary())
+        self.assertEqual(len(tokens), 0)
+        self.assertEqual(tokens.to_paragraph(), [])
+
+    def test_sentence_and_span(self):
+        tokens = TokenParagraph.from_paragraph(self.paragraph)
+        self.assertEqual(tokens.span(1), (5, 9))
+        self.assertEqual(tokens.sentence(1), self.paragraph[1])
+        self.assertEqual(tokens.word(7), Noun('dog'))
+
+    def test_set_word_updates_all_columns(self):
+        tokens = TokenParagraph.from_paragraph(self.paragraph)
+        tokens.set_word(0, Pronoun.THEY)
+        self.assertEqual(tokens.word(0), Pronoun.THEY)
+        self.assertEqual(tokens.kinds[0], PRONOUN)
+        self.assertEqual(tokens.tags[0], Tags([WordTag.PLURAL]).mask)
+
+    def test_set_sentence(self):
+        tokens = TokenParagraph.from_paragraph(self.paragraph)
+        new_sentence = [Pronoun.HE, Noun('dog'), Verb('like'), Punctuation.PERIOD]
+        tokens.set_sentence(1, new_sentence)
+        self.assertEqual(tokens.to_paragraph(), [self.paragraph[0], new_sentence])
+        self.assertRaises(ValueError, tokens.set_sentence, 1, new_sentence[:-1])
+
+    def test_find_kind(self):
+        tokens = TokenParagraph.from_paragraph(self.paragraph)
+        self.assertEqual(tokens.find_kind(VERB, 0), 1)
+        self.assertEqual(tokens.find_kind(VERB, 1), 6)
+        self.assertEqual(tokens.find_kind(NOUN, 1), 7)
+        self.assertEqual(tokens.find_kind(OTHER, 1), -1)
+
+    def test_verb_and_subject_positions(self):
+        paragraph = self.paragraph + [[Verb('go'), Punctuation.PERIOD], [BasicWord('hi'), Punctuation.PERIOD]]
+        tokens = TokenParagraph.from_paragraph(paragraph)
+        self.assertEqual(list(tokens.verbs), [1, 6, 9, -1])
+        self.assertEqual([tokens.subject_position(index) for index in range(4)], [0, 5, -1, -1])
+        self.assertEqual([tokens.requires_third_person(index) for index in range(4)], [True, True, False, False])
+
+    def test_set_word_and_set_sentence_keep_verb_positions(self):
+        tokens = TokenParagraph.from_paragraph(self.paragraph)
+        tokens.set_word(0, Noun('dog').plural())
+        self.assertFalse(tokens.requires_third_person(0))
+        tokens.set_word(1, BasicWord('is play'))
+        self.assertEqual(tokens.verb_position(0), -1)
+        tokens.set_word(3, Verb('play'))
+        self.assertEqual(tokens.verb_position(0), 3)
+        tokens.set_sentence(1, [Pronoun.HE, Noun('dog'), Verb('like'), Punctuation.PERIOD])
+        self.assertEqual(tokens.verb_position(1), 7)
+        self.assertEqual(tokens.subject_position(1), 6)
+        self.assertTrue(tokens.requires_third_person(1))
+
+    def test_copy_is_independent(self):
+        tokens = TokenParagraph.from_paragraph(self.paragraph)
+        copied = tokens.copy()
+        copied.set_word(0, Noun('cat'))
+        copied.set_word(1, Noun('cat'))
+        self.assertEqual(tokens.to_paragraph(), self.paragraph)
+        self.assertEqual(tokens.verb_position(0), 1)
+        self.assertIs(copied.vocabulary, tokens.vocabulary)
+        self.assertNotEqual(copied, tokens)
+
+    def test_as_tokens(self):
+        tokens = as_tokens(self.paragraph)
+        self.assertEqual(tokens.to_paragraph(), self.paragraph)
+        copied = as_tokens(tokens)
+        self.assertIsNot(copied, tokens)
+        self.assertEqual(copied, tokens)
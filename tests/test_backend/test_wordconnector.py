@@ -1,6 +1,8 @@
 import unittest
 
-from sentences.backend.wordconnector import connect_words, flatten_paragraph, convert_paragraph, is_punctuation
+from sentences.backend.tokens import TokenParagraph
+from sentences.backend.wordconnector import (connect_words, flatten_paragraph, convert_paragraph, is_punctuation,
+                                             convert_tokens)
 from sentences.words.pronoun import Pronoun
 from sentences.words.punctuation import Punctuation
 from sentences.words.noun import Noun
@@ -61,3 +63,10 @@ class TestWordConnector(unittest.TestCase):
             self.assertFalse(is_punctuation(word))
 
         self.assertTrue(is_punctuation(false_positive))
+
+    def test_convert_tokens(self):
+        paragraph = [[Pronoun.I, Verb('see', 'saw').past_tense(), Noun('cat').definite(), Punctuation.COMMA],
+                     [BasicWord('and'), Pronoun.I, Verb('run'), Punctuation.PERIOD.bold()]]
+        tokens = TokenParagraph.from_paragraph(paragraph)
+        self.assertEqual(convert_tokens(tokens), convert_paragraph(paragraph))
+        self.assertEqual(convert_tokens(tokens), 'I saw the cat, and I run<bold>.</bold>')
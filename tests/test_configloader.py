@@ -156,6 +156,9 @@ class TestConfigLoader(unittest.TestCase):
             ('proper_nouns', None),
             ('verbs', None),
             ('', None),
+            ('# optional CSV of irregular forms. each line: plural|third_person|past, word, irregular form', None),
+            ('irregulars', None),
+            ('', None),
             ('# ERROR DETAILS', None),
             ('error_probability', 0.2),
             ('', None),
@@ -181,6 +184,15 @@ class TestConfigLoader(unittest.TestCase):
             ('num_paragraphs', 4),
             ('paragraph_size', 15),
             ('', None),
+            ('# seed = none makes new paragraphs every time. any other value always makes the same paragraphs', None),
+            ('seed', None),
+            ('', None),
+            ('# predicate_bank = 0 makes a new predicate for every sentence. any other value makes', None),
+            ('# that many at a time and shares them between paragraphs. predicate_uses is how many', None),
+            ('# times each of them can be used', None),
+            ('predicate_bank', 0),
+            ('predicate_uses', 1),
+            ('', None),
             ('# MAIN', None),
             ('font_size', 13),
             ('file_prefix', ''),
@@ -226,6 +238,15 @@ class TestConfigLoader(unittest.TestCase):
         answer = answer.replace('paragraph_type = chain', 'paragraph_type = bobo')
         self.assertEqual(answer, config_text)
 
+    def test_save_and_load_keep_predicate_bank_options(self):
+        filename = os.path.join(TESTS_FILES, 'test.cfg')
+        save_config_to_filename({'predicate_bank': 20, 'predicate_uses': 3}, filename)
+        loaded = load_config(filename)
+        os.remove(filename)
+
+        self.assertEqual(loaded['predicate_bank'], 20)
+        self.assertEqual(loaded['predicate_uses'], 3)
+
     def test_load_config_default_config(self):
         answer = load_config(DEFAULT_CONFIG)
         self.assertEqual(answer, {
@@ -235,6 +256,7 @@ class TestConfigLoader(unittest.TestCase):
             'uncountable_nouns': None,
             'proper_nouns': None,
             'verbs': None,
+            'irregulars': None,
 
             'error_probability': 0.2,
             'noun_errors': True,
@@ -253,6 +275,9 @@ class TestConfigLoader(unittest.TestCase):
             'subject_pool': 5,
             'num_paragraphs': 4,
             'paragraph_size': 15,
+            'seed': None,
+            'predicate_bank': 0,
+            'predicate_uses': 1,
 
             'font_size': 13,
             'file_prefix': ''
@@ -309,6 +334,7 @@ class TestConfigLoader(unittest.TestCase):
             'uncountable_nouns': os.path.join(home, UNCOUNTABLE_NOUNS_CSV),
             'proper_nouns': os.path.join(home, PROPER_NOUNS_CSV),
             'verbs': os.path.join(home, VERBS_CSV),
+            'irregulars': None,
 
             'error_probability': 0.2,
             'noun_errors': True,
@@ -327,6 +353,9 @@ class TestConfigLoader(unittest.TestCase):
             'subject_pool': 5,
             'num_paragraphs': 4,
             'paragraph_size': 15,
+            'seed': None,
+            'predicate_bank': 0,
+            'predicate_uses': 1,
 
             'font_size': 13,
             'file_prefix': ''
@@ -435,6 +435,47 @@ class TestGuiMain(unittest.TestCase):
         main.set_config()
         self.assertEqual(main.get_state(), ConfigLoader().state)
 
+    def test_get_state_keeps_options_without_a_frame(self):
+        save_config({'seed': 7})
+        main = MainFrame()
+        self.assertEqual(main.get_state()['seed'], 7)
+        self.assertEqual(main.paragraph_generator._options['seed'], 7)
+
+    def test_seed_in_config_makes_same_paragraphs(self):
+        save_config({'seed': 7})
+        main = MainFrame()
+        main.paragraph_generator.update_options(main.get_state())
+        first = main.paragraph_generator.create_answer_and_error_paragraphs()
+
+        other = MainFrame()
+        other.paragraph_generator.update_options(other.get_state())
+        self.assertEqual(other.paragraph_generator.create_answer_and_error_paragraphs(), first)
+
+    def test_set_config_keeps_seed(self):
+        save_config({'seed': 7})
+        main = MainFrame()
+        main.set_config()
+        self.assertEqual(ConfigLoader().state['seed'], 7)
+
+    def test_predicate_bank_options_reach_generator_and_survive_save(self):
+        save_config({'predicate_bank': 20, 'predicate_uses': 3})
+        main = MainFrame()
+        self.assertEqual(main.paragraph_generator._options['predicate_bank'], 20)
+        self.assertEqual(main.paragraph_generator._options['predicate_uses'], 3)
+
+        main.set_config()
+        state = ConfigLoader().state
+        self.assertEqual((state['predicate_bank'], state['predicate_uses']), (20, 3))
+
+    def test_irregulars_reach_generator_and_survive_save(self):
+        irregulars = os.path.join(TESTS_FILES, 'irregulars.csv')
+        save_config({'irregulars': irregulars})
+        main = MainFrame()
+        self.assertEqual(main.paragraph_generator._options['irregulars'], irregulars)
+
+        main.set_config()
+        self.assertEqual(ConfigLoader().state['irregulars'], irregulars)
+
     def test_read_me(self):
         main = MainFrame()
         main.read_me()
@@ -502,8 +543,8 @@ class TestGuiMain(unittest.TestCase):
         with open(os.path.join(APP_FOLDER, VERBS_CSV), 'w') as f:
             f.write('oh, no, this, is, very, very, bad')
         main.reload_files()
-        mock_error.assert_called_with('Bad file',
-                                      'LoaderError: Bad values in columns for CSV for verbs. See default for example.')
+        message = 'LoaderError: verbs ({}): Bad values in columns for CSV for verbs. See default for example.'
+        mock_error.assert_called_with('Bad file', message.format(os.path.join(APP_FOLDER, VERBS_CSV)))
 
     @patch("sentences.guimain.showerror")
     def test_init_bad_files(self, mock_error):
@@ -512,9 +553,9 @@ class TestGuiMain(unittest.TestCase):
             f.write('oh, no, this, is, very, very, bad')
         MainFrame()
         message = ('On loading, caught the following error:\n' +
-                   'LoaderError: Bad values in columns for CSV for verbs. See default for example.\n\n' +
+                   'LoaderError: verbs ({}): Bad values in columns for CSV for verbs. See default for example.\n\n' +
                    'The original word files were moved to <name>_old_(number).csv and replaced with new files.')
-        mock_error.assert_called_with('Bad start file', message)
+        mock_error.assert_called_with('Bad start file', message.format(os.path.join(APP_FOLDER, VERBS_CSV)))
         with open(os.path.join(APP_FOLDER, VERBS_CSV), 'r') as new_file:
             with open(os.path.join(DATA_PATH, VERBS_CSV), 'r') as default_file:
                 self.assertEqual(new_file.read(), default_file.read())
@@ -530,7 +571,7 @@ class TestGuiMain(unittest.TestCase):
         shutil.copy(src, dst)
         MainFrame()
         message = ('On loading, caught the following error:\n' +
-                   'LoaderError: Could not read CSV file. ' +
+                   'LoaderError: countable_nouns ({}): Could not read CSV file. '.format(dst) +
                    'If you edited it in MSWord or something similar, it got formatted. Use "notepad"\n\n' +
                    'The original word files were moved to <name>_old_(number).csv and replaced with new files.')
         mock_error.assert_called_with('Bad start file', message)
@@ -546,7 +587,7 @@ class TestGuiMain(unittest.TestCase):
             save_config({key: bad_file})
 
             main.load_config()
-            message = ('LoaderError: Could not read CSV file. ' +
+            message = ('LoaderError: {} ({}): Could not read CSV file. '.format(key, bad_file) +
                        'If you edited it in MSWord or something similar, it got formatted. Use "notepad"')
             mock_error.assert_called_with('Bad file', message)
             self.assertEqual(mock_error.call_count, count + 1)
@@ -565,7 +606,7 @@ class TestGuiMain(unittest.TestCase):
             main.revert_to_original()
             files_frame.set_variable(key, bad_file)
 
-            message = ('LoaderError: Could not read CSV file. ' +
+            message = ('LoaderError: {} ({}): Could not read CSV file. '.format(key, bad_file) +
                        'If you edited it in MSWord or something similar, it got formatted. Use "notepad"')
             mock_error.assert_called_with('Bad file', message)
             self.assertEqual(mock_error.call_count, count + 1)
@@ -1,15 +1,19 @@
 import unittest
-from random import seed
+from random import seed, Random
 import os
 
+from sentences import LoaderError
 from sentences.paragraphsgenerator import ParagraphsGenerator
 
 from sentences import COUNTABLE_NOUNS_CSV, UNCOUNTABLE_NOUNS_CSV, PROPER_NOUNS_CSV, VERBS_CSV
+from sentences.backend.lexicon_cache import CACHE_FILENAME
+from sentences.backend.predicate_bank import PredicateBank
 from sentences.backend.loader import verbs, uncountable_nouns, countable_nouns, proper_nouns
 from sentences.words.pronoun import Pronoun, CapitalPronoun
 from sentences.words.noun import Noun
 from sentences.words.verb import Verb
 from sentences.words.punctuation import Punctuation
+from sentences.words.wordtools.morphology import ENGLISH
 
 from tests import TESTS_FILES
 
@@ -125,7 +129,7 @@ class TestParagraphGenerator(unittest.TestCase):
         self.assertEqual(pg._nouns_list, all_nouns)
 
     def assert_single_value_word_list(self, paragraph_generator, dummy_word):
-        self.assertEqual(paragraph_generator._verbs_list[0]['verb'], Verb(dummy_word))
+        self.assertEqual(paragraph_generator._verbs_list[0].verb, Verb(dummy_word))
         self.assertEqual(paragraph_generator._nouns_list[0], Noun(dummy_word))
         self.assertEqual(paragraph_generator._nouns_list[1], Noun.uncountable_noun('uncountable {}'.format(dummy_word)))
         self.assertEqual(paragraph_generator._nouns_list[2], Noun.proper_noun(dummy_word.capitalize()))
@@ -139,6 +143,147 @@ class TestParagraphGenerator(unittest.TestCase):
         pg.load_lists_from_file()
         self.assert_single_value_word_list(pg, 'dog')
 
+    def test_load_lists_from_file_saves_and_reuses_lexicon_cache(self):
+        cache_file = os.path.join(TESTS_FILES, CACHE_FILENAME)
+        self.config_state['home_directory'] = TESTS_FILES
+        try:
+            create_single_value_test_csvs('cat')
+            pg = ParagraphsGenerator(self.config_state)
+            self.assertTrue(os.path.exists(cache_file))
+
+            same_files = ParagraphsGenerator(self.config_state)
+            self.assertEqual(same_files._nouns_list, pg._nouns_list)
+            self.assertIs(same_files._verbs_list[0].verb, pg._verbs_list[0].verb)
+
+            create_single_value_test_csvs('dog')
+            pg.load_lists_from_file()
+            self.assert_single_value_word_list(pg, 'dog')
+        finally:
+            if os.path.exists(cache_file):
+                os.remove(cache_file)
+
+    def test_load_lists_from_file_no_cache_without_home_directory(self):
+        ParagraphsGenerator(self.config_state)
+        self.assertFalse(os.path.exists(CACHE_FILENAME))
+
+    def test_load_times(self):
+        pg = ParagraphsGenerator(self.config_state)
+        self.assertEqual(set(pg.load_times), {'verbs', 'countable_nouns', 'uncountable_nouns', 'proper_nouns'})
+        self.assertTrue(all(seconds >= 0 for seconds in pg.load_times.values()))
+
+    def test_reload_changed_files_no_changes(self):
+        pg = ParagraphsGenerator(self.config_state)
+        verbs_list = pg._verbs_list
+        self.assertEqual(pg.reload_changed_files(), [])
+        self.assertEqual(pg.load_times, {})
+        self.assertIs(pg._verbs_list, verbs_list)
+
+    def test_reload_changed_files_reloads_only_changed_file(self):
+        create_single_value_test_csvs('cat')
+        pg = ParagraphsGenerator(self.config_state)
+        verbs_list = pg._verbs_list
+        with open(DELETE_ME_PROPER, 'w') as f:
+            f.write('Rodrigo,p')
+
+        self.assertEqual(pg.reload_changed_files(), ['proper_nouns'])
+        self.assertEqual(list(pg.load_times), ['proper_nouns'])
+        self.assertIs(pg._verbs_list, verbs_list)
+        self.assertEqual(pg._nouns_list[2], Noun.proper_noun('Rodrigo', plural=True))
+        self.assertEqual(pg._nouns_list[:2], [Noun('cat'), Noun.uncountable_noun('uncountable cat')])
+
+    def test_reload_changed_files_touched_file_is_not_reloaded(self):
+        pg = ParagraphsGenerator(self.config_state)
+        with open(DELETE_ME_VERBS, 'r') as f:
+            text = f.read()
+        with open(DELETE_ME_VERBS, 'w') as f:
+            f.write(text)
+        stat = os.stat(DELETE_ME_VERBS)
+        os.utime(DELETE_ME_VERBS, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        self.assertEqual(pg.reload_changed_files(), [])
+
+    def test_reload_changed_files_after_filename_change(self):
+        pg = ParagraphsGenerator(self.config_state)
+        self.config_state['verbs'] = DELETE_ME_COUNTABLE
+        pg._options.update(self.config_state)
+        self.assertEqual(pg.reload_changed_files(), ['verbs'])
+        self.assertEqual(pg._verbs_list, verbs(DELETE_ME_COUNTABLE))
+
+    def test_irregulars_are_replaced_and_reloaded(self):
+        irregulars = delete_me.format('irregulars.csv')
+        with open(irregulars, 'w') as f:
+            f.write('plural, dog, doggies')
+        noun = Noun('dog')
+        self.assertEqual(noun.plural().value, 'dogs')
+        try:
+            self.config_state['irregulars'] = irregulars
+            pg = ParagraphsGenerator(self.config_state)
+            self.assertEqual(noun.plural().value, 'doggies')
+            self.assertEqual(pg.reload_changed_files(), [])
+
+            with open(irregulars, 'w') as f:
+                f.write('past, like, liked up')
+            self.assertEqual(pg.reload_changed_files(), ['irregulars'])
+            self.assertEqual(noun.plural().value, 'dogs')
+            self.assertEqual(Verb('like').past_tense().value, 'liked up')
+
+            pg.update_options({'irregulars': None})
+            self.assertEqual(Verb('like').past_tense().value, 'liked')
+            self.assertEqual(pg.reload_changed_files(), [])
+        finally:
+            ENGLISH.set_irregulars(())
+            os.remove(irregulars)
+
+    def test_generator_without_irregulars_keeps_another_generators_irregulars(self):
+        irregulars = delete_me.format('irregulars.csv')
+        with open(irregulars, 'w') as f:
+            f.write('plural, dog, doggies')
+        try:
+            ParagraphsGenerator(dict(self.config_state, irregulars=irregulars))
+            ParagraphsGenerator(self.config_state)
+            self.assertEqual(Noun('dog').plural().value, 'doggies')
+        finally:
+            ENGLISH.set_irregulars(())
+            os.remove(irregulars)
+
+    def test_load_lists_from_file_one_bad_file_raises_its_error_with_key_and_filename(self):
+        pg = ParagraphsGenerator(self.config_state)
+        with open(DELETE_ME_VERBS, 'w') as f:
+            f.write('oh, no, this, is, very, very, bad')
+        with self.assertRaises(LoaderError) as cm:
+            pg.load_lists_from_file()
+        expected = 'verbs ({}): Bad values in columns for CSV for verbs. See default for example.'
+        self.assertEqual(cm.exception.args[0], expected.format(DELETE_ME_VERBS))
+        self.assertIsInstance(cm.exception.__cause__, LoaderError)
+
+    def test_load_lists_from_file_bad_files_raise_one_error(self):
+        pg = ParagraphsGenerator(self.config_state)
+        with open(DELETE_ME_VERBS, 'w') as f:
+            f.write('oh, no, this, is, very, very, bad')
+        pg._options['countable_nouns'] = 'does_not_exist.csv'
+        with self.assertRaises(LoaderError) as cm:
+            pg.load_lists_from_file()
+        message = cm.exception.args[0]
+        self.assertTrue(message.startswith('Could not load 2 word files:\n'))
+        self.assertIn('verbs ({}): Bad values in columns for CSV for verbs.'.format(DELETE_ME_VERBS), message)
+        self.assertIn('countable_nouns (does_not_exist.csv): Could not read CSV file.', message)
+
+    def test_load_lists_from_file_weights(self):
+        create_test_csvs(['dog, weight=0.001', 'cat, weight=999'], ['water, weight=0.001'], ['like'], [])
+        pg = ParagraphsGenerator(self.config_state)
+        self.assertIsNone(pg._verb_weights)
+        self.assertEqual(len(pg._noun_weights), 3)
+
+        self.config_state['probability_pronoun'] = 0
+        pg.update_options(self.config_state)
+        seed(2)
+        paragraphs = [pg.create_paragraph() for _ in range(100)]
+        first_subjects = [paragraph[0][0].base_noun for paragraph in paragraphs]
+        self.assertEqual(first_subjects, ['cat'] * 100)
+        # each subject after the first is the object before it, which can't be its own subject, so at best
+        # cat is every other subject.
+        cat_subjects = sum(sentence[0].base_noun == 'cat' for paragraph in paragraphs for sentence in paragraph)
+        self.assertEqual(cat_subjects, 100 * ((self.config_state['paragraph_size'] + 1) // 2))
+
     def test_update_options_empty_dict_does_not_change_dict_does_not_reload_files(self):
         create_single_value_test_csvs('dog')
         pg = ParagraphsGenerator(self.config_state)
@@ -238,7 +383,7 @@ class TestParagraphGenerator(unittest.TestCase):
 
         raw_answer = pg.create_paragraph()
         answer = [[word.value for word in sentence] for sentence in raw_answer]
-        self.assertEqual(answer, [['Water', 'likes', 'Frank', '!'], ['Frank', 'likes', 'a dog', '.']])
+        self.assertEqual(answer, [['A dog', 'likes', 'water', '.'], ['The water', 'likes', 'the dog', '.']])
 
     def test_create_paragraph_pool_paragraph(self):
         seed(8908)
@@ -381,16 +526,17 @@ class TestParagraphGenerator(unittest.TestCase):
         pg = ParagraphsGenerator(self.config_state)
         answer, error = pg.create_answer_and_error_texts()
         expected_answer = (
-            "<bold>She</bold> likes <bold>him</bold>. <bold>He</bold> likes <bold>me</bold>! <bold>I</bold> like " +
-            "it. It likes <bold>me</bold>. <bold>I</bold> don't like <bold>them</bold>. <bold>They</bold> like it" +
-            ". It likes you. You like <bold>us</bold>. <bold>We</bold> like <bold>her</bold>! <bold>She</bold> li" +
-            "kes <bold>them</bold>! <bold>They</bold> like <bold>me</bold>. <bold>I</bold> don't like <bold>her</" +
-            "bold>! <bold>She</bold> likes <bold>us</bold>. <bold>We</bold> like you! You like <bold>me</bold>. -" +
-            "- error count: 22")
+            "<bold>She</bold> doesn't like <bold>him</bold>. <bold>He</bold> likes <bold>her</bold>! <bold>She</b" +
+            "old> likes <bold>me</bold>! <bold>I</bold> like <bold>him</bold>. <bold>He</bold> doesn't like <bold" +
+            ">us</bold>. <bold>We</bold> like <bold>me</bold>. <bold>I</bold> like <bold>him</bold>. <bold>He</bo" +
+            "ld> doesn't like <bold>us</bold>. <bold>We</bold> like <bold>him</bold>. <bold>He</bold> likes <bold" +
+            ">me</bold>. <bold>I</bold> don't like <bold>him</bold>. <bold>He</bold> doesn't like you! You like <" +
+            "bold>me</bold>. <bold>I</bold> like <bold>him</bold>! <bold>He</bold> likes <bold>us</bold>! -- erro" +
+            "r count: 28")
         expected_error = (
-            "Her likes he. Him likes I! Me like it. It likes I. Me don't like they. Them like it. It likes you. Y" +
-            "ou like we. Us like she! Her likes they! Them like I. Me don't like she! Her likes we. Us like you! " +
-            "You like I."
+            "Her doesn't like he. Him likes she! Her likes I! Me like he. Him doesn't like we. Us like I. Me like" +
+            " he. Him doesn't like we. Us like he. Him likes I. Me don't like he. Him doesn't like you! You like " +
+            "I. Me like he! Him likes we!"
         )
         self.assertEqual(answer, expected_answer)
         self.assertEqual(error, expected_error)
@@ -466,11 +612,11 @@ class TestParagraphGenerator(unittest.TestCase):
         self.config_state['paragraph_size'] = 2
         pg = ParagraphsGenerator(self.config_state)
         answer, error = pg.create_answer_and_error_texts()
-        expected_answer = ('<bold>Water</bold> <bold>likes</bold> <bold>dogs</bold><bold>.</bold> ' +
-                           '<bold>The dogs</bold> <bold>like</bold> <bold>the water</bold><bold>!</bold>' +
+        expected_answer = ('<bold>Water</bold> <bold>likes</bold> <bold>a dog</bold><bold>!</bold> ' +
+                           "<bold>The dog</bold> <bold>doesn't like</bold> <bold>the water</bold><bold>.</bold>" +
                            ' -- error count: 8')
         self.assertEqual(answer, expected_answer)
-        self.assertEqual(error, 'Waters likes a dogs, the dog like a water,')
+        self.assertEqual(error, "Waters liked dogs, dog don't like a water,")
 
     def test_create_answer_and_error_paragraphs_num_paragraphs(self):
         seed(451)
@@ -496,3 +642,49 @@ class TestParagraphGenerator(unittest.TestCase):
         answers, errors = pg.create_answer_and_error_paragraphs()
         self.assertEqual(len(answers), 5)
         self.assertEqual(len(errors), 5)
+
+    def test_create_answer_and_error_paragraphs_seed_makes_same_paragraphs(self):
+        self.config_state['seed'] = 12
+        seed(1)
+        answers, errors = ParagraphsGenerator(self.config_state).create_answer_and_error_paragraphs()
+        seed(2)
+        self.assertEqual(ParagraphsGenerator(self.config_state).create_answer_and_error_paragraphs(), (answers, errors))
+        self.assertEqual(len(set(answers)), 4)
+
+        self.config_state['seed'] = 13
+        self.assertNotEqual(ParagraphsGenerator(self.config_state).create_answer_and_error_paragraphs()[0], answers)
+
+    def test_create_answer_and_error_paragraphs_seed_paragraphs_do_not_depend_on_num_paragraphs(self):
+        self.config_state['seed'] = 12
+        answers, errors = ParagraphsGenerator(self.config_state).create_answer_and_error_paragraphs()
+        self.config_state['num_paragraphs'] = 2
+        fewer_answers, fewer_errors = ParagraphsGenerator(self.config_state).create_answer_and_error_paragraphs()
+        self.assertEqual(fewer_answers, answers[:2])
+        self.assertEqual(fewer_errors, errors[:2])
+
+    def test_create_answer_and_error_paragraphs_predicate_bank(self):
+        self.config_state['seed'] = 12
+        self.config_state['predicate_bank'] = 10
+        self.config_state['predicate_uses'] = 3
+        answers, errors = ParagraphsGenerator(self.config_state).create_answer_and_error_paragraphs()
+        self.assertEqual(ParagraphsGenerator(self.config_state).create_answer_and_error_paragraphs(), (answers, errors))
+        self.assertEqual(len(answers), 4)
+
+        self.config_state['predicate_bank'] = 0
+        self.assertNotEqual(ParagraphsGenerator(self.config_state).create_answer_and_error_paragraphs()[0], answers)
+
+    def test_create_predicate_bank(self):
+        pg = ParagraphsGenerator(self.config_state)
+        self.assertIsNone(pg._create_predicate_bank())
+        pg.update_options({'predicate_bank': 5})
+        self.assertIsInstance(pg._create_predicate_bank(), PredicateBank)
+
+    def test_rng(self):
+        first = ParagraphsGenerator(self.config_state, rng=Random(3)).create_answer_and_error_paragraphs()
+        second = ParagraphsGenerator(self.config_state, rng=Random(3)).create_answer_and_error_paragraphs()
+        self.assertEqual(first, second)
+
+        pg = ParagraphsGenerator(self.config_state)
+        self.assertEqual(pg.create_answer_and_error_texts(Random(8)),
+                         pg.create_answer_and_error_texts(Random(8)))
+        self.assertEqual(pg.create_paragraph(Random(8)), pg.create_paragraph(Random(8)))
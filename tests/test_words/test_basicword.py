@@ -68,7 +68,9 @@ class TestBasicWord(unittest.TestCase):
         word = BasicWord('a', tags=self.preposition)
         self.assertEqual(repr(word), "BasicWord('a', Tags([WordTag.PREPOSITION]))")
 
+    def test_no_instance_dict(self):
+        self.assertFalse(hasattr(BasicWord('bob'), '__dict__'))
+
     def test_hash(self):
         word = BasicWord('a', tags=self.preposition)
-        hash_val = "hash of BasicWord('a', Tags([WordTag.PREPOSITION]))"
-        self.assertEqual(hash(word), hash(hash_val))
+        self.assertEqual(hash(word), hash(('a', Tags([WordTag.PREPOSITION]))))
@@ -141,11 +141,13 @@ class TestNoun(unittest.TestCase):
         self.assertEqual(repr(Noun('a', 'b', 'c', Tags([WordTag.PLURAL]))),
                          "Noun('a', 'b', 'c', Tags([WordTag.PLURAL]))")
 
+    def test_no_instance_dict(self):
+        self.assertFalse(hasattr(Noun('bob'), '__dict__'))
+
     def test_hash(self):
-        self.assertEqual(hash(Noun('bob')),
-                         hash("hash of Noun('bob', '', 'bob', Tags([]))"))
+        self.assertEqual(hash(Noun('bob')), hash(('bob', '', 'bob', Tags([]))))
         self.assertEqual(hash(Noun('bob').definite()),
-                         hash("hash of Noun('the bob', '', 'bob', Tags([WordTag.DEFINITE]))"))
+                         hash(('the bob', '', 'bob', Tags([WordTag.DEFINITE]))))
 
     def test_capitalize_simple_case(self):
         noun = Noun('dog').capitalize()
@@ -308,6 +310,10 @@ class TestNoun(unittest.TestCase):
             self.assertEqual(Noun(base_value).plural(),
                              Noun(base_value + 's', '', base_value, tags=self.plural))
 
+    def test_plural_capitalized_irregular_plural(self):
+        self.assertEqual(Noun('child', 'children').capitalize().plural().value, 'Children')
+        self.assertEqual(Noun('child', 'children').definite().capitalize().plural().value, 'The children')
+
     def test_plural_with_articles_irregular_plural(self):
         articles = ('a ', 'A ', 'an ', 'An ', 'the ', 'The ')
         for article in articles:
@@ -429,3 +435,22 @@ class TestNoun(unittest.TestCase):
         self.assertTrue(original.has_tags(WordTag.UNCOUNTABLE))
         without_tags = Noun('water')
         self.assertEqual(original.to_basic_noun(), without_tags)
+
+    def test_inflections_are_looked_up_after_first_call(self):
+        noun = Noun('dog')
+        self.assertIs(noun.plural(), noun.plural())
+        self.assertIs(noun.definite(), noun.definite())
+        self.assertIs(noun.indefinite().capitalize(), noun.indefinite().capitalize())
+        self.assertIs(noun.plural().to_basic_noun(), noun)
+
+    def test_paradigm(self):
+        expected = {
+            'basic': Noun('child', 'children'),
+            'plural': Noun('children', 'children', 'child', self.plural),
+            'definite': Noun('the child', 'children', 'child', self.definite),
+            'indefinite': Noun('a child', 'children', 'child', self.indefinite),
+            'plural_definite': Noun('the children', 'children', 'child', self.definite_plural),
+            'plural_indefinite': Noun('a children', 'children', 'child', self.indefinite),
+        }
+        self.assertEqual(Noun('child', 'children').paradigm(), expected)
+        self.assertEqual(Noun('child', 'children').definite().capitalize().paradigm(), expected)
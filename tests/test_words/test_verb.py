@@ -72,12 +72,13 @@ class TestNewVerb(unittest.TestCase):
         self.assertEqual(repr(Verb('play').negative().third_person()),
                          "Verb(\"doesn't play\", '', 'play', Tags([WordTag.THIRD_PERSON, WordTag.NEGATIVE]))")
 
-    def test_hash(self):
-        self.assertEqual(hash(Verb('bob')),
-                         hash("hash of Verb('bob', '', 'bob', Tags([]))"))
+    def test_no_instance_dict(self):
+        self.assertFalse(hasattr(Verb('bob'), '__dict__'))
 
-        hash_val = "hash of Verb('plays', '', 'play', Tags([WordTag.THIRD_PERSON]))"
-        self.assertEqual(hash(Verb('play').third_person()), hash(hash_val))
+    def test_hash(self):
+        self.assertEqual(hash(Verb('bob')), hash(('bob', '', 'bob', Tags([]))))
+        self.assertEqual(hash(Verb('play').third_person()),
+                         hash(('plays', '', 'play', Tags([WordTag.THIRD_PERSON]))))
 
     def test_capitalize(self):
         verb = Verb('go', 'went').past_tense().negative().capitalize()
@@ -203,3 +204,21 @@ class TestNewVerb(unittest.TestCase):
         self.assertEqual(verb.bold().to_basic_verb(), verb)
 
         self.assertEqual(verb.negative().past_tense().bold().capitalize().to_basic_verb(), verb)
+
+    def test_inflections_are_looked_up_after_first_call(self):
+        verb = Verb('go', 'went')
+        self.assertIs(verb.past_tense(), verb.past_tense())
+        self.assertIs(verb.negative().third_person(), verb.negative().third_person())
+        self.assertIs(verb.third_person().to_basic_verb(), verb)
+
+    def test_paradigm(self):
+        expected = {
+            'basic': Verb('go', 'went'),
+            'third_person': Verb('goes', 'went', 'go', self.third_person),
+            'past': Verb('went', 'went', 'go', self.past),
+            'negative': Verb("don't go", 'went', 'go', self.negative),
+            'negative_third_person': Verb("doesn't go", 'went', 'go', Tags([WordTag.NEGATIVE, WordTag.THIRD_PERSON])),
+            'negative_past': Verb("didn't go", 'went', 'go', self.negative_past),
+        }
+        self.assertEqual(Verb('go', 'went').paradigm(), expected)
+        self.assertEqual(Verb('go', 'went').negative().past_tense().paradigm(), expected)
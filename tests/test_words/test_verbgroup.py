@@ -0,0 +1,42 @@
+import pickle
+import unittest
+
+from sentences.words.basicword import BasicWord
+from sentences.words.verb import Verb
+from sentences.words.verbgroup import VerbGroup, as_verb_group
+
+
+class TestVerbGroup(unittest.TestCase):
+
+    def test_defaults(self):
+        verb_group = VerbGroup(Verb('play'))
+        self.assertEqual(verb_group.verb, Verb('play'))
+        self.assertIsNone(verb_group.preposition)
+        self.assertEqual(verb_group.objects, 1)
+        self.assertIsNone(verb_group.particle)
+
+    def test_is_immutable_and_has_no_dict(self):
+        verb_group = VerbGroup(Verb('play'))
+        self.assertRaises(AttributeError, setattr, verb_group, 'objects', 2)
+        self.assertFalse(hasattr(verb_group, '__dict__'))
+
+    def test_hash_and_equality(self):
+        first = VerbGroup(Verb('pick'), None, 1, BasicWord.particle('up'))
+        second = VerbGroup(Verb('pick'), None, 1, BasicWord.particle('up'))
+        self.assertEqual(first, second)
+        self.assertEqual(hash(first), hash(second))
+        self.assertNotEqual(first, VerbGroup(Verb('pick'), None, 2, BasicWord.particle('up')))
+
+    def test_pickle_keeps_interned_words(self):
+        verb_group = VerbGroup(Verb('take', 'took'), BasicWord.preposition('from'), 2, BasicWord.particle('away'))
+        copy = pickle.loads(pickle.dumps(verb_group))
+        self.assertEqual(copy, verb_group)
+        self.assertIs(copy.verb, verb_group.verb)
+
+    def test_as_verb_group(self):
+        verb_group = VerbGroup(Verb('take', 'took'), BasicWord.preposition('from'), 2, BasicWord.particle('away'))
+        self.assertIs(as_verb_group(verb_group), verb_group)
+        verb_dict = {'verb': Verb('take', 'took'), 'preposition': BasicWord.preposition('from'),
+                     'objects': 2, 'particle': BasicWord.particle('away')}
+        self.assertEqual(as_verb_group(verb_dict), verb_group)
+        self.assertEqual(as_verb_group(Verb('go')), VerbGroup(Verb('go'), None, 1, None))
@@ -0,0 +1,56 @@
+import gc
+import unittest
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from copy import copy, deepcopy
+
+from sentences.words.basicword import BasicWord
+from sentences.words.noun import Noun
+from sentences.words.verb import Verb
+from sentences.words.wordtools.interning import interned_count
+from sentences.words.wordtools.tags import Tags
+from sentences.words.wordtools.wordtag import WordTag
+
+
+class TestInterning(unittest.TestCase):
+    def test_equal_words_are_identical(self):
+        self.assertIs(Noun('dog'), Noun('dog'))
+        self.assertIs(Noun('dog'), Noun('dog', '', 'dog', Tags()))
+        self.assertIs(Verb('play'), Verb('play', '', 'play'))
+        self.assertIs(BasicWord('x'), BasicWord('x', Tags()))
+
+    def test_different_words_are_not_identical(self):
+        self.assertIsNot(Noun('dog'), Noun('cat'))
+        self.assertIsNot(Noun('dog'), Noun('dog', tags=Tags([WordTag.PLURAL])))
+        self.assertIsNot(BasicWord('with'), BasicWord.preposition('with'))
+
+    def test_different_classes_with_same_values_are_not_identical(self):
+        self.assertIsNot(Noun('run', '', '', Tags()), Verb('run', '', '', Tags()))
+
+    def test_inflections_are_identical(self):
+        self.assertIs(Noun('dog').plural().definite(), Noun('dog').plural().definite())
+        self.assertIs(Noun('dog').indefinite().capitalize(), Noun('dog').indefinite().capitalize())
+        self.assertIs(Verb('go', 'went').past_tense().negative(), Verb('go', 'went').negative().past_tense())
+        self.assertIs(BasicWord.particle('up').bold(), BasicWord.particle('up').bold())
+
+    def test_copy_returns_same_instance(self):
+        noun = Noun('dog')
+        self.assertIs(copy(noun), noun)
+        self.assertIs(deepcopy(noun), noun)
+        self.assertIs(deepcopy({noun: [noun]})[noun][0], noun)
+
+    def test_interned_words_are_released(self):
+        before = interned_count()
+        words = [Noun('interning test {}'.format(num)) for num in range(10)]
+        self.assertEqual(interned_count(), before + len(words))
+        references = [weakref.ref(word) for word in words]
+        del words
+        gc.collect()
+        self.assertEqual([reference() for reference in references], [None] * 10)
+
+    def test_words_made_in_threads_are_identical(self):
+        values = ['threaded noun {}'.format(num) for num in range(200)]
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(lambda _: [Noun(value) for value in values], range(4)))
+        for nouns in results[1:]:
+            self.assertTrue(all(noun is first for noun, first in zip(nouns, results[0])))
@@ -0,0 +1,100 @@
+import unittest
+
+from sentences.words.noun import Noun
+from sentences.words.verb import Verb
+from sentences.words.wordtools.morphology import Morphology, ENGLISH, FORMS
+
+
+class TestMorphology(unittest.TestCase):
+    def test_rule_names(self):
+        self.assertEqual(ENGLISH.rule('third_person', 'fish').name, 'es')
+        self.assertEqual(ENGLISH.rule('third_person', 'cry').name, 'ies')
+        self.assertEqual(ENGLISH.rule('third_person', 'play').name, 's')
+        self.assertEqual(ENGLISH.rule('past', 'cry').name, 'ied')
+        self.assertEqual(ENGLISH.rule('past', 'like').name, 'd')
+        self.assertEqual(ENGLISH.rule('past', 'hop').name, 'double')
+        self.assertEqual(ENGLISH.rule('past', 'plow').name, 'ed')
+        self.assertEqual(ENGLISH.rule('plural', 'wife').name, 'ives')
+        self.assertEqual(ENGLISH.rule('plural', 'leaf').name, 'ves')
+        self.assertEqual(ENGLISH.rule('plural', 'box').name, 'es')
+
+    def test_rule_short_words_use_start_of_word(self):
+        self.assertEqual(ENGLISH.rule('third_person', 'y').name, 's')
+        self.assertEqual(ENGLISH.rule('third_person', 'my').name, 'ies')
+        self.assertEqual(ENGLISH.rule('past', 'at').name, 'double')
+        self.assertEqual(ENGLISH.rule('past', 'eat').name, 'ed')
+        self.assertEqual(ENGLISH.rule('past', '').name, 'ed')
+
+    def test_inflect(self):
+        self.assertEqual(ENGLISH.inflect('plural', 'shelf'), 'shelves')
+        self.assertEqual(ENGLISH.inflect('plural', 'life'), 'lives')
+        self.assertEqual(ENGLISH.inflect('plural', 'baby'), 'babies')
+        self.assertEqual(ENGLISH.inflect('third_person', 'watch'), 'watches')
+        self.assertEqual(ENGLISH.inflect('past', 'stop'), 'stopped')
+        self.assertEqual(ENGLISH.inflect('past', 'carry'), 'carried')
+
+    def test_inflect_many(self):
+        morphology = Morphology([('past', 'go', 'went')])
+        values = ['go', 'hop', 'cry', 'like', 'go', 'walk']
+        expected = [morphology.inflect('past', value) for value in values]
+        self.assertEqual(morphology.inflect_many('past', values), expected)
+        self.assertEqual(expected, ['went', 'hopped', 'cried', 'liked', 'went', 'walked'])
+
+    def test_inflect_many_all_forms(self):
+        values = ['ox', 'wolf', 'day', 'pity', 'fizz', 'go']
+        for form in FORMS:
+            self.assertEqual(ENGLISH.inflect_many(form, values), [ENGLISH.inflect(form, value) for value in values])
+
+    def test_inflect_many_uses_new_irregulars(self):
+        morphology = Morphology(())
+        self.assertEqual(morphology.inflect_many('plural', ['person', 'dog']), ['persons', 'dogs'])
+        morphology.set_irregulars([('plural', 'person', 'people')])
+        self.assertEqual(morphology.inflect_many('plural', ['person', 'dog']), ['people', 'dogs'])
+
+    def test_default_irregulars(self):
+        self.assertEqual(ENGLISH.inflect('third_person', 'have'), 'has')
+        self.assertEqual(ENGLISH.apply_rules('third_person', 'have'), 'haves')
+
+    def test_add_irregulars(self):
+        morphology = Morphology(())
+        morphology.add_irregulars([('plural', 'person', 'people'), ('past', 'go', 'went')])
+        self.assertEqual(morphology.inflect('plural', 'person'), 'people')
+        self.assertEqual(morphology.inflect('past', 'go'), 'went')
+        self.assertEqual(morphology.inflect('third_person', 'have'), 'haves')
+        self.assertEqual(morphology.irregulars('plural'), {'person': 'people'})
+
+    def test_add_irregulars_changes_generation_only_for_new_values(self):
+        morphology = Morphology(())
+        morphology.add_irregulars([('plural', 'person', 'people')])
+        self.assertEqual(morphology.generation, 1)
+        morphology.add_irregulars([('plural', 'person', 'people')])
+        self.assertEqual(morphology.generation, 1)
+
+    def test_set_irregulars_replaces_all_but_defaults(self):
+        morphology = Morphology([('third_person', 'have', 'has')])
+        morphology.set_irregulars([('plural', 'person', 'people'), ('past', 'go', 'went')])
+        morphology.set_irregulars([('past', 'go', 'gone')])
+        self.assertEqual(morphology.irregulars('plural'), {})
+        self.assertEqual(morphology.irregulars('past'), {'go': 'gone'})
+        self.assertEqual(morphology.irregulars('third_person'), {'have': 'has'})
+        self.assertEqual(morphology.generation, 2)
+
+    def test_add_irregulars_bad_form(self):
+        self.assertRaises(ValueError, Morphology, [('future', 'go', 'will go')])
+
+    def test_words_drop_cached_inflections_when_irregulars_change(self):
+        noun = Noun('octopus')
+        verb = Verb('swim')
+        self.assertEqual(noun.plural().value, 'octopuses')
+        self.assertEqual(verb.past_tense().value, 'swimmed')
+        try:
+            ENGLISH.set_irregulars([('plural', 'octopus', 'octopi'), ('past', 'swim', 'swam')])
+            self.assertEqual(noun.plural().value, 'octopi')
+            self.assertEqual(verb.past_tense().value, 'swam')
+            self.assertEqual(noun.plural().definite().value, 'the octopi')
+            self.assertEqual(noun.definite().plural().value, 'the octopi')
+            self.assertEqual(noun.capitalize().plural().value, 'Octopi')
+            self.assertEqual(noun.definite().capitalize().plural().value, 'The octopi')
+        finally:
+            ENGLISH.set_irregulars(())
+        self.assertEqual(noun.plural().value, 'octopuses')
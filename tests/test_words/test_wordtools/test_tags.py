@@ -2,7 +2,7 @@ import unittest
 
 import random
 
-from sentences.words.wordtools.tags import Tags
+from sentences.words.wordtools.tags import Tags, TagFlag
 from sentences.words.wordtools.wordtag import WordTag
 
 
@@ -113,3 +113,34 @@ class TestTags(unittest.TestCase):
 
         self.assertEqual(repr(Tags(tag_list)), expected)
         self.assertEqual(repr(Tags(reverse)), expected)
+
+    def test_hash(self):
+        tags = Tags([WordTag.THIRD_PERSON, WordTag.DEFINITE])
+        equal_tags = Tags([WordTag.DEFINITE, WordTag.THIRD_PERSON])
+        self.assertEqual(hash(tags), hash(equal_tags))
+        self.assertEqual(len({tags, equal_tags, Tags([WordTag.PAST])}), 2)
+
+    def test_has_all(self):
+        tags = Tags([WordTag.PAST, WordTag.DEFINITE])
+        self.assertTrue(tags.has_all())
+        self.assertTrue(tags.has_all(WordTag.PAST))
+        self.assertTrue(tags.has_all(WordTag.PAST, WordTag.DEFINITE))
+        self.assertFalse(tags.has_all(WordTag.PAST, WordTag.PLURAL))
+        self.assertFalse(Tags().has_all(WordTag.PLURAL))
+
+    def test_mask_and_flag(self):
+        tags = Tags([WordTag.PAST, WordTag.DEFINITE])
+        self.assertEqual(tags.flag, TagFlag.PAST | TagFlag.DEFINITE)
+        self.assertEqual(tags.mask, int(TagFlag.PAST | TagFlag.DEFINITE))
+        self.assertEqual(Tags().mask, 0)
+
+    def test_from_mask(self):
+        tags = Tags([WordTag.PAST, WordTag.DEFINITE])
+        from_mask = Tags.from_mask(tags.mask)
+        self.assertEqual(from_mask, tags)
+        self.assertIs(from_mask, Tags.from_mask(tags.mask))
+
+    def test_add_and_remove_share_instances(self):
+        tags = Tags([WordTag.PAST])
+        self.assertIs(tags.add(WordTag.DEFINITE), tags.add(WordTag.DEFINITE))
+        self.assertIs(tags.remove(WordTag.PAST), Tags([WordTag.DEFINITE]).remove(WordTag.DEFINITE))